@@ -2,8 +2,22 @@
 
 from __future__ import annotations
 
-import uuid
-from typing import Any
+import os
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def _new_audit_id() -> str:
+    """Return a random UUID4 string, formatted directly from the random bytes.
+
+    Same format and randomness as str(uuid.uuid4()), without building a UUID
+    object first, which made up most of the cost of creating a context.
+    """
+    h = os.urandom(16).hex()
+    # Version nibble 4, and variant bits 10 in the first nibble of the fourth group
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
 
 
 class Context:
@@ -13,6 +27,18 @@ class Context:
     information like model type, user role, purpose, trace IDs, and random seeds.
     """
 
+    # One context is built per request, so skip the per-instance __dict__
+    __slots__ = (
+        "audit_id",
+        "model",
+        "user_role",
+        "purpose",
+        "trace_id",
+        "seed",
+        "metadata",
+        "_scratch",
+    )
+
     def __init__(
         self,
         *,
@@ -35,16 +61,42 @@ class Context:
             seed: Random seed for reproducible results
             metadata: Additional arbitrary metadata
         """
-        self.audit_id = audit_id or str(uuid.uuid4())
+        self.audit_id = audit_id or _new_audit_id()
         self.model = model
         self.user_role = user_role
         self.purpose = purpose
         self.trace_id = trace_id
         self.seed = seed
         self.metadata = metadata or {}
+        # Derived forms of the text being validated, shared between guards
+        self._scratch: dict[str, tuple[str, Any]] = {}
+
+    def memoize(self, key: str, text: str, compute: Callable[[str], T]) -> T:
+        """Return compute(text), reusing the result of an earlier call for the same text.
+
+        Guards use this to share normalized forms of the input (lowercased,
+        leet-speak decoded, ...) instead of each rebuilding them. Results are
+        keyed on the text itself, so a guard that transforms the data makes
+        later guards compute fresh values.
+
+        Args:
+            key: Name of the derived form
+            text: Text the form is derived from
+            compute: Function that derives the form from the text
+
+        Returns:
+            The derived form of text
+        """
+        cached = self._scratch.get(key)
+        if cached is not None and (cached[0] is text or cached[0] == text):
+            return cached[1]  # type: ignore[no-any-return]
+        value = compute(text)
+        self._scratch[key] = (text, value)
+        return value
 
     def copy(self, **overrides: Any) -> Context:
         """Create a copy of this context with optional overrides."""
+        extra_metadata = overrides.get("metadata")
         return Context(
             audit_id=overrides.get("audit_id", self.audit_id),
             model=overrides.get("model", self.model),
@@ -52,7 +104,9 @@ class Context:
             purpose=overrides.get("purpose", self.purpose),
             trace_id=overrides.get("trace_id", self.trace_id),
             seed=overrides.get("seed", self.seed),
-            metadata={**self.metadata, **overrides.get("metadata", {})},
+            metadata=(
+                {**self.metadata, **extra_metadata} if extra_metadata else dict(self.metadata)
+            ),
         )
 
     def __repr__(self) -> str:
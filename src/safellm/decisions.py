@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import uuid
 from typing import Any, Literal, NamedTuple
 
+from .context import _new_audit_id
+
 
 class Decision(NamedTuple):
     """Result of a validation pipeline or guard check.
@@ -25,6 +26,9 @@ class Decision(NamedTuple):
     output: Any
     audit_id: str
 
+    # The factories below pass fields positionally: keyword arguments make
+    # NamedTuple construction markedly slower, and every guard check builds one
+
     @classmethod
     def allow(
         cls,
@@ -34,14 +38,7 @@ class Decision(NamedTuple):
         evidence: dict[str, Any] | None = None,
     ) -> Decision:
         """Create an allow decision."""
-        return cls(
-            allowed=True,
-            action="allow",
-            reasons=[],
-            evidence=evidence or {},
-            output=output,
-            audit_id=audit_id or str(uuid.uuid4()),
-        )
+        return cls(True, "allow", [], evidence or {}, output, audit_id or _new_audit_id())
 
     @classmethod
     def deny(
@@ -53,14 +50,7 @@ class Decision(NamedTuple):
         evidence: dict[str, Any] | None = None,
     ) -> Decision:
         """Create a deny decision."""
-        return cls(
-            allowed=False,
-            action="deny",
-            reasons=reasons,
-            evidence=evidence or {},
-            output=output,
-            audit_id=audit_id or str(uuid.uuid4()),
-        )
+        return cls(False, "deny", reasons, evidence or {}, output, audit_id or _new_audit_id())
 
     @classmethod
     def transform(
@@ -74,12 +64,7 @@ class Decision(NamedTuple):
     ) -> Decision:
         """Create a transform decision."""
         return cls(
-            allowed=True,
-            action="transform",
-            reasons=reasons,
-            evidence=evidence or {},
-            output=transformed,
-            audit_id=audit_id or str(uuid.uuid4()),
+            True, "transform", reasons, evidence or {}, transformed, audit_id or _new_audit_id()
         )
 
     @classmethod
@@ -92,14 +77,7 @@ class Decision(NamedTuple):
         evidence: dict[str, Any] | None = None,
     ) -> Decision:
         """Create a retry decision."""
-        return cls(
-            allowed=False,
-            action="retry",
-            reasons=reasons,
-            evidence=evidence or {},
-            output=output,
-            audit_id=audit_id or str(uuid.uuid4()),
-        )
+        return cls(False, "retry", reasons, evidence or {}, output, audit_id or _new_audit_id())
 
 
 class ValidationError(Exception):
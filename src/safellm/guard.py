@@ -2,13 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any, Protocol, runtime_checkable
 
 from .context import Context
 from .decisions import Decision
 
 
+class _SyncLoop:
+    """Event loop for one thread, closed when the thread exits."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+
+    def __del__(self) -> None:
+        # Thread-local values are dropped when their thread finishes
+        self.loop.close()
+
+
+# Event loop that sync checks of async guards run on, one per thread
+_sync_loops = threading.local()
+
+
+def _run_sync(coro: Any) -> Any:
+    """Run a coroutine to completion on this thread's reusable event loop.
+
+    asyncio.run() would build and tear down a new loop for every check.
+    """
+    holder = getattr(_sync_loops, "holder", None)
+    if holder is None or holder.loop.is_closed():
+        holder = _SyncLoop()
+        _sync_loops.holder = holder
+    return holder.loop.run_until_complete(coro)
+
+
 @runtime_checkable
 class Guard(Protocol):
     """Protocol for guards that can validate and transform data."""
@@ -47,6 +77,18 @@ class BaseGuard(ABC):
     Subclasses should implement either check() or both check() and acheck().
     """
 
+    # Set to True when check() never transforms data and keeps no state between
+    # calls, so the pipeline may run the guard alongside its read-only neighbours
+    readonly: bool = False
+
+    # Rough relative cost of one check; Pipeline(optimize=True) runs cheaper
+    # read-only guards first, so a cheap denial spares the expensive checks
+    cost: int = 100
+
+    # Set to True when the decision depends only on the data (not the context,
+    # the clock or earlier calls), so a pipeline may reuse it for repeated inputs
+    pure: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -66,6 +108,15 @@ class BaseGuard(ABC):
         """
         return self.check(data, ctx)
 
+    def check_many(self, data: Sequence[Any], ctxs: Sequence[Context]) -> list[Decision]:
+        """Check several inputs, each with its own context.
+
+        Default implementation checks each input in turn. Override this method
+        for guards that can share work across a batch; the decisions must match
+        what check() returns for each input.
+        """
+        return [self.check(item, ctx) for item, ctx in zip(data, ctxs)]
+
 
 class AsyncGuard(ABC):
     """Base class for guards that are primarily asynchronous.
@@ -74,6 +125,18 @@ class AsyncGuard(ABC):
     Use this for guards that need to make network calls or other async operations.
     """
 
+    # Read-only async guards next to each other are awaited concurrently by
+    # Pipeline.avalidate(), so their latencies overlap instead of adding up
+    readonly: bool = False
+
+    # Rough relative cost of one check; Pipeline(optimize=True) runs cheaper
+    # read-only guards first, so a cheap denial spares the expensive checks
+    cost: int = 100
+
+    # Set to True when the decision depends only on the data (not the context,
+    # the clock or earlier calls), so a pipeline may reuse it for repeated inputs
+    pure: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -86,20 +149,20 @@ class AsyncGuard(ABC):
         Note: This will raise an error if called from within an async context.
         Use acheck() directly in async code.
         """
-        import asyncio
-
         try:
             # Check if we're already in an event loop
             asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop running, we can run one
+            pass
+        else:
             raise RuntimeError(
                 f"Cannot call sync check() on async guard {self.name} "
                 "from within an async context. Use acheck() instead."
             )
-        except RuntimeError:
-            # No event loop running, we can create one
-            pass
 
-        return asyncio.run(self.acheck(data, ctx))
+        decision: Decision = _run_sync(self.acheck(data, ctx))
+        return decision
 
     @abstractmethod
     async def acheck(self, data: Any, ctx: Context) -> Decision:
@@ -1,21 +1,47 @@
 """SafeLLM Guards - Validation and sanitization components."""
 
-# Core guards
-# Extended guards
-from .business import BusinessRulesGuard
-from .format import FormatGuard
-from .html import HtmlSanitizerGuard, MarkdownSanitizerGuard
-from .injection import PromptInjectionGuard
-from .language import LanguageGuard
-from .length import LengthGuard
-from .pii import PiiRedactionGuard
-from .privacy import PrivacyComplianceGuard
-from .profanity import ProfanityGuard
-from .rate_limit import RateLimitGuard
-from .schema import JsonSchemaGuard, PydanticSchemaGuard, SchemaGuard
-from .secrets import SecretMaskGuard
-from .similarity import SimilarityGuard
-from .toxicity import ToxicityGuard
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .business import BusinessRulesGuard
+    from .format import FormatGuard
+    from .html import HtmlSanitizerGuard, MarkdownSanitizerGuard
+    from .injection import PromptInjectionGuard
+    from .language import LanguageGuard
+    from .length import LengthGuard
+    from .pii import PiiRedactionGuard
+    from .privacy import PrivacyComplianceGuard
+    from .profanity import ProfanityGuard
+    from .rate_limit import RateLimitGuard
+    from .schema import JsonSchemaGuard, PydanticSchemaGuard, SchemaGuard
+    from .secrets import SecretMaskGuard
+    from .similarity import SimilarityGuard
+    from .toxicity import ToxicityGuard
+
+# Guard modules are imported on first use (PEP 562), so importing one guard
+# does not load, and compile the patterns of, all the others
+_GUARD_MODULES = {
+    "BusinessRulesGuard": "business",
+    "FormatGuard": "format",
+    "HtmlSanitizerGuard": "html",
+    "MarkdownSanitizerGuard": "html",
+    "PromptInjectionGuard": "injection",
+    "LanguageGuard": "language",
+    "LengthGuard": "length",
+    "PiiRedactionGuard": "pii",
+    "PrivacyComplianceGuard": "privacy",
+    "ProfanityGuard": "profanity",
+    "RateLimitGuard": "rate_limit",
+    "JsonSchemaGuard": "schema",
+    "PydanticSchemaGuard": "schema",
+    "SchemaGuard": "schema",
+    "SecretMaskGuard": "secrets",
+    "SimilarityGuard": "similarity",
+    "ToxicityGuard": "toxicity",
+}
 
 __all__ = [
     # Core guards
@@ -38,3 +64,16 @@ __all__ = [
     "SimilarityGuard",
     "ToxicityGuard",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _GUARD_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
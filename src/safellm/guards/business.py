@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime
-from typing import Any, Literal
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any, ClassVar, Literal
 
 from ..context import Context
 from ..decisions import Decision
 from ..guard import BaseGuard
 
 
+def _intern(value: Any) -> Any:
+    """Intern a string from a rule definition, passing other values through."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class BusinessRulesGuard(BaseGuard):
     """Guard that enforces custom business rules and domain logic."""
 
@@ -19,6 +27,7 @@ class BusinessRulesGuard(BaseGuard):
         rules: list[dict[str, Any]],
         action: Literal["block", "flag", "transform"] = "block",
         require_all: bool = False,
+        fail_fast: bool = False,
     ) -> None:
         """Initialize the business rules guard.
 
@@ -26,10 +35,21 @@ class BusinessRulesGuard(BaseGuard):
             rules: List of business rule definitions
             action: What to do when rules are violated
             require_all: Whether all rules must pass (True) or any rule (False)
+            fail_fast: Whether to stop evaluating rules once the outcome is decided
+                (the first failure with require_all, otherwise the first pass).
+                Cheaper rule types are then evaluated first.
         """
         self.action = action
         self.require_all = require_all
+        self.fail_fast = fail_fast
         self.rules = self._parse_rules(rules)
+        # Order only matters when evaluation can stop early; the sort is stable,
+        # so rules of the same type keep their declared order
+        self._evaluation_order = (
+            sorted(self.rules, key=lambda rule: self._RULE_COST.get(rule["type"], 0))
+            if fail_fast
+            else self.rules
+        )
 
     @property
     def name(self) -> str:
@@ -41,7 +61,7 @@ class BusinessRulesGuard(BaseGuard):
         passed_rules = []
         failed_rules = []
 
-        for rule in self.rules:
+        for rule in self._evaluation_order:
             try:
                 result = self._evaluate_rule(rule, data, ctx)
                 rule_results.append(
@@ -72,6 +92,9 @@ class BusinessRulesGuard(BaseGuard):
                 )
                 failed_rules.append(rule["id"])
 
+            if self.fail_fast and (failed_rules if self.require_all else passed_rules):
+                break
+
         # Determine overall result
         if self.require_all:
             overall_passed = len(failed_rules) == 0
@@ -79,7 +102,7 @@ class BusinessRulesGuard(BaseGuard):
             overall_passed = len(passed_rules) > 0
 
         evidence = {
-            "rules_evaluated": len(self.rules),
+            "rules_evaluated": len(rule_results),
             "rules_passed": len(passed_rules),
             "rules_failed": len(failed_rules),
             "require_all_rules": self.require_all,
@@ -147,9 +170,11 @@ class BusinessRulesGuard(BaseGuard):
             if not isinstance(rule, dict):
                 raise ValueError(f"Rule {i} must be a dictionary")
 
-            rule_id = rule.get("id", f"rule_{i}")
-            rule_name = rule.get("name", rule_id)
-            rule_type = rule.get("type", "custom")
+            # Interned so the type's evaluator lookup and the ids repeated in every
+            # check's evidence share one string with the rest of the process
+            rule_id = _intern(rule.get("id", f"rule_{i}"))
+            rule_name = _intern(rule.get("name", rule_id))
+            rule_type = _intern(rule.get("type", "custom"))
 
             parsed_rule = {
                 "id": rule_id,
@@ -184,6 +209,7 @@ class BusinessRulesGuard(BaseGuard):
         config = rule["config"]
         if "min" not in config and "max" not in config:
             raise ValueError(f"Range rule '{rule['id']}' must specify min and/or max")
+        self._validate_bounds(rule, ("min", "max"))
 
     def _validate_pattern_rule(self, rule: dict[str, Any]) -> None:
         """Validate pattern rule configuration."""
@@ -192,7 +218,8 @@ class BusinessRulesGuard(BaseGuard):
             raise ValueError(f"Pattern rule '{rule['id']}' must specify pattern")
 
         try:
-            re.compile(config["pattern"])
+            # Kept on the rule so evaluation doesn't go through re's pattern cache
+            rule["compiled_pattern"] = re.compile(config["pattern"])
         except re.error as e:
             raise ValueError(f"Invalid regex pattern in rule '{rule['id']}': {e}") from e
 
@@ -203,6 +230,20 @@ class BusinessRulesGuard(BaseGuard):
             raise ValueError(
                 f"Length rule '{rule['id']}' must specify min_length and/or max_length"
             )
+        self._validate_bounds(rule, ("min_length", "max_length"))
+        # Containers can be measured by item count, skipping the str() of the whole thing
+        rule["count_items"] = bool(config.get("count_items", False))
+
+    def _validate_bounds(self, rule: dict[str, Any], keys: tuple[str, ...]) -> None:
+        """Validate numeric bounds up front so checks never fail on the config itself."""
+        for key in keys:
+            bound = rule["config"].get(key)
+            if bound is not None and (
+                isinstance(bound, bool) or not isinstance(bound, (int, float))
+            ):
+                raise ValueError(f"Rule '{rule['id']}' {key} must be a number, got {bound!r}")
+            # Hoisted onto the rule so evaluation reads it directly
+            rule[key] = bound
 
     def _validate_time_window_rule(self, rule: dict[str, Any]) -> None:
         """Validate time window rule configuration."""
@@ -212,6 +253,38 @@ class BusinessRulesGuard(BaseGuard):
                 f"Time window rule '{rule['id']}' must specify start_time and end_time"
             )
 
+        # Parse the window once rather than on every check
+        try:
+            rule["window"] = (
+                self._parse_time(config["start_time"]),
+                self._parse_time(config["end_time"]),
+            )
+        except ValueError as e:
+            raise ValueError(f"Invalid time in rule '{rule['id']}': {e}") from e
+
+        # Datetime bounds become POSIX timestamps (naive ones read as UTC), so a
+        # check compares them with time.time() instead of building a datetime
+        start_time, end_time = rule["window"]
+        if isinstance(start_time, datetime) and isinstance(end_time, datetime):
+            rule["window_timestamps"] = (self._timestamp(start_time), self._timestamp(end_time))
+            rule["window_isoformat"] = (start_time.isoformat(), end_time.isoformat())
+        else:
+            rule["window_timestamps"] = None
+
+    @staticmethod
+    def _parse_time(value: Any) -> Any:
+        """Parse an ISO 8601 time string, passing other values through."""
+        if isinstance(value, str):
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return value
+
+    @staticmethod
+    def _timestamp(value: datetime) -> float:
+        """Convert a datetime to a POSIX timestamp, taking naive values as UTC."""
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+
     def _validate_value_list_rule(self, rule: dict[str, Any]) -> None:
         """Validate value list rule configuration."""
         config = rule["config"]
@@ -220,6 +293,24 @@ class BusinessRulesGuard(BaseGuard):
                 f"Value list rule '{rule['id']}' must specify allowed_values or forbidden_values"
             )
 
+        # Case-fold the lists once and keep sets for constant-time membership
+        case_sensitive = config.get("case_sensitive", True)
+        for key in ("allowed_values", "forbidden_values"):
+            values = config.get(key)
+            if values and not case_sensitive:
+                values = [v.lower() for v in values]
+            rule[key] = values
+            rule[f"{key}_lookup"] = self._lookup(values) if values is not None else None
+
+    @staticmethod
+    def _lookup(values: list[Any]) -> frozenset[Any] | tuple[Any, ...]:
+        """Build the fastest membership container the values allow."""
+        try:
+            return frozenset(values)
+        except TypeError:
+            # Unhashable values can still be found by equality
+            return tuple(values)
+
     def _validate_custom_rule(self, rule: dict[str, Any], original_rule: dict[str, Any]) -> None:
         """Validate custom rule configuration."""
         if "validator" not in original_rule:
@@ -232,33 +323,20 @@ class BusinessRulesGuard(BaseGuard):
 
     def _evaluate_rule(self, rule: dict[str, Any], data: Any, ctx: Context) -> dict[str, Any]:
         """Evaluate a single business rule."""
-        rule_type = rule["type"]
-        config = rule["config"]
+        evaluate = self._EVALUATORS.get(rule["type"])
+        if evaluate is None:
+            return {"passed": False, "message": f"Unknown rule type: {rule['type']}"}
+        return evaluate(self, rule, data, ctx)
 
-        if rule_type == "range":
-            return self._evaluate_range_rule(config, data)
-        elif rule_type == "pattern":
-            return self._evaluate_pattern_rule(config, data)
-        elif rule_type == "length":
-            return self._evaluate_length_rule(config, data)
-        elif rule_type == "time_window":
-            return self._evaluate_time_window_rule(config, data, ctx)
-        elif rule_type == "value_list":
-            return self._evaluate_value_list_rule(config, data)
-        elif rule_type == "custom":
-            return self._evaluate_custom_rule(rule, data, ctx)
-        else:
-            return {"passed": False, "message": f"Unknown rule type: {rule_type}"}
-
-    def _evaluate_range_rule(self, config: dict[str, Any], data: Any) -> dict[str, Any]:
+    def _evaluate_range_rule(self, rule: dict[str, Any], data: Any, ctx: Context) -> dict[str, Any]:
         """Evaluate range rule."""
         try:
             value = float(data) if isinstance(data, (int, float, str)) else None
             if value is None:
                 return {"passed": False, "message": "Value cannot be converted to number"}
 
-            min_val = config.get("min")
-            max_val = config.get("max")
+            min_val = rule["min"]
+            max_val = rule["max"]
 
             if min_val is not None and value < min_val:
                 return {
@@ -286,14 +364,17 @@ class BusinessRulesGuard(BaseGuard):
         except (ValueError, TypeError) as e:
             return {"passed": False, "message": f"Range evaluation error: {e}"}
 
-    def _evaluate_pattern_rule(self, config: dict[str, Any], data: Any) -> dict[str, Any]:
+    def _evaluate_pattern_rule(
+        self, rule: dict[str, Any], data: Any, ctx: Context
+    ) -> dict[str, Any]:
         """Evaluate pattern rule."""
+        config = rule["config"]
         text = str(data)
         pattern = config["pattern"]
         match_required = config.get("match_required", True)
 
         try:
-            match = re.search(pattern, text)
+            match = rule["compiled_pattern"].search(text)
             if match_required:
                 passed = bool(match)
                 message = "Pattern matched" if passed else "Pattern not found"
@@ -325,13 +406,17 @@ class BusinessRulesGuard(BaseGuard):
         except re.error as e:
             return {"passed": False, "message": f"Pattern error: {e}"}
 
-    def _evaluate_length_rule(self, config: dict[str, Any], data: Any) -> dict[str, Any]:
+    def _evaluate_length_rule(
+        self, rule: dict[str, Any], data: Any, ctx: Context
+    ) -> dict[str, Any]:
         """Evaluate length rule."""
-        text = str(data)
-        length = len(text)
+        if rule["count_items"] and not isinstance(data, str) and hasattr(data, "__len__"):
+            length = len(data)
+        else:
+            length = len(str(data))
 
-        min_length = config.get("min_length")
-        max_length = config.get("max_length")
+        min_length = rule["min_length"]
+        max_length = rule["max_length"]
 
         if min_length is not None and length < min_length:
             return {
@@ -358,47 +443,44 @@ class BusinessRulesGuard(BaseGuard):
         }
 
     def _evaluate_time_window_rule(
-        self, config: dict[str, Any], data: Any, ctx: Context
+        self, rule: dict[str, Any], data: Any, ctx: Context
     ) -> dict[str, Any]:
         """Evaluate time window rule."""
-        current_time = datetime.utcnow()
-
-        start_time = config["start_time"]
-        end_time = config["end_time"]
-
-        # Parse time strings if needed
-        if isinstance(start_time, str):
-            start_time = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-        if isinstance(end_time, str):
-            end_time = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
-
-        in_window = start_time <= current_time <= end_time
+        timestamps = rule["window_timestamps"]
+        if timestamps is not None:
+            now = time.time()
+            in_window = timestamps[0] <= now <= timestamps[1]
+            current_time = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None)
+            start_iso, end_iso = rule["window_isoformat"]
+        else:
+            current_time = datetime.now(timezone.utc).replace(tzinfo=None)
+            start_time, end_time = rule["window"]
+            in_window = start_time <= current_time <= end_time
+            start_iso, end_iso = start_time.isoformat(), end_time.isoformat()
 
         return {
             "passed": in_window,
             "message": f"Current time {'is' if in_window else 'is not'} within allowed window",
             "details": {
                 "current_time": current_time.isoformat(),
-                "start_time": start_time.isoformat(),
-                "end_time": end_time.isoformat(),
+                "start_time": start_iso,
+                "end_time": end_iso,
                 "in_window": in_window,
             },
         }
 
-    def _evaluate_value_list_rule(self, config: dict[str, Any], data: Any) -> dict[str, Any]:
+    def _evaluate_value_list_rule(
+        self, rule: dict[str, Any], data: Any, ctx: Context
+    ) -> dict[str, Any]:
         """Evaluate value list rule."""
         value = str(data)
 
-        allowed_values = config.get("allowed_values")
-        forbidden_values = config.get("forbidden_values")
-        case_sensitive = config.get("case_sensitive", True)
+        allowed_values = rule["allowed_values"]
+        forbidden_values = rule["forbidden_values"]
+        case_sensitive = rule["config"].get("case_sensitive", True)
 
         if not case_sensitive:
             value = value.lower()
-            if allowed_values:
-                allowed_values = [v.lower() for v in allowed_values]
-            if forbidden_values:
-                forbidden_values = [v.lower() for v in forbidden_values]
 
         details = {
             "value": value,
@@ -406,11 +488,11 @@ class BusinessRulesGuard(BaseGuard):
         }
 
         if allowed_values is not None:
-            passed = value in allowed_values
+            passed = value in rule["allowed_values_lookup"]
             details["allowed_values"] = allowed_values
             message = f"Value {'is' if passed else 'is not'} in allowed list"
         elif forbidden_values is not None:
-            passed = value not in forbidden_values
+            passed = value not in rule["forbidden_values_lookup"]
             details["forbidden_values"] = forbidden_values
             message = f"Value {'is not' if passed else 'is'} in forbidden list"
         else:
@@ -472,3 +554,26 @@ class BusinessRulesGuard(BaseGuard):
                     transformed_data = transformation(transformed_data)
 
         return transformed_data
+
+    # Evaluator for each rule type, so a check looks its rules' evaluators up
+    # directly instead of comparing the type against every name in turn
+    _EVALUATORS: ClassVar[
+        dict[str, Callable[[BusinessRulesGuard, dict[str, Any], Any, Context], dict[str, Any]]]
+    ] = {
+        "range": _evaluate_range_rule,
+        "pattern": _evaluate_pattern_rule,
+        "length": _evaluate_length_rule,
+        "time_window": _evaluate_time_window_rule,
+        "value_list": _evaluate_value_list_rule,
+        "custom": _evaluate_custom_rule,
+    }
+
+    # Relative cost of evaluating each rule type, for ordering rules under fail_fast
+    _RULE_COST: ClassVar[dict[str, int]] = {
+        "length": 1,
+        "range": 1,
+        "value_list": 1,
+        "time_window": 1,
+        "pattern": 5,
+        "custom": 10,
+    }
@@ -4,16 +4,81 @@ from __future__ import annotations
 
 import json
 import re
+import sys
+from functools import lru_cache
 from typing import Any, Literal
 
 from ..context import Context
 from ..decisions import Decision
 from ..guard import BaseGuard
+from ..utils.json_utils import loads as json_loads
+
+# Validation patterns, compiled once per process
+# Digits are word characters, so the port starts at the first ":"; splitting the
+# host and port any other way backtracks quadratically on long rejected hosts
+_STRICT_URL_PATTERN = re.compile(
+    r"^https?://[-\w.]+(?::[:\d]*)?(?:/[\w/.]*(?:\?[\w&=%.]*)?(?:#[\w.]*)?)?$"
+)
+_BASIC_URL_PATTERN = re.compile(r"^https?://\S+$")
+_URL_PARTS_PATTERN = re.compile(r"^(https?)://([^:/]+)(?::(\d+))?(/.*)?$")
+_PHONE_SEPARATORS = re.compile(r"[\s\-\(\)\.]")
+_STRICT_PHONE_PATTERN = re.compile(r"^\+\d{1,3}\d{4,14}$")
+_BASIC_PHONE_PATTERN = re.compile(r"^(?:\+?1)?[2-9]\d{2}[2-9]\d{2}\d{4}$|^\+\d{1,3}\d{4,14}$")
+_CARD_SEPARATORS = re.compile(r"[\s\-]")
+_CARD_DIGITS_PATTERN = re.compile(r"^\d{13,19}$")
+_IPV4_PATTERN = re.compile(
+    r"^(?:(?:25[0-5]|2[0-4]\d|[01]?\d\d?)\.){3}(?:25[0-5]|2[0-4]\d|[01]?\d\d?)$"
+)
+_IPV6_PATTERN = re.compile(r"^(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}$|^::1$|^::$")
+_IPV6_COMPRESSED_PATTERN = re.compile(
+    r"^(?:[0-9a-fA-F]{1,4}:)*::(?:[0-9a-fA-F]{1,4}:)*[0-9a-fA-F]{1,4}$"
+)
+_UUID_PATTERN = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+
+# Character sets for the strict email check, passed to bytes.translate as the deletion table
+_EMAIL_LETTERS = b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_EMAIL_DOMAIN_CHARS = _EMAIL_LETTERS + b"0123456789.-"
+_EMAIL_LOCAL_CHARS = _EMAIL_DOMAIN_CHARS + b"_%+"
+
+
+def _is_strict_email(text: str) -> bool:
+    """Match ``[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}`` without backtracking."""
+    if not text.isascii():
+        return False
+    local, at, domain = text.encode("ascii").partition(b"@")
+    if not local or not at or local.translate(None, _EMAIL_LOCAL_CHARS):
+        return False
+    if domain.translate(None, _EMAIL_DOMAIN_CHARS):
+        return False
+    # The top-level domain must follow the last dot, so only that split needs checking
+    dot = domain.rfind(b".")
+    tld = domain[dot + 1 :]
+    return dot >= 1 and len(tld) >= 2 and not tld.translate(None, _EMAIL_LETTERS)
+
+
+def _is_basic_email(text: str) -> bool:
+    """Match ``[^@\\s]+@[^@\\s]+\\.[^@\\s]+`` without backtracking."""
+    # str.split() yields the string itself only when it has no whitespace
+    if text.split() != [text] or text.count("@") != 1:
+        return False
+    local, _, domain = text.partition("@")
+    return bool(local) and domain.find(".", 1, len(domain) - 1) != -1
+
+
+@lru_cache(maxsize=256)
+def _compile_custom(pattern: str) -> re.Pattern[str]:
+    """Compile a custom format pattern, shared by every guard using it."""
+    return re.compile(pattern)
 
 
 class FormatGuard(BaseGuard):
     """Guard that validates data against expected formats."""
 
+    cost = 5
+    pure = True
+
     def __init__(
         self,
         format_type: Literal[
@@ -34,7 +99,10 @@ class FormatGuard(BaseGuard):
             allow_null: Whether to allow null/empty values
         """
         self.format_type = format_type
+        # Built once: the name is read for every log record and error reason
+        self._name = sys.intern(f"format_{format_type}")
         self.action = action
+        self.readonly = action != "transform"
         self.strict = strict
         self.allow_null = allow_null
 
@@ -45,11 +113,11 @@ class FormatGuard(BaseGuard):
         self._compiled_pattern = None
 
         if format_type == "custom" and pattern:
-            self._compiled_pattern = re.compile(pattern)
+            self._compiled_pattern = _compile_custom(pattern)
 
     @property
     def name(self) -> str:
-        return f"format_{self.format_type}"
+        return self._name
 
     def check(self, data: Any, ctx: Context) -> Decision:
         """Validate data against the specified format."""
@@ -165,7 +233,7 @@ class FormatGuard(BaseGuard):
     def _validate_json(self, text: str) -> tuple[bool, dict[str, Any]]:
         """Validate JSON format."""
         try:
-            parsed = json.loads(text)
+            parsed = json_loads(text)
             return True, {"parsed_type": type(parsed).__name__}
         except json.JSONDecodeError as e:
             return False, {
@@ -177,14 +245,14 @@ class FormatGuard(BaseGuard):
 
     def _validate_email(self, text: str) -> tuple[bool, dict[str, Any]]:
         """Validate email format."""
+        # Like the anchored patterns these checks replace, tolerate one trailing newline
+        body = text[:-1] if text.endswith("\n") else text
         if self.strict:
             # RFC 5322 compliant pattern (simplified)
-            pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+            is_valid = _is_strict_email(body)
         else:
-            # Basic email pattern
-            pattern = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+            is_valid = _is_basic_email(body)
 
-        is_valid = bool(re.match(pattern, text))
         details: dict[str, Any] = {"strict_mode": self.strict}
 
         if is_valid:
@@ -204,17 +272,17 @@ class FormatGuard(BaseGuard):
         """Validate URL format."""
         if self.strict:
             # Strict URL pattern with protocol
-            pattern = r"^https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?$"
+            pattern = _STRICT_URL_PATTERN
         else:
             # Basic URL pattern
-            pattern = r"^https?://\S+$"
+            pattern = _BASIC_URL_PATTERN
 
-        is_valid = bool(re.match(pattern, text))
+        is_valid = bool(pattern.match(text))
         details: dict[str, Any] = {"strict_mode": self.strict}
 
         if is_valid:
             # Extract URL components
-            match = re.match(r"^(https?)://([^:/]+)(?::(\d+))?(/.*)?$", text)
+            match = _URL_PARTS_PATTERN.match(text)
             if match:
                 details.update(
                     {
@@ -232,16 +300,16 @@ class FormatGuard(BaseGuard):
     def _validate_phone(self, text: str) -> tuple[bool, dict[str, Any]]:
         """Validate phone number format."""
         # Remove common separators
-        cleaned = re.sub(r"[\s\-\(\)\.]", "", text)
+        cleaned = _PHONE_SEPARATORS.sub("", text)
 
         if self.strict:
             # E.164 format: +1234567890
-            pattern = r"^\+\d{1,3}\d{4,14}$"
+            pattern = _STRICT_PHONE_PATTERN
         else:
             # US format or international
-            pattern = r"^(?:\+?1)?[2-9]\d{2}[2-9]\d{2}\d{4}$|^\+\d{1,3}\d{4,14}$"
+            pattern = _BASIC_PHONE_PATTERN
 
-        is_valid = bool(re.match(pattern, cleaned))
+        is_valid = bool(pattern.match(cleaned))
         details: dict[str, Any] = {
             "strict_mode": self.strict,
             "cleaned_number": cleaned,
@@ -256,10 +324,10 @@ class FormatGuard(BaseGuard):
     def _validate_credit_card(self, text: str) -> tuple[bool, dict[str, Any]]:
         """Validate credit card format."""
         # Remove spaces and dashes
-        cleaned = re.sub(r"[\s\-]", "", text)
+        cleaned = _CARD_SEPARATORS.sub("", text)
 
         # Basic pattern: 13-19 digits
-        if not re.match(r"^\d{13,19}$", cleaned):
+        if not _CARD_DIGITS_PATTERN.match(cleaned):
             return False, {"error": "Invalid credit card format: must be 13-19 digits"}
 
         # Luhn algorithm check if strict
@@ -279,8 +347,7 @@ class FormatGuard(BaseGuard):
 
     def _validate_ipv4(self, text: str) -> tuple[bool, dict[str, Any]]:
         """Validate IPv4 address format."""
-        pattern = r"^(?:(?:25[0-5]|2[0-4]\d|[01]?\d\d?)\.){3}(?:25[0-5]|2[0-4]\d|[01]?\d\d?)$"
-        is_valid = bool(re.match(pattern, text))
+        is_valid = bool(_IPV4_PATTERN.match(text))
 
         details: dict[str, Any] = {}
         if is_valid:
@@ -295,10 +362,7 @@ class FormatGuard(BaseGuard):
     def _validate_ipv6(self, text: str) -> tuple[bool, dict[str, Any]]:
         """Validate IPv6 address format."""
         # Simplified IPv6 validation
-        pattern = r"^(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}$|^::1$|^::$"
-        compressed_pattern = r"^(?:[0-9a-fA-F]{1,4}:)*::(?:[0-9a-fA-F]{1,4}:)*[0-9a-fA-F]{1,4}$"
-
-        is_valid = bool(re.match(pattern, text) or re.match(compressed_pattern, text))
+        is_valid = bool(_IPV6_PATTERN.match(text) or _IPV6_COMPRESSED_PATTERN.match(text))
 
         details: dict[str, Any] = {}
         if is_valid:
@@ -310,8 +374,7 @@ class FormatGuard(BaseGuard):
 
     def _validate_uuid(self, text: str) -> tuple[bool, dict[str, Any]]:
         """Validate UUID format."""
-        pattern = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
-        is_valid = bool(re.match(pattern, text))
+        is_valid = bool(_UUID_PATTERN.match(text))
 
         details: dict[str, Any] = {}
         if is_valid:
@@ -350,14 +413,14 @@ class FormatGuard(BaseGuard):
                 return f"http://{text}"
         elif self.format_type == "phone":
             # Clean phone number format
-            cleaned = re.sub(r"[\s\-\(\)\.]", "", text)
+            cleaned = _PHONE_SEPARATORS.sub("", text)
             if cleaned.startswith("1") and len(cleaned) == 11:
                 return f"+{cleaned}"
             elif len(cleaned) == 10:
                 return f"+1{cleaned}"
         elif self.format_type == "credit_card":
             # Remove spaces and dashes
-            return re.sub(r"[\s\-]", "", text)
+            return _CARD_SEPARATORS.sub("", text)
 
         return text
 
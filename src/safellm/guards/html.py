@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+import threading
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from ..context import Context
@@ -12,10 +14,31 @@ from ..guard import BaseGuard
 if TYPE_CHECKING:
     pass
 
+# Patterns used on every check, compiled once
+_HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+_TAG_NAME_PATTERN = re.compile(r"</?([a-zA-Z][a-zA-Z0-9]*)[^>]*>")
+_SCRIPT_PATTERN = re.compile(r"<script[^>]*>.*?</script>", re.IGNORECASE | re.DOTALL)
+_STYLE_PATTERN = re.compile(r"<style[^>]*>.*?</style>", re.IGNORECASE | re.DOTALL)
+_COMMENT_PATTERN = re.compile(r"<!--.*?-->", re.DOTALL)
+_DANGEROUS_ATTR_PATTERNS = [
+    (attr, re.compile(f"{attr}[^>]*", re.IGNORECASE))
+    for attr in ["onclick", "onload", "onmouseover", "onerror", "javascript:"]
+]
+_JS_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\s*\(\s*javascript:[^)]+\)", re.IGNORECASE)
+_DATA_URL_PATTERN = re.compile(r"\[([^\]]+)\]\s*\(\s*data:[^)]+\)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _tag_pattern(tag: str) -> re.Pattern[str]:
+    """Compile the pattern removing one tag's opening and closing forms."""
+    return re.compile(f"</?{re.escape(tag)}[^>]*>", re.IGNORECASE)
+
 
 class HtmlSanitizerGuard(BaseGuard):
     """Guard that sanitizes HTML content to prevent XSS and other attacks."""
 
+    pure = True
+
     # Default safe tags and attributes
     DEFAULT_TAGS = [
         "p",
@@ -74,6 +97,7 @@ class HtmlSanitizerGuard(BaseGuard):
             self.allowed_attributes = allowed_attributes or {}
         else:
             raise ValueError(f"Unknown policy: {policy}")
+        self._allowed_tag_set = frozenset(self.allowed_tags)
 
         # Try to import bleach for advanced sanitization
         self._has_bleach = False
@@ -83,6 +107,8 @@ class HtmlSanitizerGuard(BaseGuard):
             self._has_bleach = True
         except ImportError:
             pass
+        # bleach cleaners are reusable but not thread-safe, so keep one per thread
+        self._local = threading.local()
 
     @property
     def name(self) -> str:
@@ -134,8 +160,7 @@ class HtmlSanitizerGuard(BaseGuard):
 
     def _contains_html(self, text: str) -> bool:
         """Check if text contains HTML tags."""
-        html_pattern = re.compile(r"<[^>]+>")
-        return bool(html_pattern.search(text))
+        return "<" in text and _HTML_TAG_PATTERN.search(text) is not None
 
     def _sanitize_html(self, text: str) -> tuple[str, list[dict[str, Any]]]:
         """Sanitize HTML content and return issues found."""
@@ -145,23 +170,30 @@ class HtmlSanitizerGuard(BaseGuard):
         else:
             return self._sanitize_basic(text)
 
+    def _get_cleaner(self) -> Any:
+        """Return this thread's bleach cleaner, building it on first use."""
+        cleaner = getattr(self._local, "cleaner", None)
+        if cleaner is None:
+            from bleach.sanitizer import Cleaner
+
+            cleaner = Cleaner(
+                tags=self.allowed_tags,
+                attributes=self.allowed_attributes,
+                strip=True,
+                strip_comments=self.strip_comments,
+            )
+            self._local.cleaner = cleaner
+        return cleaner
+
     def _sanitize_with_bleach(self, text: str) -> tuple[str, list[dict[str, Any]]]:
         """Sanitize using bleach library."""
-        import bleach
-
         issues = []
 
         # Track what was removed
         original_tags = self._extract_tags(text)
 
-        # Sanitize
-        sanitized = bleach.clean(
-            text,
-            tags=self.allowed_tags,
-            attributes=self.allowed_attributes,
-            strip=True,
-            strip_comments=self.strip_comments,
-        )
+        # Sanitize with a cleaner whose parser and filters are built only once
+        sanitized = self._get_cleaner().clean(text)
 
         # Check what was changed
         sanitized_tags = self._extract_tags(sanitized)
@@ -193,11 +225,8 @@ class HtmlSanitizerGuard(BaseGuard):
         result = text
 
         # Remove all script and style tags
-        script_pattern = re.compile(r"<script[^>]*>.*?</script>", re.IGNORECASE | re.DOTALL)
-        style_pattern = re.compile(r"<style[^>]*>.*?</style>", re.IGNORECASE | re.DOTALL)
-
-        scripts_found = script_pattern.findall(result)
-        styles_found = style_pattern.findall(result)
+        scripts_found = _SCRIPT_PATTERN.findall(result)
+        styles_found = _STYLE_PATTERN.findall(result)
 
         if scripts_found:
             issues.append(
@@ -206,7 +235,7 @@ class HtmlSanitizerGuard(BaseGuard):
                     "count": len(scripts_found),
                 }
             )
-            result = script_pattern.sub("", result)
+            result = _SCRIPT_PATTERN.sub("", result)
 
         if styles_found:
             issues.append(
@@ -215,12 +244,10 @@ class HtmlSanitizerGuard(BaseGuard):
                     "count": len(styles_found),
                 }
             )
-            result = style_pattern.sub("", result)
+            result = _STYLE_PATTERN.sub("", result)
 
         # Remove dangerous attributes
-        dangerous_attrs = ["onclick", "onload", "onmouseover", "onerror", "javascript:"]
-        for attr in dangerous_attrs:
-            pattern = re.compile(f"{attr}[^>]*", re.IGNORECASE)
+        for attr, pattern in _DANGEROUS_ATTR_PATTERNS:
             if pattern.search(result):
                 issues.append(
                     {
@@ -232,8 +259,7 @@ class HtmlSanitizerGuard(BaseGuard):
 
         # Remove comments if requested
         if self.strip_comments:
-            comment_pattern = re.compile(r"<!--.*?-->", re.DOTALL)
-            comments_found = comment_pattern.findall(result)
+            comments_found = _COMMENT_PATTERN.findall(result)
             if comments_found:
                 issues.append(
                     {
@@ -241,16 +267,16 @@ class HtmlSanitizerGuard(BaseGuard):
                         "count": len(comments_found),
                     }
                 )
-                result = comment_pattern.sub("", result)
+                result = _COMMENT_PATTERN.sub("", result)
 
         # If strict policy, remove all tags except allowed ones
         if self.policy == "strict":
             all_tags = self._extract_tags(result)
-            disallowed_tags = all_tags - set(self.allowed_tags)
+            disallowed_tags = all_tags - self._allowed_tag_set
 
             for tag in disallowed_tags:
                 # Remove opening and closing tags
-                tag_pattern = re.compile(f"</?{re.escape(tag)}[^>]*>", re.IGNORECASE)
+                tag_pattern = _tag_pattern(tag)
                 if tag_pattern.search(result):
                     issues.append(
                         {
@@ -264,13 +290,14 @@ class HtmlSanitizerGuard(BaseGuard):
 
     def _extract_tags(self, text: str) -> set[str]:
         """Extract all HTML tag names from text."""
-        tag_pattern = re.compile(r"</?([a-zA-Z][a-zA-Z0-9]*)[^>]*>")
-        return {match.group(1).lower() for match in tag_pattern.finditer(text)}
+        return {match.group(1).lower() for match in _TAG_NAME_PATTERN.finditer(text)}
 
 
 class MarkdownSanitizerGuard(BaseGuard):
     """Guard that sanitizes Markdown content."""
 
+    pure = True
+
     def __init__(
         self,
         allow_html: bool = False,
@@ -329,8 +356,7 @@ class MarkdownSanitizerGuard(BaseGuard):
 
         # Remove potentially dangerous Markdown patterns
         # 1. Javascript links
-        js_link_pattern = re.compile(r"\[([^\]]+)\]\s*\(\s*javascript:[^)]+\)", re.IGNORECASE)
-        js_links = js_link_pattern.findall(result)
+        js_links = _JS_LINK_PATTERN.findall(result)
         if js_links:
             issues.append(
                 {
@@ -338,11 +364,10 @@ class MarkdownSanitizerGuard(BaseGuard):
                     "count": len(js_links),
                 }
             )
-            result = js_link_pattern.sub(r"[\1](javascript-removed)", result)
+            result = _JS_LINK_PATTERN.sub(r"[\1](javascript-removed)", result)
 
         # 2. Data URLs that might contain scripts
-        data_url_pattern = re.compile(r"\[([^\]]+)\]\s*\(\s*data:[^)]+\)", re.IGNORECASE)
-        data_urls = data_url_pattern.findall(result)
+        data_urls = _DATA_URL_PATTERN.findall(result)
         if data_urls:
             issues.append(
                 {
@@ -350,12 +375,11 @@ class MarkdownSanitizerGuard(BaseGuard):
                     "count": len(data_urls),
                 }
             )
-            result = data_url_pattern.sub(r"[\1](data-url-removed)", result)
+            result = _DATA_URL_PATTERN.sub(r"[\1](data-url-removed)", result)
 
         # 3. If HTML is not allowed, remove HTML tags
         if not self.allow_html:
-            html_pattern = re.compile(r"<[^>]+>")
-            html_tags = html_pattern.findall(result)
+            html_tags = _HTML_TAG_PATTERN.findall(result)
             if html_tags:
                 issues.append(
                     {
@@ -363,6 +387,6 @@ class MarkdownSanitizerGuard(BaseGuard):
                         "count": len(html_tags),
                     }
                 )
-                result = html_pattern.sub("", result)
+                result = _HTML_TAG_PATTERN.sub("", result)
 
         return result, issues
@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
+from collections.abc import Sequence
 from typing import Any, Literal
 
 from ..context import Context
 from ..decisions import Decision
 from ..guard import BaseGuard
+from ..utils.patterns import combine_patterns, compile_pattern, re2_compatible
 
 
 class PromptInjectionGuard(BaseGuard):
     """Guard that detects prompt injection and jailbreak attempts."""
 
+    pure = True
+
     # Prompt injection patterns
     INJECTION_PATTERNS = {
         "role_manipulation": [
@@ -81,20 +86,46 @@ class PromptInjectionGuard(BaseGuard):
             custom_patterns: Additional custom injection patterns
         """
         self.action = action
+        self.readonly = action != "sanitize"
         self.confidence_threshold = confidence_threshold
         self.categories = set(categories) if categories else set(self.INJECTION_PATTERNS.keys())
+        self.custom_patterns = custom_patterns or {}
 
         # Combine default and custom patterns
         self.patterns = {}
+        all_patterns: list[re.Pattern[str]] = []
+        # Per category, one pass over its patterns decides whether any of them can match.
+        # Each prescreen is kept compiled for scanning and on re, since RE2 only
+        # matches like re on ASCII text
+        self._category_prescreens: dict[str, tuple[Any, re.Pattern[str]]] = {}
         for category in self.categories:
-            patterns = self.INJECTION_PATTERNS.get(category, [])
+            # The defaults have no anchors, so they can drop MULTILINE
+            category_patterns = [
+                re.compile(pattern, re.IGNORECASE)
+                for pattern in self.INJECTION_PATTERNS.get(category, [])
+            ]
             if custom_patterns and category in custom_patterns:
-                patterns.extend(custom_patterns[category])
+                category_patterns.extend(
+                    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+                    for pattern in custom_patterns[category]
+                )
 
-            # Compile regex patterns
-            self.patterns[category] = [
-                re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in patterns
-            ]
+            self.patterns[category] = category_patterns
+            all_patterns.extend(category_patterns)
+            if len(category_patterns) > 1:
+                combined = combine_patterns(category_patterns)
+                if combined is not None:
+                    self._category_prescreens[category] = (
+                        compile_pattern(combined.pattern, combined.flags),
+                        combined,
+                    )
+
+        # One pass over every pattern lets clean text skip the per-pattern scans
+        combined = combine_patterns(all_patterns)
+        self._prescreen = (
+            compile_pattern(combined.pattern, combined.flags) if combined is not None else None
+        )
+        self._exact_prescreen = combined
 
     @property
     def name(self) -> str:
@@ -156,14 +187,68 @@ class PromptInjectionGuard(BaseGuard):
             evidence=evidence,
         )
 
+    def check_many(self, data: Sequence[Any], ctxs: Sequence[Context]) -> list[Decision]:
+        """Check several inputs, prescreening the whole batch in one scan."""
+        # A clean input only escapes the action while its zero score is below the threshold.
+        # Custom patterns may be anchored or match a NUL, so the joined batch can't be
+        # scanned for them
+        if (
+            self._exact_prescreen is None
+            or self.confidence_threshold <= 0.0
+            or any(self.custom_patterns.get(category) for category in self.categories)
+        ):
+            return super().check_many(data, ctxs)
+
+        texts = [item if isinstance(item, str) else str(item) for item in data]
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        # None of the built-in patterns is anchored or can match a NUL, so a match
+        # never spans two inputs or depends on where an input ends
+        joined = "\0".join(texts)
+        prescreen: Any = self._prescreen if re2_compatible(joined) else self._exact_prescreen
+        flagged = {bisect_right(starts, match.start()) - 1 for match in prescreen.finditer(joined)}
+
+        decisions = []
+        for i, (item, ctx) in enumerate(zip(data, ctxs)):
+            if i in flagged:
+                decisions.append(self.check(item, ctx))
+            else:
+                decisions.append(
+                    Decision.allow(
+                        item,
+                        audit_id=ctx.audit_id,
+                        evidence={
+                            "detections": [],
+                            "confidence_score": 0.0,
+                            "confidence_threshold": self.confidence_threshold,
+                            "categories_checked": list(self.categories),
+                        },
+                    )
+                )
+        return decisions
+
     def _detect_injections(self, text: str) -> list[dict[str, Any]]:
         """Detect injection patterns in text."""
-        detections = []
+        detections: list[dict[str, Any]] = []
+
+        exact = not re2_compatible(text)
+        prescreen = self._exact_prescreen if exact else self._prescreen
+        if prescreen is not None and not prescreen.search(text):
+            return detections
 
         for category, patterns in self.patterns.items():
+            # A category whose prescreen misses skips its own per-pattern scans
+            if category in self._category_prescreens:
+                fast, exact_prescreen = self._category_prescreens[category]
+                if not (exact_prescreen if exact else fast).search(text):
+                    continue
+
             for pattern in patterns:
-                matches = list(pattern.finditer(text))
-                for match in matches:
+                for match in pattern.finditer(text):
                     detections.append(
                         {
                             "category": category,
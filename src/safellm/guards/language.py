@@ -13,6 +13,9 @@ from ..guard import BaseGuard
 class LanguageGuard(BaseGuard):
     """Guard that detects and filters content based on language."""
 
+    readonly = True
+    pure = True
+
     # Basic language detection patterns (in production, use proper language detection library)
     LANGUAGE_PATTERNS = {
         "english": re.compile(r"\b(?:the|and|or|but|in|on|at|to|for|of|with|by)\b", re.IGNORECASE),
@@ -29,6 +32,9 @@ class LanguageGuard(BaseGuard):
         "hindi": re.compile(r"[\u0900-\u097f]+"),
     }
 
+    # Languages detected by script alone, whose patterns can't match ASCII text
+    SCRIPT_LANGUAGES = frozenset({"russian", "chinese", "japanese", "korean", "arabic", "hindi"})
+
     def __init__(
         self,
         allowed_languages: list[str] | None = None,
@@ -111,8 +117,12 @@ class LanguageGuard(BaseGuard):
 
         results = []
         text_length = len(text)
+        # CPython records whether a string is ASCII, so this costs nothing
+        ascii_only = text.isascii()
 
         for language, pattern in self.LANGUAGE_PATTERNS.items():
+            if ascii_only and language in self.SCRIPT_LANGUAGES:
+                continue
             matches = pattern.findall(text)
             if matches:
                 # Calculate a simple confidence score
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
 from ..context import Context
@@ -12,6 +13,10 @@ from ..guard import BaseGuard
 class LengthGuard(BaseGuard):
     """Guard that validates the length of text content."""
 
+    readonly = True
+    cost = 1
+    pure = True
+
     def __init__(
         self,
         *,
@@ -84,3 +89,21 @@ class LengthGuard(BaseGuard):
             audit_id=ctx.audit_id,
             evidence=evidence,
         )
+
+    def check_many(self, data: Sequence[Any], ctxs: Sequence[Context]) -> list[Decision]:
+        """Check several inputs, allowing in-bounds ones without per-input rule checks."""
+        if self.max_tokens is not None:
+            return super().check_many(data, ctxs)
+
+        low = self.min_chars if self.min_chars is not None else 0
+        high = self.max_chars
+        decisions = []
+        for item, ctx in zip(data, ctxs):
+            char_count = len(item if isinstance(item, str) else str(item))
+            if char_count >= low and (high is None or char_count <= high):
+                decisions.append(
+                    Decision.allow(item, audit_id=ctx.audit_id, evidence={"char_count": char_count})
+                )
+            else:
+                decisions.append(self.check(item, ctx))
+        return decisions
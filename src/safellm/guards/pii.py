@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import bisect
+from collections.abc import Callable, Sequence
+from functools import lru_cache
 from re import Pattern
 from typing import Any, Literal
 
@@ -16,18 +19,61 @@ from ..utils.patterns import (
     IPV4_PATTERN,
     IPV6_PATTERN,
     PHONE_PATTERNS,
+    PII_PATTERNS,
     SSN_PATTERN,
+    build_pii_pattern,
+    compile_pattern,
     luhn_check,
     mask_credit_card,
     mask_email,
     mask_phone,
     mask_text,
+    re2_compatible,
 )
 
 
+def _scanner(pattern: Pattern[str]) -> Any:
+    """Recompile a shared pattern for scanning, with RE2 when it is available."""
+    return compile_pattern(pattern.pattern, pattern.flags)
+
+
+# Detectors per PII type: compiled for scanning, and the re originals for text
+# RE2 could misread
+_SCANNERS: dict[str, tuple[list[Any], list[Pattern[str]]]] = {
+    pii_type: ([_scanner(p) for p in patterns], patterns)
+    for pii_type, patterns in {
+        "email": [EMAIL_PATTERN],
+        "phone": PHONE_PATTERNS,
+        "credit_card": CREDIT_CARD_PATTERNS,
+        "ssn": [SSN_PATTERN],
+        "ip_address": [IPV4_PATTERN, IPV6_PATTERN],
+        "iban": [IBAN_PATTERN],
+        "address": ADDRESS_PATTERNS,
+    }.items()
+}
+
+
+def _scanners_for(pii_type: str, text: str) -> list[Any]:
+    """Return the detectors of a PII type to run on text."""
+    scanners, exact = _SCANNERS[pii_type]
+    return scanners if re2_compatible(text) else exact
+
+
+@lru_cache(maxsize=64)
+def _fused_prescreen(targets: frozenset[str]) -> tuple[Any, Pattern[str]]:
+    """Compile the fused pattern for a set of PII types, shared by every guard using it.
+
+    Returns the pattern compiled for scanning and the same pattern on re.
+    """
+    fused = build_pii_pattern(targets)
+    return compile_pattern(fused.pattern), fused
+
+
 class PiiRedactionGuard(BaseGuard):
     """Guard that detects and redacts personally identifiable information (PII)."""
 
+    pure = True
+
     # Default PII types to detect
     DEFAULT_TARGETS = [
         "email",
@@ -69,6 +115,17 @@ class PiiRedactionGuard(BaseGuard):
         if invalid_targets:
             raise ValueError(f"Unsupported PII targets: {invalid_targets}")
 
+        # One fused pass tells us whether any targeted built-in detector can match
+        fused_targets = frozenset(t for t in self.targets if t in PII_PATTERNS)
+        self._prescreen: Any = None
+        self._exact_prescreen: Pattern[str] | None = None
+        if fused_targets:
+            self._prescreen, self._exact_prescreen = _fused_prescreen(fused_targets)
+        # Whether a prescreen miss alone means the guard finds nothing
+        self._prescreen_decides = len(fused_targets) == len(set(self.targets)) and not (
+            self.custom_patterns
+        )
+
     @property
     def name(self) -> str:
         return "pii_redaction"
@@ -86,32 +143,39 @@ class PiiRedactionGuard(BaseGuard):
         redacted_text = text
         detections: list[dict[str, Any]] = []
 
+        # Nothing is redacted before the built-in passes run, so a miss here is final
+        prescreen = self._prescreen if re2_compatible(text) else self._exact_prescreen
+        if prescreen is not None and prescreen.search(text) is None:
+            targets: list[str] = [t for t in self.targets if t not in PII_PATTERNS]
+        else:
+            targets = self.targets
+
         # Check each PII type
-        if "email" in self.targets:
+        if "email" in targets:
             redacted_text, email_detections = self._process_emails(redacted_text)
             detections.extend(email_detections)
 
-        if "phone" in self.targets:
+        if "phone" in targets:
             redacted_text, phone_detections = self._process_phones(redacted_text)
             detections.extend(phone_detections)
 
-        if "credit_card" in self.targets:
+        if "credit_card" in targets:
             redacted_text, cc_detections = self._process_credit_cards(redacted_text)
             detections.extend(cc_detections)
 
-        if "ssn" in self.targets:
+        if "ssn" in targets:
             redacted_text, ssn_detections = self._process_ssns(redacted_text)
             detections.extend(ssn_detections)
 
-        if "ip_address" in self.targets:
+        if "ip_address" in targets:
             redacted_text, ip_detections = self._process_ip_addresses(redacted_text)
             detections.extend(ip_detections)
 
-        if "iban" in self.targets:
+        if "iban" in targets:
             redacted_text, iban_detections = self._process_ibans(redacted_text)
             detections.extend(iban_detections)
 
-        if "address" in self.targets:
+        if "address" in targets:
             redacted_text, addr_detections = self._process_addresses(redacted_text)
             detections.extend(addr_detections)
 
@@ -156,226 +220,164 @@ class PiiRedactionGuard(BaseGuard):
             evidence=evidence,
         )
 
-    def _process_emails(self, text: str) -> tuple[str, list[dict[str, Any]]]:
-        """Process email addresses."""
-        detections = []
-        result = text
-
-        for match in EMAIL_PATTERN.finditer(text):
-            email = match.group()
-            start, end = match.span()
-
-            detections.append(
-                {
-                    "type": "email",
-                    "original": email,
-                    "start": start,
-                    "end": end,
-                }
-            )
-
-            if self.mode == "mask":
-                replacement = mask_email(email)
-            else:  # remove
-                replacement = "[EMAIL_REMOVED]"
+    def check_many(self, data: Sequence[Any], ctxs: Sequence[Context]) -> list[Decision]:
+        """Check several inputs, prescreening the whole batch in one scan."""
+        prescreen = self._prescreen
+        if prescreen is None or not self._prescreen_decides:
+            return super().check_many(data, ctxs)
+
+        texts = [item if isinstance(item, str) else str(item) for item in data]
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        # No built-in detector matches a NUL, and NUL is not a word character, so
+        # matches and word boundaries in the joined text are those of each input
+        joined = "\0".join(texts)
+        if not re2_compatible(joined):
+            prescreen = self._exact_prescreen
+        flagged = {
+            bisect.bisect_right(starts, match.start()) - 1 for match in prescreen.finditer(joined)
+        }
 
-            result = result.replace(email, replacement, 1)
+        decisions = []
+        for i, (item, ctx) in enumerate(zip(data, ctxs)):
+            if i in flagged:
+                decisions.append(self.check(item, ctx))
+            else:
+                decisions.append(
+                    Decision.allow(
+                        item,
+                        audit_id=ctx.audit_id,
+                        evidence={"detections": [], "detection_count": 0, "pii_types": []},
+                    )
+                )
+        return decisions
 
-        return result, detections
+    def _process_emails(self, text: str) -> tuple[str, list[dict[str, Any]]]:
+        """Process email addresses."""
+        return self._redact_matches(
+            text, _scanners_for("email", text), "email", mask_email, "[EMAIL_REMOVED]"
+        )
 
     def _process_phones(self, text: str) -> tuple[str, list[dict[str, Any]]]:
         """Process phone numbers."""
-        detections = []
-        result = text
-
-        for pattern in PHONE_PATTERNS:
-            for match in pattern.finditer(text):
-                phone = match.group()
-                start, end = match.span()
-
-                detections.append(
-                    {
-                        "type": "phone",
-                        "original": phone,
-                        "start": start,
-                        "end": end,
-                    }
-                )
-
-                if self.mode == "mask":
-                    replacement = mask_phone(phone)
-                else:  # remove
-                    replacement = "[PHONE_REMOVED]"
-
-                result = result.replace(phone, replacement, 1)
-
-        return result, detections
+        return self._redact_matches(
+            text, _scanners_for("phone", text), "phone", mask_phone, "[PHONE_REMOVED]"
+        )
 
     def _process_credit_cards(self, text: str) -> tuple[str, list[dict[str, Any]]]:
         """Process credit card numbers with Luhn validation."""
-        detections = []
-        result = text
-
-        for pattern in CREDIT_CARD_PATTERNS:
-            for match in pattern.finditer(text):
-                card = match.group()
-                start, end = match.span()
-
-                # Validate with Luhn algorithm
-                if luhn_check(card):
-                    detections.append(
-                        {
-                            "type": "credit_card",
-                            "original": card,
-                            "start": start,
-                            "end": end,
-                        }
-                    )
-
-                    if self.mode == "mask":
-                        replacement = mask_credit_card(card)
-                    else:  # remove
-                        replacement = "[CARD_REMOVED]"
-
-                    result = result.replace(card, replacement, 1)
-
-        return result, detections
+        return self._redact_matches(
+            text,
+            _scanners_for("credit_card", text),
+            "credit_card",
+            mask_credit_card,
+            "[CARD_REMOVED]",
+            validate=luhn_check,
+        )
 
     def _process_ssns(self, text: str) -> tuple[str, list[dict[str, Any]]]:
         """Process Social Security Numbers."""
-        detections = []
-        result = text
-
-        for match in SSN_PATTERN.finditer(text):
-            ssn = match.group()
-            start, end = match.span()
-
-            detections.append(
-                {
-                    "type": "ssn",
-                    "original": ssn,
-                    "start": start,
-                    "end": end,
-                }
-            )
-
-            if self.mode == "mask":
-                replacement = mask_text(ssn, 3, 2)
-            else:  # remove
-                replacement = "[SSN_REMOVED]"
-
-            result = result.replace(ssn, replacement, 1)
-
-        return result, detections
+        return self._redact_matches(
+            text,
+            _scanners_for("ssn", text),
+            "ssn",
+            lambda ssn: mask_text(ssn, 3, 2),
+            "[SSN_REMOVED]",
+        )
 
     def _process_ip_addresses(self, text: str) -> tuple[str, list[dict[str, Any]]]:
         """Process IP addresses."""
-        detections = []
-        result = text
-
-        for pattern in [IPV4_PATTERN, IPV6_PATTERN]:
-            for match in pattern.finditer(text):
-                ip = match.group()
-                start, end = match.span()
-
-                detections.append(
-                    {
-                        "type": "ip_address",
-                        "original": ip,
-                        "start": start,
-                        "end": end,
-                    }
-                )
-
-                if self.mode == "mask":
-                    replacement = mask_text(ip, 2, 2)
-                else:  # remove
-                    replacement = "[IP_REMOVED]"
-
-                result = result.replace(ip, replacement, 1)
-
-        return result, detections
+        return self._redact_matches(
+            text,
+            _scanners_for("ip_address", text),
+            "ip_address",
+            lambda ip: mask_text(ip, 2, 2),
+            "[IP_REMOVED]",
+        )
 
     def _process_ibans(self, text: str) -> tuple[str, list[dict[str, Any]]]:
         """Process IBAN numbers."""
-        detections = []
-        result = text
-
-        for match in IBAN_PATTERN.finditer(text):
-            iban = match.group()
-            start, end = match.span()
-
-            detections.append(
-                {
-                    "type": "iban",
-                    "original": iban,
-                    "start": start,
-                    "end": end,
-                }
-            )
+        return self._redact_matches(
+            text,
+            _scanners_for("iban", text),
+            "iban",
+            lambda iban: mask_text(iban, 4, 4),
+            "[IBAN_REMOVED]",
+        )
 
-            if self.mode == "mask":
-                replacement = mask_text(iban, 4, 4)
-            else:  # remove
-                replacement = "[IBAN_REMOVED]"
+    def _process_addresses(self, text: str) -> tuple[str, list[dict[str, Any]]]:
+        """Process addresses."""
+        return self._redact_matches(
+            text,
+            _scanners_for("address", text),
+            "address",
+            lambda address: mask_text(address, 2, 2),
+            "[ADDRESS_REMOVED]",
+        )
 
-            result = result.replace(iban, replacement, 1)
+    def _process_pattern(
+        self, text: str, pattern: Pattern[str], pii_type: str
+    ) -> tuple[str, list[dict[str, Any]]]:
+        """Process a custom regex pattern."""
+        return self._redact_matches(
+            text, [pattern], pii_type, mask_text, f"[{pii_type.upper()}_REMOVED]"
+        )
 
-        return result, detections
+    def _redact_matches(
+        self,
+        text: str,
+        scanners: list[Any],
+        pii_type: str,
+        mask: Callable[[str], str],
+        removed: str,
+        validate: Callable[[str], bool] | None = None,
+    ) -> tuple[str, list[dict[str, Any]]]:
+        """Detect one PII type and redact every match in a single pass.
 
-    def _process_addresses(self, text: str) -> tuple[str, list[dict[str, Any]]]:
-        """Process addresses."""
+        Every match is reported, but where matches of different patterns
+        overlap only the one found first is redacted.
+        """
         detections = []
-        result = text
+        # Redacted spans as (start, end, replacement), kept sorted by start
+        spans: list[tuple[int, int, str]] = []
 
-        for pattern in ADDRESS_PATTERNS:
+        for pattern in scanners:
             for match in pattern.finditer(text):
-                address = match.group()
+                matched_text = match.group()
+                if validate is not None and not validate(matched_text):
+                    continue
                 start, end = match.span()
 
                 detections.append(
                     {
-                        "type": "address",
-                        "original": address,
+                        "type": pii_type,
+                        "original": matched_text,
                         "start": start,
                         "end": end,
                     }
                 )
 
-                if self.mode == "mask":
-                    replacement = mask_text(address, 2, 2)
-                else:  # remove
-                    replacement = "[ADDRESS_REMOVED]"
-
-                result = result.replace(address, replacement, 1)
-
-        return result, detections
-
-    def _process_pattern(
-        self, text: str, pattern: Pattern[str], pii_type: str
-    ) -> tuple[str, list[dict[str, Any]]]:
-        """Process a custom regex pattern."""
-        detections = []
-        result = text
-
-        for match in pattern.finditer(text):
-            matched_text = match.group()
-            start, end = match.span()
-
-            detections.append(
-                {
-                    "type": pii_type,
-                    "original": matched_text,
-                    "start": start,
-                    "end": end,
-                }
-            )
-
-            if self.mode == "mask":
-                replacement = mask_text(matched_text)
-            else:  # remove
-                replacement = f"[{pii_type.upper()}_REMOVED]"
-
-            result = result.replace(matched_text, replacement, 1)
-
-        return result, detections
+                index = bisect.bisect(spans, (start,))
+                if (index and spans[index - 1][1] > start) or (
+                    index < len(spans) and spans[index][0] < end
+                ):
+                    continue
+                replacement = mask(matched_text) if self.mode == "mask" else removed
+                spans.insert(index, (start, end, replacement))
+
+        if not spans:
+            return text, detections
+
+        # Stitch the untouched runs and replacements together once
+        parts = []
+        position = 0
+        for start, end, replacement in spans:
+            parts.append(text[position:start])
+            parts.append(replacement)
+            position = end
+        parts.append(text[position:])
+        return "".join(parts), detections
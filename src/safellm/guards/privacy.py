@@ -8,11 +8,14 @@ from typing import Any, Literal
 from ..context import Context
 from ..decisions import Decision
 from ..guard import BaseGuard
+from ..utils.patterns import combine_patterns, compile_pattern, re2_compatible
 
 
 class PrivacyComplianceGuard(BaseGuard):
     """Guard that ensures content complies with privacy regulations like GDPR, CCPA."""
 
+    pure = True
+
     # Privacy-sensitive data patterns
     PRIVACY_PATTERNS = {
         "medical": [
@@ -86,6 +89,7 @@ class PrivacyComplianceGuard(BaseGuard):
         """
         self.frameworks = frameworks or ["gdpr", "ccpa"]
         self.action = action
+        self.readonly = action != "anonymize"
         self.sensitivity_threshold = sensitivity_threshold
 
         # Determine which categories to check
@@ -107,6 +111,18 @@ class PrivacyComplianceGuard(BaseGuard):
                     for pattern in self.PRIVACY_PATTERNS[category]
                 ]
 
+        # One pass over every pattern lets clean text skip the per-pattern scans.
+        # The RE2 form is only trusted on text where it matches exactly like re.
+        self._prescreen = combine_patterns(
+            [pattern for patterns in self.compiled_patterns.values() for pattern in patterns]
+        )
+        fast = (
+            compile_pattern(self._prescreen.pattern, self._prescreen.flags)
+            if self._prescreen is not None
+            else None
+        )
+        self._ascii_prescreen = None if isinstance(fast, re.Pattern) else fast
+
     @property
     def name(self) -> str:
         return "privacy_compliance"
@@ -172,7 +188,15 @@ class PrivacyComplianceGuard(BaseGuard):
 
     def _detect_privacy_issues(self, text: str) -> list[dict[str, Any]]:
         """Detect privacy-sensitive content in text."""
-        detections = []
+        detections: list[dict[str, Any]] = []
+
+        if self._prescreen is not None:
+            if self._ascii_prescreen is not None and re2_compatible(text):
+                prescreen = self._ascii_prescreen
+            else:
+                prescreen = self._prescreen
+            if not prescreen.search(text):
+                return detections
 
         for category, patterns in self.compiled_patterns.items():
             for pattern in patterns:
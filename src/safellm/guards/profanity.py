@@ -2,17 +2,33 @@
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import Any, Literal
 
 from ..context import Context
 from ..decisions import Decision
 from ..guard import BaseGuard
-from ..utils.patterns import contains_profanity, normalize_leet_speak
+from ..utils.patterns import (
+    NON_ALNUM_PATTERN,
+    PROFANITY_PATTERN,
+    compile_pattern,
+    contains_profanity,
+    normalize_leet_speak,
+)
+
+
+@lru_cache(maxsize=64)
+def _word_scanner(words: frozenset[str]) -> Any:
+    """Compile a word list into one alternation, shared by every guard using the same words."""
+    return compile_pattern("|".join(re.escape(w) for w in sorted(words, key=len, reverse=True)))
 
 
 class ProfanityGuard(BaseGuard):
     """Guard that detects and handles profanity in text content."""
 
+    pure = True
+
     def __init__(
         self,
         action: Literal["block", "mask", "flag"] = "mask",
@@ -27,8 +43,13 @@ class ProfanityGuard(BaseGuard):
             allowlist: Words to exclude from profanity detection
         """
         self.action = action
+        self.readonly = action != "mask"
         self.custom_words = custom_words or set()
         self.allowlist = allowlist or set()
+        # Any custom word in one alternation, for the whole-text prescreen
+        self._custom_pattern = (
+            _word_scanner(frozenset(self.custom_words)) if self.custom_words else None
+        )
 
     @property
     def name(self) -> str:
@@ -44,7 +65,7 @@ class ProfanityGuard(BaseGuard):
             original_data = data
 
         # Check for profanity
-        detections = self._detect_profanity(text)
+        detections = self._detect_profanity(text, ctx)
 
         evidence = {
             "detections": detections,
@@ -84,25 +105,37 @@ class ProfanityGuard(BaseGuard):
             evidence=evidence,
         )
 
-    def _detect_profanity(self, text: str) -> list[dict[str, Any]]:
+    def _detect_profanity(self, text: str, ctx: Context | None = None) -> list[dict[str, Any]]:
         """Detect profanity in text and return detection details."""
-        detections = []
+        detections: list[dict[str, Any]] = []
+
+        # Normalize text for detection (normalize_leet_speak also lowercases)
+        if ctx is not None:
+            normalized = ctx.memoize("leet_speak", text, normalize_leet_speak)
+        else:
+            normalized = normalize_leet_speak(text)
+
+        # A word can only be flagged if its letters appear in the text with
+        # punctuation and spaces removed, so one scan of that rules out clean text
+        if not self._may_contain_profanity(normalized):
+            return detections
 
-        # Normalize text for detection
-        normalized = normalize_leet_speak(text.lower())
         words = normalized.split()
+        original_words = text.split()
+        # Words are searched for in order, so repeats resolve to their own position
+        search_from = 0
 
         # Check each word
         for i, word in enumerate(words):
             # Remove punctuation for checking
-            clean_word = "".join(c for c in word if c.isalnum())
+            clean_word = NON_ALNUM_PATTERN.sub("", word)
 
             if self._is_profanity(clean_word):
                 # Find the original word position in the text
-                original_words = text.split()
                 if i < len(original_words):
                     original_word = original_words[i]
-                    start_pos = text.find(original_word)
+                    start_pos = text.find(original_word, search_from)
+                    search_from = start_pos + len(original_word)
 
                     detections.append(
                         {
@@ -116,8 +149,16 @@ class ProfanityGuard(BaseGuard):
 
         return detections
 
+    def _may_contain_profanity(self, normalized: str) -> bool:
+        """Check whether any word of the normalized text could be profanity."""
+        if contains_profanity(normalized):
+            return True
+        if self._custom_pattern is None:
+            return False
+        return self._custom_pattern.search(NON_ALNUM_PATTERN.sub("", normalized)) is not None
+
     def _is_profanity(self, word: str) -> bool:
-        """Check if a word is considered profanity."""
+        """Check if a normalized, alphanumeric-only word is considered profanity."""
         # Check allowlist first
         if word in self.allowlist:
             return False
@@ -126,8 +167,8 @@ class ProfanityGuard(BaseGuard):
         if word in self.custom_words:
             return True
 
-        # Use the basic profanity detection from patterns
-        return contains_profanity(word)
+        # The word is already normalized, so contains_profanity's own pass is skipped
+        return PROFANITY_PATTERN.search(word) is not None
 
     def _mask_profanity(self, text: str, detections: list[dict[str, Any]]) -> str:
         """Mask profanity in text based on detections."""
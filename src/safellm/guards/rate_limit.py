@@ -2,24 +2,54 @@
 
 from __future__ import annotations
 
+import random
+import threading
 import time
+from array import array
 from collections import defaultdict, deque
-from typing import Any
+from typing import Any, Literal
 
 from ..context import Context
 from ..decisions import Decision
 from ..guard import BaseGuard
 
 
+class _Bucket:
+    """Token bucket state for one rate limiting key."""
+
+    __slots__ = ("tokens", "last")
+
+    def __init__(self, tokens: float, last: float) -> None:
+        self.tokens = tokens
+        self.last = last
+
+
+class _Ring:
+    """Per-interval request counts covering one window, for one rate limiting key."""
+
+    __slots__ = ("epoch", "counts")
+
+    def __init__(self, epoch: int, size: int) -> None:
+        # Index of the most recent interval; its count is at counts[epoch % size]
+        self.epoch = epoch
+        self.counts = array("I", bytes(4 * size))
+
+
 class RateLimitGuard(BaseGuard):
     """Guard that enforces rate limiting based on user or session."""
 
+    _MIN_SWEEP_AT = 1024
+    # Intervals per window for the "bucketed_window" algorithm
+    _WINDOW_BUCKETS = 10
+
     def __init__(
         self,
         max_requests: int = 100,
         window_seconds: int = 3600,  # 1 hour
         key_extractor: str = "user_role",  # Context field to use as key
         block_duration: int = 300,  # 5 minutes block
+        algorithm: Literal["sliding_window", "token_bucket", "bucketed_window"] = "sliding_window",
+        sample_rate: int = 1,
     ) -> None:
         """Initialize the rate limiting guard.
 
@@ -28,15 +58,39 @@ class RateLimitGuard(BaseGuard):
             window_seconds: Time window in seconds
             key_extractor: Context field to use for rate limiting key
             block_duration: How long to block after limit exceeded (seconds)
+            algorithm: "sliding_window" counts the requests made in the last
+                window_seconds; "token_bucket" keeps a single refilling counter
+                per key, which allows max_requests per window on average with
+                bursts of up to max_requests; "bucketed_window" counts requests
+                per tenth of a window, so it needs constant memory per key and
+                the window it applies is exact to within a tenth
+            sample_rate: Account for only one in this many requests, at random,
+                each counting as sample_rate requests. The others are allowed
+                without taking the lock. The limit then holds on average
+                (within a few percent once a window sees a few hundred
+                requests), so use it only for high-volume keys.
         """
+        if sample_rate < 1:
+            raise ValueError("sample_rate must be at least 1")
+        if sample_rate > 1 and sample_rate > max_requests:
+            # A single sampled request would already use up the whole window
+            raise ValueError("sample_rate must not exceed max_requests")
+
         self.max_requests = max_requests
         self.window_seconds = window_seconds
         self.key_extractor = key_extractor
         self.block_duration = block_duration
+        self.algorithm = algorithm
+        self.sample_rate = sample_rate
 
         # In-memory storage (in production, use Redis or similar)
         self.request_history: dict[str, deque[float]] = defaultdict(deque)
         self.blocked_until: dict[str, float] = {}
+        self._buckets: dict[str, _Bucket] = {}
+        self._rings: dict[str, _Ring] = {}
+        self._lock = threading.Lock()
+        # Tracked key count that triggers the next sweep of idle keys
+        self._sweep_at = self._MIN_SWEEP_AT
 
     @property
     def name(self) -> str:
@@ -46,19 +100,47 @@ class RateLimitGuard(BaseGuard):
         """Check if the request is within rate limits."""
         # Extract rate limiting key from context
         rate_key = self._get_rate_key(ctx)
-        current_time = time.time()
+
+        sample_rate = self.sample_rate
+        if (
+            sample_rate > 1
+            and rate_key not in self.blocked_until
+            and random.random() * sample_rate >= 1  # nosec B311
+        ):
+            # Unsampled request: allowed without touching the shared counters
+            return Decision.allow(
+                data,
+                audit_id=ctx.audit_id,
+                evidence={"rate_key": rate_key, "sampled": False},
+            )
+
+        with self._lock:
+            return self._check_key(data, ctx, rate_key, sample_rate)
+
+    def _check_key(self, data: Any, ctx: Context, rate_key: str, weight: int = 1) -> Decision:
+        """Apply the rate limit to one key (called with the lock held).
+
+        The request counts as weight requests.
+        """
+        # Request ages and block deadlines use the monotonic clock, so clock
+        # adjustments neither reset windows nor shorten or extend blocks
+        now = time.monotonic()
+        if self._tracked_keys() >= self._sweep_at:
+            self._evict_idle(now)
 
         # Check if currently blocked
         if rate_key in self.blocked_until:
-            if current_time < self.blocked_until[rate_key]:
-                remaining_time = int(self.blocked_until[rate_key] - current_time)
+            if now < self.blocked_until[rate_key]:
+                remaining = self.blocked_until[rate_key] - now
+                remaining_time = int(remaining)
                 return Decision.deny(
                     data,
                     [f"Rate limit exceeded. Blocked for {remaining_time} more seconds"],
                     audit_id=ctx.audit_id,
                     evidence={
                         "rate_key": rate_key,
-                        "blocked_until": self.blocked_until[rate_key],
+                        # Reported as a wall-clock timestamp
+                        "blocked_until": time.time() + remaining,
                         "remaining_seconds": remaining_time,
                     },
                 )
@@ -66,17 +148,22 @@ class RateLimitGuard(BaseGuard):
                 # Block period expired
                 del self.blocked_until[rate_key]
 
+        if self.algorithm == "token_bucket":
+            return self._check_bucket(data, ctx, rate_key, now, weight)
+        if self.algorithm == "bucketed_window":
+            return self._check_ring(data, ctx, rate_key, now, weight)
+
         # Clean old requests outside the window
         request_times = self.request_history[rate_key]
-        cutoff_time = current_time - self.window_seconds
+        cutoff_time = now - self.window_seconds
 
         while request_times and request_times[0] < cutoff_time:
             request_times.popleft()
 
         # Check if adding this request would exceed the limit
-        if len(request_times) >= self.max_requests:
+        if len(request_times) + weight > self.max_requests:
             # Block the user
-            self.blocked_until[rate_key] = current_time + self.block_duration
+            self.blocked_until[rate_key] = now + self.block_duration
             return Decision.deny(
                 data,
                 [f"Rate limit of {self.max_requests} requests per {self.window_seconds}s exceeded"],
@@ -91,7 +178,10 @@ class RateLimitGuard(BaseGuard):
             )
 
         # Add current request to history
-        request_times.append(current_time)
+        if weight == 1:
+            request_times.append(now)
+        else:
+            request_times.extend([now] * weight)
 
         return Decision.allow(
             data,
@@ -103,6 +193,128 @@ class RateLimitGuard(BaseGuard):
             },
         )
 
+    def _check_bucket(
+        self,
+        data: Any,
+        ctx: Context,
+        rate_key: str,
+        now: float,
+        weight: int = 1,
+    ) -> Decision:
+        """Spend a token from the key's bucket, refilled for the time since its last use."""
+        bucket = self._buckets.get(rate_key)
+        if bucket is None:
+            bucket = self._buckets[rate_key] = _Bucket(float(self.max_requests), now)
+        else:
+            rate = self.max_requests / self.window_seconds
+            bucket.tokens = min(self.max_requests, bucket.tokens + (now - bucket.last) * rate)
+            bucket.last = now
+
+        if bucket.tokens < weight:
+            # Block the user
+            self.blocked_until[rate_key] = now + self.block_duration
+            return Decision.deny(
+                data,
+                [f"Rate limit of {self.max_requests} requests per {self.window_seconds}s exceeded"],
+                audit_id=ctx.audit_id,
+                evidence={
+                    "rate_key": rate_key,
+                    "max_requests": self.max_requests,
+                    "window_seconds": self.window_seconds,
+                    "blocked_for_seconds": self.block_duration,
+                },
+            )
+
+        bucket.tokens -= weight
+        return Decision.allow(
+            data,
+            audit_id=ctx.audit_id,
+            evidence={
+                "rate_key": rate_key,
+                "requests_remaining": int(bucket.tokens),
+            },
+        )
+
+    def _check_ring(
+        self,
+        data: Any,
+        ctx: Context,
+        rate_key: str,
+        now: float,
+        weight: int = 1,
+    ) -> Decision:
+        """Count the request in the key's current interval, after clearing expired ones."""
+        size = self._WINDOW_BUCKETS
+        epoch = int(now * size // self.window_seconds)
+        ring = self._rings.get(rate_key)
+        if ring is None:
+            ring = self._rings[rate_key] = _Ring(epoch, size)
+        elif epoch != ring.epoch:
+            counts = ring.counts
+            if epoch - ring.epoch >= size:
+                counts[:] = array("I", bytes(4 * size))
+            else:
+                for expired in range(ring.epoch + 1, epoch + 1):
+                    counts[expired % size] = 0
+            ring.epoch = epoch
+
+        requests_in_window = sum(ring.counts)
+        if requests_in_window + weight > self.max_requests:
+            # Block the user
+            self.blocked_until[rate_key] = now + self.block_duration
+            return Decision.deny(
+                data,
+                [f"Rate limit of {self.max_requests} requests per {self.window_seconds}s exceeded"],
+                audit_id=ctx.audit_id,
+                evidence={
+                    "rate_key": rate_key,
+                    "requests_in_window": requests_in_window,
+                    "max_requests": self.max_requests,
+                    "window_seconds": self.window_seconds,
+                    "blocked_for_seconds": self.block_duration,
+                },
+            )
+
+        ring.counts[epoch % size] += weight
+        requests_in_window += weight
+        return Decision.allow(
+            data,
+            audit_id=ctx.audit_id,
+            evidence={
+                "rate_key": rate_key,
+                "requests_in_window": requests_in_window,
+                "requests_remaining": self.max_requests - requests_in_window,
+            },
+        )
+
+    def _tracked_keys(self) -> int:
+        """Number of keys holding rate limiting state."""
+        return len(self.request_history) + len(self._buckets) + len(self._rings)
+
+    def _evict_idle(self, now: float) -> None:
+        """Forget keys whose state is back to what a new key would start with.
+
+        Runs whenever the number of tracked keys doubles, so its cost is spread
+        over the requests that added them.
+        """
+        cutoff_time = now - self.window_seconds
+        for key in [
+            k for k, times in self.request_history.items() if not times or times[-1] < cutoff_time
+        ]:
+            del self.request_history[key]
+
+        for key in [k for k, b in self._buckets.items() if now - b.last >= self.window_seconds]:
+            del self._buckets[key]
+
+        epoch = int(now * self._WINDOW_BUCKETS // self.window_seconds)
+        for key in [k for k, r in self._rings.items() if epoch - r.epoch >= self._WINDOW_BUCKETS]:
+            del self._rings[key]
+
+        for key in [k for k, until in self.blocked_until.items() if until <= now]:
+            del self.blocked_until[key]
+
+        self._sweep_at = max(self._MIN_SWEEP_AT, 2 * self._tracked_keys())
+
     def _get_rate_key(self, ctx: Context) -> str:
         """Extract rate limiting key from context."""
         if self.key_extractor == "audit_id":
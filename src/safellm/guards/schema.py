@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from ..context import Context
 from ..decisions import Decision
 from ..guard import BaseGuard
+from ..utils.json_utils import loads as json_loads
 
 if TYPE_CHECKING:
     try:
@@ -16,6 +19,97 @@ if TYPE_CHECKING:
         pass
 
 
+@lru_cache(maxsize=128)
+def _compile_json_schema(schema_json: str) -> Any:
+    """Build a validator for a canonical schema, shared by every guard using it."""
+    import jsonschema
+
+    return jsonschema.Draft7Validator(json.loads(schema_json))
+
+
+# Draft 7 type checks, narrowed where needed so they never accept a value the
+# validator would reject (floats such as 1.0 are left to the validator)
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+    "number": lambda value: type(value) in (int, float),
+    "integer": lambda value: type(value) is int,
+}
+
+# Keywords the specialized check understands; the rest only annotate
+_FAST_KEYWORDS = frozenset({"type", "properties", "required", "items", "additionalProperties"})
+_ANNOTATION_KEYWORDS = frozenset({"$schema", "$comment", "title", "description", "default"})
+
+
+def _fast_check(schema: Any) -> Callable[[Any], bool] | None:
+    """Specialize a simple schema into a predicate that is True only for valid data.
+
+    Covers schemas built from type, properties, required, items and boolean
+    additionalProperties. A False result means "not sure", so callers run the
+    full validator for it, which also reports the errors.
+
+    Returns:
+        The predicate, or None if the schema uses anything else
+    """
+    if schema is True:
+        return lambda value: True
+    if not isinstance(schema, dict) or not set(schema) <= _FAST_KEYWORDS | _ANNOTATION_KEYWORDS:
+        return None
+
+    checks: list[Callable[[Any], bool]] = []
+
+    if "type" in schema:
+        type_check = _TYPE_CHECKS.get(schema["type"]) if isinstance(schema["type"], str) else None
+        if type_check is None:
+            return None
+        checks.append(type_check)
+
+    properties = schema.get("properties", {})
+    required = schema.get("required", [])
+    additional = schema.get("additionalProperties", True)
+    if (
+        not isinstance(properties, dict)
+        or not isinstance(required, list)
+        or not all(isinstance(key, str) for key in required)
+        or not isinstance(additional, bool)
+    ):
+        return None
+    property_checks = []
+    for key, subschema in properties.items():
+        property_check = _fast_check(subschema)
+        if property_check is None:
+            return None
+        property_checks.append((key, property_check))
+    if property_checks or required or not additional:
+        allowed = frozenset(properties)
+
+        def check_object(value: Any) -> bool:
+            if not isinstance(value, dict):
+                return True
+            return (
+                all(key in value for key in required)
+                and all(check(value[key]) for key, check in property_checks if key in value)
+                and (additional or value.keys() <= allowed)
+            )
+
+        checks.append(check_object)
+
+    if "items" in schema:
+        item_check = _fast_check(schema["items"])
+        if item_check is None:
+            return None
+        checks.append(
+            lambda value: not isinstance(value, list) or all(item_check(item) for item in value)
+        )
+
+    if len(checks) == 1:
+        return checks[0]
+    return lambda value: all(check(value) for check in checks)
+
+
 class SchemaGuard(BaseGuard):
     """Base class for schema validation guards."""
 
@@ -33,6 +127,9 @@ class SchemaGuard(BaseGuard):
 class JsonSchemaGuard(SchemaGuard):
     """Guard that validates data against a JSON Schema."""
 
+    readonly = True
+    cost = 10
+
     def __init__(self, schema: dict[str, Any]) -> None:
         """Initialize with a JSON Schema dictionary."""
         try:
@@ -44,7 +141,16 @@ class JsonSchemaGuard(SchemaGuard):
             ) from e
 
         self.schema = schema
-        self.validator = jsonschema.Draft7Validator(schema)
+        try:
+            # Compact separators keep the cache key, and hashing it, as small as possible
+            schema_json = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            # Schemas holding non-JSON values have no canonical key to cache under
+            self.validator = jsonschema.Draft7Validator(schema)
+        else:
+            self.validator = _compile_json_schema(schema_json)
+        # Data passing this needs no full validation walk
+        self._fast_check = _fast_check(schema)
 
     @property
     def name(self) -> str:
@@ -55,7 +161,7 @@ class JsonSchemaGuard(SchemaGuard):
         # If data is a string, try to parse it as JSON
         if isinstance(data, str):
             try:
-                parsed_data = json.loads(data)
+                parsed_data = json_loads(data)
             except json.JSONDecodeError as e:
                 return Decision.deny(
                     data,
@@ -66,8 +172,10 @@ class JsonSchemaGuard(SchemaGuard):
         else:
             parsed_data = data
 
-        # Validate against schema
-        errors = list(self.validator.iter_errors(parsed_data))
+        if self._fast_check is not None and self._fast_check(parsed_data):
+            errors = []
+        else:
+            errors = list(self.validator.iter_errors(parsed_data))
 
         if errors:
             reasons = []
@@ -109,10 +217,13 @@ class JsonSchemaGuard(SchemaGuard):
 class PydanticSchemaGuard(SchemaGuard):
     """Guard that validates data against a Pydantic model."""
 
+    readonly = True
+    cost = 10
+
     def __init__(self, model: type[BaseModel]) -> None:
         """Initialize with a Pydantic model class."""
         try:
-            from pydantic import BaseModel
+            from pydantic import BaseModel, TypeAdapter, ValidationError
         except ImportError as e:
             raise ImportError(
                 "pydantic is required for PydanticSchemaGuard. "
@@ -123,6 +234,9 @@ class PydanticSchemaGuard(SchemaGuard):
             raise TypeError("model must be a Pydantic BaseModel subclass")
 
         self.model = model
+        # Build the core validator once instead of resolving it on every check
+        self._adapter = TypeAdapter(model)
+        self._validation_error = ValidationError
 
     @property
     def name(self) -> str:
@@ -130,18 +244,10 @@ class PydanticSchemaGuard(SchemaGuard):
 
     def check(self, data: Any, ctx: Context) -> Decision:
         """Validate data against the Pydantic model."""
-        try:
-            from pydantic import ValidationError
-        except ImportError as e:
-            raise ImportError(
-                "pydantic is required for PydanticSchemaGuard. "
-                "Install with: pip install safellm[full]"
-            ) from e
-
         # If data is a string, try to parse it as JSON
         if isinstance(data, str):
             try:
-                parsed_data = json.loads(data)
+                parsed_data = json_loads(data)
             except json.JSONDecodeError as e:
                 return Decision.deny(
                     data,
@@ -154,7 +260,7 @@ class PydanticSchemaGuard(SchemaGuard):
 
         # Validate with Pydantic
         try:
-            validated_instance = self.model.model_validate(parsed_data)
+            validated_instance = self._adapter.validate_python(parsed_data)
 
             # Return the validated data as a dict
             return Decision.allow(
@@ -166,7 +272,7 @@ class PydanticSchemaGuard(SchemaGuard):
                 },
             )
 
-        except ValidationError as e:
+        except self._validation_error as e:
             reasons = []
             error_details = []
 
@@ -9,16 +9,21 @@ from ..context import Context
 from ..decisions import Decision
 from ..guard import BaseGuard
 from ..utils.patterns import (
-    API_KEY_PATTERNS,
     JWT_PATTERN,
     PASSWORD_INDICATORS,
+    VENDOR_API_KEY_PATTERNS,
+    combine_patterns,
+    compile_pattern,
     mask_api_key,
+    re2_compatible,
 )
 
 
 class SecretMaskGuard(BaseGuard):
     """Guard that detects and masks secrets like API keys, tokens, and passwords."""
 
+    pure = True
+
     SECRET_PATTERNS = {
         "api_key": [
             r"(?i)(?:api[_-]?key|apikey)\s*[=:]\s*['\"]?([a-zA-Z0-9_-]{20,})['\"]?",
@@ -72,14 +77,40 @@ class SecretMaskGuard(BaseGuard):
         self.vendors = vendors
         self.custom_patterns = custom_patterns or []
 
-        # Map vendor names to their patterns
-        self.vendor_patterns = {
-            "stripe": [p for p in API_KEY_PATTERNS if "sk_" in p.pattern],
-            "aws": [p for p in API_KEY_PATTERNS if "AKIA" in p.pattern],
-            "google": [p for p in API_KEY_PATTERNS if "AIza" in p.pattern],
-            "github": [p for p in API_KEY_PATTERNS if "gh" in p.pattern],
-            "slack": [p for p in API_KEY_PATTERNS if "xox" in p.pattern],
-        }
+        # Map vendor names to their (vendor, pattern) pairs
+        self.vendor_patterns: dict[str, list[tuple[str, re.Pattern[str]]]] = {}
+        for vendor, pattern in VENDOR_API_KEY_PATTERNS:
+            self.vendor_patterns.setdefault(vendor, []).append((vendor, pattern))
+
+        if vendors is None:
+            self._api_key_patterns = VENDOR_API_KEY_PATTERNS
+        else:
+            self._api_key_patterns = [
+                pair for vendor in vendors for pair in self.vendor_patterns.get(vendor, [])
+            ]
+
+        # Everything the built-in passes look for in one alternation, so text
+        # without any secret skips them after a single scan
+        combined = combine_patterns(
+            [pattern for _, pattern in self._api_key_patterns] + [JWT_PATTERN, PASSWORD_INDICATORS]
+        )
+        self._prescreen = (
+            compile_pattern(combined.pattern, combined.flags) if combined is not None else None
+        )
+        # RE2 only matches like re on ASCII text, so the re alternation is kept too
+        self._exact_prescreen = combined
+        # The API key patterns alone, so text holding only a password or JWT skips
+        # the per-vendor scans too
+        combined = combine_patterns([pattern for _, pattern in self._api_key_patterns])
+        self._api_key_prescreen = (
+            compile_pattern(combined.pattern, combined.flags) if combined is not None else None
+        )
+        self._exact_api_key_prescreen = combined
+
+        # Custom patterns are compiled once here rather than on every check
+        self._custom_compiled = [
+            (name, re.compile(pattern)) for name, pattern in self.custom_patterns
+        ]
 
     @property
     def name(self) -> str:
@@ -97,23 +128,22 @@ class SecretMaskGuard(BaseGuard):
         masked_text = text
         detections: list[dict[str, Any]] = []
 
-        # Detect API keys
-        masked_text, api_detections = self._process_api_keys(masked_text)
-        detections.extend(api_detections)
+        prescreen = self._prescreen if re2_compatible(text) else self._exact_prescreen
+        if prescreen is None or prescreen.search(text):
+            # Detect API keys
+            masked_text, api_detections = self._process_api_keys(masked_text)
+            detections.extend(api_detections)
 
-        # Detect JWT tokens
-        masked_text, jwt_detections = self._process_jwt_tokens(masked_text)
-        detections.extend(jwt_detections)
+            # Detect JWT tokens
+            masked_text, jwt_detections = self._process_jwt_tokens(masked_text)
+            detections.extend(jwt_detections)
 
-        # Detect password patterns
-        masked_text, pwd_detections = self._process_passwords(masked_text)
-        detections.extend(pwd_detections)
+            # Detect password patterns
+            masked_text, pwd_detections = self._process_passwords(masked_text)
+            detections.extend(pwd_detections)
 
         # Process custom patterns
-        for name, pattern_str in self.custom_patterns:
-            import re
-
-            pattern = re.compile(pattern_str)
+        for name, pattern in self._custom_compiled:
             masked_text, custom_detections = self._process_pattern(masked_text, pattern, name)
             detections.extend(custom_detections)
 
@@ -143,28 +173,20 @@ class SecretMaskGuard(BaseGuard):
 
     def _process_api_keys(self, text: str) -> tuple[str, list[dict[str, Any]]]:
         """Process API keys."""
-        detections = []
+        detections: list[dict[str, Any]] = []
         result = text
 
-        patterns_to_check = []
-
-        if self.vendors is None:
-            # Check all patterns
-            patterns_to_check = API_KEY_PATTERNS
-        else:
-            # Check only specified vendors
-            for vendor in self.vendors:
-                if vendor in self.vendor_patterns:
-                    patterns_to_check.extend(self.vendor_patterns[vendor])
+        prescreen = (
+            self._api_key_prescreen if re2_compatible(text) else self._exact_api_key_prescreen
+        )
+        if prescreen is not None and not prescreen.search(text):
+            return result, detections
 
-        for pattern in patterns_to_check:
+        for vendor_type, pattern in self._api_key_patterns:
             for match in pattern.finditer(text):
                 key = match.group()
                 start, end = match.span()
 
-                # Determine the vendor type
-                vendor_type = self._identify_vendor(key)
-
                 detections.append(
                     {
                         "type": "api_key",
@@ -212,7 +234,10 @@ class SecretMaskGuard(BaseGuard):
     def _process_passwords(self, text: str) -> tuple[str, list[dict[str, Any]]]:
         """Process password indicators."""
         detections = []
-        result = text
+        # Masked text is assembled from the spans between matches in one join, rather
+        # than searching the whole text again for each match
+        pieces = []
+        last_end = 0
 
         for match in PASSWORD_INDICATORS.finditer(text):
             full_match = match.group()
@@ -233,9 +258,14 @@ class SecretMaskGuard(BaseGuard):
                 # Replace the password part with asterisks
                 masked_password = "*" * min(8, len(password))
                 masked_full = full_match.replace(password, masked_password)
-                result = result.replace(full_match, masked_full, 1)
+                pieces.append(text[last_end:start])
+                pieces.append(masked_full)
+                last_end = end
 
-        return result, detections
+        if not pieces:
+            return text, detections
+        pieces.append(text[last_end:])
+        return "".join(pieces), detections
 
     def _process_pattern(
         self, text: str, pattern: re.Pattern[str], secret_type: str
@@ -261,18 +291,3 @@ class SecretMaskGuard(BaseGuard):
             result = result.replace(secret, masked_secret, 1)
 
         return result, detections
-
-    def _identify_vendor(self, key: str) -> str:
-        """Identify the vendor type based on the key format."""
-        if key.startswith("sk_live_") or key.startswith("sk_test_"):
-            return "stripe"
-        elif key.startswith("AKIA"):
-            return "aws"
-        elif key.startswith("AIza"):
-            return "google"
-        elif key.startswith("ghp_") or key.startswith("gho_"):
-            return "github"
-        elif key.startswith("xoxb-") or key.startswith("xoxp-"):
-            return "slack"
-        else:
-            return "unknown"
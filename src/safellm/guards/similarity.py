@@ -3,13 +3,46 @@
 from __future__ import annotations
 
 import hashlib
+import math
 import re
+import time
+from collections import OrderedDict
 from typing import Any, Literal
 
 from ..context import Context
 from ..decisions import Decision
 from ..guard import BaseGuard
 
+# Everything but lowercase ASCII letters, digits and whitespace
+_NON_ALNUM_SPACE_PATTERN = re.compile(r"[^a-z0-9\s]")
+
+# Common stop words, ignored for better similarity detection
+_STOP_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+    }
+)
+
 
 class SimilarityGuard(BaseGuard):
     """Guard that detects duplicate or highly similar content."""
@@ -35,8 +68,20 @@ class SimilarityGuard(BaseGuard):
         self.use_fuzzy_matching = use_fuzzy_matching
 
         # In-memory storage (in production, use Redis or database)
-        self.content_hashes: dict[str, dict[str, Any]] = {}
+        # Ordered by recency of use so eviction drops the least recently matched entry
+        self.content_hashes: OrderedDict[str, dict[str, Any]] = OrderedDict()
         self.normalized_content: dict[str, str] = {}
+        # Token sets of stored content, built once so lookups don't re-split history
+        self._token_sets: dict[str, frozenset[str]] = {}
+        # Inverted index from token to the normalized hashes containing it
+        self._postings: dict[str, set[str]] = {}
+        # Insertion sequence of each normalized hash, for deterministic ties
+        self._store_order: dict[str, int] = {}
+        self._next_order = 0
+        # Latest content hash stored under each normalized hash
+        self._content_by_normalized: dict[str, str] = {}
+        # Number of content_hashes entries sharing each normalized hash
+        self._normalized_refs: dict[str, int] = {}
 
     @property
     def name(self) -> str:
@@ -54,7 +99,11 @@ class SimilarityGuard(BaseGuard):
 
         # Normalize text for fuzzy matching
         normalized = self._normalize_text(text)
-        normalized_hash = hashlib.md5(normalized.encode(), usedforsecurity=False).hexdigest()
+        if normalized == text:
+            # Already-normalized input: skip encoding and hashing it a second time
+            normalized_hash = content_hash
+        else:
+            normalized_hash = hashlib.md5(normalized.encode(), usedforsecurity=False).hexdigest()
 
         evidence = {
             "content_hash": content_hash,
@@ -66,6 +115,7 @@ class SimilarityGuard(BaseGuard):
         # Check for exact duplicates
         if content_hash in self.content_hashes:
             previous_info = self.content_hashes[content_hash]
+            self.content_hashes.move_to_end(content_hash)
             reasons = ["Exact duplicate content detected"]
             evidence.update(
                 {
@@ -79,7 +129,7 @@ class SimilarityGuard(BaseGuard):
 
         # Check for fuzzy duplicates if enabled
         if self.use_fuzzy_matching:
-            similar_content = self._find_similar_content(normalized)
+            similar_content = self._find_similar_content(normalized, self.similarity_threshold)
             if similar_content:
                 similarity_score = similar_content["similarity"]
                 if similarity_score >= self.similarity_threshold:
@@ -109,69 +159,79 @@ class SimilarityGuard(BaseGuard):
 
     def _normalize_text(self, text: str) -> str:
         """Normalize text for fuzzy comparison."""
-        # Convert to lowercase
-        normalized = text.lower()
-
-        # Remove extra whitespace
-        normalized = re.sub(r"\s+", " ", normalized)
-
-        # Remove punctuation (keep alphanumeric and spaces)
-        normalized = re.sub(r"[^a-z0-9\s]", "", normalized)
+        # Lowercase and drop punctuation (keep alphanumeric and whitespace); split()
+        # then collapses the whitespace
+        words = _NON_ALNUM_SPACE_PATTERN.sub("", text.lower()).split()
 
         # Remove common stop words for better similarity detection
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "being",
-        }
-        words = normalized.split()
-        filtered_words = [word for word in words if word not in stop_words]
+        return " ".join([word for word in words if word not in _STOP_WORDS])
 
-        return " ".join(filtered_words).strip()
+    def _find_similar_content(
+        self, normalized_text: str, min_similarity: float = 0.0
+    ) -> dict[str, Any] | None:
+        """Find similar content using simple text similarity.
 
-    def _find_similar_content(self, normalized_text: str) -> dict[str, Any] | None:
-        """Find similar content using simple text similarity."""
+        With ``min_similarity`` set, the best match is only exact when it reaches that
+        similarity; below it, any weaker entry (or None) may be returned.
+        """
         if not normalized_text:
             return None
 
-        best_similarity = 0.0
-        best_match = None
+        query_tokens = frozenset(normalized_text.split())
+        query_size = len(query_tokens)
+
+        overlaps: dict[str, int] = {}
+        if min_similarity > 0:
+            # Prefix filter: an entry with similarity >= t shares at least ceil(t * q)
+            # of the query's q tokens, so it must contain one of any q - ceil(t * q) + 1
+            # of them. Taking the rarest tokens keeps the candidate set small.
+            required = math.ceil(min_similarity * query_size - 1e-9)
+            prefix = sorted(query_tokens, key=lambda t: len(self._postings.get(t, ())))
+            candidates: set[str] = set()
+            for token in prefix[: query_size - required + 1]:
+                candidates.update(self._postings.get(token, ()))
+            for stored_hash in candidates:
+                overlaps[stored_hash] = len(query_tokens & self._token_sets[stored_hash])
+        else:
+            # Only entries sharing a token can have a non-zero similarity, and the
+            # postings give the size of each one's overlap with the query directly
+            for token in query_tokens:
+                for stored_hash in self._postings.get(token, ()):
+                    overlaps[stored_hash] = overlaps.get(stored_hash, 0) + 1
 
-        for stored_hash, stored_text in self.normalized_content.items():
-            similarity = self._calculate_similarity(normalized_text, stored_text)
-            if similarity > best_similarity:
+        best_similarity = 0.0
+        best_hash = None
+        best_order = 0
+        for stored_hash, intersection in overlaps.items():
+            union = query_size + len(self._token_sets[stored_hash]) - intersection
+            similarity = intersection / union
+            # Ties go to the entry stored first
+            order = self._store_order[stored_hash]
+            if similarity > best_similarity or (
+                similarity == best_similarity and order < best_order
+            ):
                 best_similarity = similarity
-                best_match = {
-                    "hash": stored_hash,
-                    "similarity": similarity,
-                    "text": stored_text,
-                }
+                best_hash = stored_hash
+                best_order = order
+
+        if best_hash is None:
+            return None
 
-                # Also get metadata if available
-                for _content_hash, info in self.content_hashes.items():
-                    if info.get("normalized_hash") == stored_hash:
-                        best_match.update(info)
-                        break
+        best_match: dict[str, Any] = {
+            "hash": best_hash,
+            "similarity": best_similarity,
+            "text": self.normalized_content[best_hash],
+        }
+
+        # Also get metadata if available
+        content_hash = self._content_by_normalized.get(best_hash)
+        if content_hash is not None and content_hash in self.content_hashes:
+            best_match.update(self.content_hashes[content_hash])
+            # Keep the entry we just matched against resident
+            if best_similarity >= self.similarity_threshold:
+                self.content_hashes.move_to_end(content_hash)
 
-        return best_match if best_similarity > 0 else None
+        return best_match
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts using simple metrics."""
@@ -179,32 +239,44 @@ class SimilarityGuard(BaseGuard):
             return 0.0
 
         # Simple character-based similarity (Jaccard-like)
-        set1 = set(text1.split())
-        set2 = set(text2.split())
+        set1 = frozenset(text1.split())
+        set2 = frozenset(text2.split())
 
         if not set1 and not set2:
             return 1.0
 
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
+        return self._jaccard(set1, set2)
 
+    @staticmethod
+    def _jaccard(set1: frozenset[str], set2: frozenset[str]) -> float:
+        """Jaccard index of two token sets without materializing the union."""
+        intersection = len(set1 & set2)
+        union = len(set1) + len(set2) - intersection
         return intersection / union if union > 0 else 0.0
 
     def _store_content(
         self, content_hash: str, normalized_hash: str, normalized_text: str, ctx: Context
     ) -> None:
         """Store content for future comparison."""
-        import time
-
         # Limit storage size
         if len(self.content_hashes) >= self.max_history_size:
-            # Remove oldest entries (simple FIFO)
-            oldest_hash = next(iter(self.content_hashes))
-            del self.content_hashes[oldest_hash]
-
-            # Also clean up normalized content
-            if oldest_hash in self.normalized_content:
-                del self.normalized_content[oldest_hash]
+            # Evict the least recently used entry
+            _, oldest_info = self.content_hashes.popitem(last=False)
+
+            # Also clean up normalized content, once no stored entry shares it
+            oldest_normalized = oldest_info["normalized_hash"]
+            refs = self._normalized_refs.pop(oldest_normalized, 1) - 1
+            if refs > 0:
+                self._normalized_refs[oldest_normalized] = refs
+            elif oldest_normalized in self.normalized_content:
+                del self.normalized_content[oldest_normalized]
+                del self._store_order[oldest_normalized]
+                self._content_by_normalized.pop(oldest_normalized, None)
+                for token in self._token_sets.pop(oldest_normalized):
+                    postings = self._postings[token]
+                    postings.discard(oldest_normalized)
+                    if not postings:
+                        del self._postings[token]
 
         self.content_hashes[content_hash] = {
             "audit_id": ctx.audit_id,
@@ -214,7 +286,16 @@ class SimilarityGuard(BaseGuard):
             "model": ctx.model,
         }
 
-        self.normalized_content[normalized_hash] = normalized_text
+        self._content_by_normalized[normalized_hash] = content_hash
+        self._normalized_refs[normalized_hash] = self._normalized_refs.get(normalized_hash, 0) + 1
+        if normalized_hash not in self.normalized_content:
+            self.normalized_content[normalized_hash] = normalized_text
+            tokens = frozenset(normalized_text.split())
+            self._token_sets[normalized_hash] = tokens
+            for token in tokens:
+                self._postings.setdefault(token, set()).add(normalized_hash)
+            self._store_order[normalized_hash] = self._next_order
+            self._next_order += 1
 
     def _handle_similarity_detection(
         self, data: Any, reasons: list[str], evidence: dict[str, Any], ctx: Context
@@ -3,16 +3,37 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Literal
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any, ClassVar, Literal, NamedTuple
 
 from ..context import Context
 from ..decisions import Decision
 from ..guard import BaseGuard
+from ..utils.patterns import combine_patterns, compile_pattern, re2_compatible
+
+# A category or prescreen alternation: compiled for scanning, and on re
+_Combined = tuple[Any, "re.Pattern[str] | None"]
+
+
+class _Detection(NamedTuple):
+    """A single toxic pattern match (a tuple is far smaller than a dict)."""
+
+    category: str
+    pattern: str
+    match: str
+    start: int
+    end: int
+    severity: float
 
 
 class ToxicityGuard(BaseGuard):
     """Guard that detects toxic, harmful, or offensive content."""
 
+    readonly = True
+    pure = True
+
     # Extended toxic patterns (in production, use ML-based toxicity detection)
     TOXIC_PATTERNS = {
         "threats": [
@@ -54,12 +75,18 @@ class ToxicityGuard(BaseGuard):
         "discrimination": 0.6,
     }
 
+    # Compiled default patterns and prescreens, shared by every instance
+    _compiled_defaults: ClassVar[dict[str, tuple[list[Any], list[re.Pattern[str]], _Combined]]] = {}
+    _compiled_prescreens: ClassVar[dict[frozenset[str], _Combined]] = {}
+
     def __init__(
         self,
         action: Literal["block", "flag", "quarantine"] = "block",
         severity_threshold: float = 0.6,
         categories: list[str] | None = None,
         custom_patterns: dict[str, list[str]] | None = None,
+        early_exit: bool = False,
+        cache_size: int = 256,
     ) -> None:
         """Initialize the toxicity guard.
 
@@ -68,20 +95,90 @@ class ToxicityGuard(BaseGuard):
             severity_threshold: Minimum severity score to trigger action (0.0 to 1.0)
             categories: List of toxicity categories to check (if None, check all)
             custom_patterns: Additional custom toxic patterns by category
+            early_exit: Stop scanning once the remaining categories can't change
+                the outcome (detections in the evidence may then be incomplete)
+            cache_size: Number of recent inputs whose detections are remembered
+                (0 disables caching)
         """
         self.action = action
         self.severity_threshold = severity_threshold
+        self.early_exit = early_exit
+        self.cache_size = cache_size
+        # Detections for recently seen inputs, in least recently used order
+        self._cache: OrderedDict[str, tuple[tuple[_Detection, ...], bool]] = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.categories = set(categories) if categories else set(self.TOXIC_PATTERNS.keys())
 
-        # Combine default and custom patterns
+        # Combine default and custom patterns; the defaults are compiled once per
+        # process and shared, so only custom patterns cost anything per instance
         self.patterns = {}
+        # One alternation per category, used to skip categories with no possible match
+        self._combined: dict[str, Any] = {}
+        # The same patterns and alternations on re, for text RE2 could misread
+        self._exact_patterns: dict[str, list[re.Pattern[str]]] = {}
+        self._exact_combined: dict[str, re.Pattern[str] | None] = {}
+        all_patterns: list[re.Pattern[str]] = []
         for category in self.categories:
-            patterns = self.TOXIC_PATTERNS.get(category, [])
-            if custom_patterns and category in custom_patterns:
-                patterns.extend(custom_patterns[category])
+            compiled, category_patterns, combined = self._compiled_category(category)
+            extra = custom_patterns.get(category) if custom_patterns else None
+            if extra:
+                compiled = compiled + [compile_pattern(p, re.IGNORECASE) for p in extra]
+                category_patterns = category_patterns + [
+                    re.compile(p, re.IGNORECASE) for p in extra
+                ]
+                combined = self._compile_combined(category_patterns)
+
+            self.patterns[category] = list(compiled)
+            self._exact_patterns[category] = list(category_patterns)
+            all_patterns.extend(category_patterns)
+            self._combined[category], self._exact_combined[category] = combined
+
+        # A single pass over every category lets benign text skip all per-category work
+        if custom_patterns:
+            prescreen = self._compile_combined(all_patterns)
+        else:
+            key = frozenset(self.categories)
+            if key not in self._compiled_prescreens:
+                self._compiled_prescreens[key] = self._compile_combined(all_patterns)
+            prescreen = self._compiled_prescreens[key]
+        self._prescreen, self._exact_prescreen = prescreen
+
+        # Most severe categories first, so early exit can settle the outcome sooner
+        self._ordered_patterns = sorted(
+            self.patterns.items(), key=lambda item: -self.SEVERITY_WEIGHTS.get(item[0], 0.5)
+        )
+
+    @classmethod
+    def _compiled_category(
+        cls, category: str
+    ) -> tuple[list[Any], list[re.Pattern[str]], _Combined]:
+        """Return the compiled default patterns of a category, compiling them on first use.
 
-            # Compile regex patterns
-            self.patterns[category] = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        Returns the patterns compiled for scanning, the same patterns compiled
+        with re (for building alternations) and the category's alternation.
+        """
+        entry = cls._compiled_defaults.get(category)
+        if entry is None:
+            sources = cls.TOXIC_PATTERNS.get(category, [])
+            category_patterns = [re.compile(p, re.IGNORECASE) for p in sources]
+            entry = (
+                [compile_pattern(p, re.IGNORECASE) for p in sources],
+                category_patterns,
+                cls._compile_combined(category_patterns),
+            )
+            cls._compiled_defaults[category] = entry
+        return entry
+
+    @staticmethod
+    def _compile_combined(patterns: list[re.Pattern[str]]) -> _Combined:
+        """Compile patterns into one alternation for prescreening, if possible.
+
+        Returns the alternation compiled for scanning and the same alternation on re.
+        """
+        combined = combine_patterns(patterns)
+        if combined is None:
+            return None, None
+        return compile_pattern(combined.pattern, re.IGNORECASE), combined
 
     @property
     def name(self) -> str:
@@ -95,18 +192,20 @@ class ToxicityGuard(BaseGuard):
             text = data
 
         # Detect toxic content
-        detections = self._detect_toxicity(text)
+        detections, exited_early = self._cached_detect_toxicity(text)
         severity_score = self._calculate_severity(detections)
 
         evidence = {
-            "detections": detections,
+            "detections": [d._asdict() for d in detections],
             "severity_score": severity_score,
             "severity_threshold": self.severity_threshold,
             "categories_checked": list(self.categories),
         }
+        if exited_early:
+            evidence["early_exit"] = True
 
         if severity_score >= self.severity_threshold:
-            categories_found = list({d["category"] for d in detections})
+            categories_found = list({d.category for d in detections})
             reasons = [f"Toxic content detected (severity: {severity_score:.2f})"]
             reasons.append(f"Categories: {', '.join(categories_found)}")
 
@@ -140,61 +239,118 @@ class ToxicityGuard(BaseGuard):
             evidence=evidence,
         )
 
-    def _detect_toxicity(self, text: str) -> list[dict[str, Any]]:
-        """Detect toxic patterns in text."""
-        detections = []
-
-        for category, patterns in self.patterns.items():
+    def _cached_detect_toxicity(self, text: str) -> tuple[tuple[_Detection, ...], bool]:
+        """Detect toxic patterns, reusing results for recently seen inputs."""
+        threshold = self.severity_threshold if self.early_exit else None
+        if self.cache_size <= 0:
+            detections, exited_early = self._detect_toxicity(text, threshold)
+            return tuple(detections), exited_early
+
+        with self._cache_lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+
+        if cached is None:
+            detections, exited_early = self._detect_toxicity(text, threshold)
+            cached = (tuple(detections), exited_early)
+            with self._cache_lock:
+                self._cache[text] = cached
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        # Detections are immutable, so the cached tuple can be shared as is
+        return cached
+
+    def _detect_toxicity(
+        self, text: str, threshold: float | None = None
+    ) -> tuple[list[_Detection], bool]:
+        """Detect toxic patterns in text.
+
+        When a threshold is given, scanning stops as soon as the remaining
+        categories can no longer move the severity score across it. Returns the
+        detections and whether scanning stopped early.
+        """
+        detections: list[_Detection] = []
+        counts: dict[str, int] = {}
+
+        # RE2 only sees ASCII classes, so other text is scanned with the re patterns
+        exact = not re2_compatible(text)
+        prescreen = self._exact_prescreen if exact else self._prescreen
+        if prescreen is not None and not prescreen.search(text):
+            return detections, False
+
+        for scanned, (category, patterns) in enumerate(self._ordered_patterns, 1):
+            if threshold is not None and scanned > 1:
+                if self._outcome_settled(counts, scanned - 1, threshold):
+                    return detections, True
+
+            if exact:
+                patterns = self._exact_patterns[category]
+                combined = self._exact_combined[category]
+            else:
+                combined = self._combined[category]
+            if combined is not None and not combined.search(text):
+                continue
+
+            severity = self.SEVERITY_WEIGHTS.get(category, 0.5)
+            found = len(detections)
             for pattern in patterns:
-                matches = list(pattern.finditer(text))
-                for match in matches:
+                # Consume matches as the scan yields them instead of collecting
+                # every match of a pattern into a list first
+                for match in pattern.finditer(text):
+                    start, end = match.span()
                     detections.append(
-                        {
-                            "category": category,
-                            "pattern": pattern.pattern,
-                            "match": match.group(),
-                            "start": match.start(),
-                            "end": match.end(),
-                            "severity": self.SEVERITY_WEIGHTS.get(category, 0.5),
-                        }
+                        _Detection(category, pattern.pattern, text[start:end], start, end, severity)
                     )
+            if len(detections) > found:
+                counts[category] = len(detections) - found
+
+        return detections, False
+
+    def _outcome_settled(self, counts: dict[str, int], scanned: int, threshold: float) -> bool:
+        """Check whether unscanned categories could still flip the threshold outcome."""
+        remaining = [
+            self.SEVERITY_WEIGHTS.get(category, 0.5)
+            for category, _ in self._ordered_patterns[scanned:]
+        ]
+
+        if counts:
+            total = sum(counts.values())
+            base = sum(self.SEVERITY_WEIGHTS.get(c, 0.5) * n for c, n in counts.items()) / total
+            # More categories can only drag the average toward their weight and
+            # add to the multi-category bonus
+            lower = min(base, min(remaining)) + min(0.3, (len(counts) - 1) * 0.1)
+            if min(1.0, lower) >= threshold:
+                return True
+            upper_base = max(base, max(remaining))
+        else:
+            upper_base = max(remaining)
 
-        return detections
+        upper = upper_base + min(0.3, (len(counts) + len(remaining) - 1) * 0.1)
+        return min(1.0, upper) < threshold
 
-    def _calculate_severity(self, detections: list[dict[str, Any]]) -> float:
+    def _calculate_severity(self, detections: Sequence[_Detection]) -> float:
         """Calculate overall severity score from detections."""
         if not detections:
             return 0.0
 
-        # Calculate weighted average severity
-        total_weight = 0.0
-        weighted_severity = 0.0
-
-        # Group by category to avoid over-weighting repeated patterns
-        category_severities: dict[str, list[float]] = {}
+        # One pass keeps each category's match count and maximum severity, so
+        # repeated patterns add weight without over-weighting the category
+        category_counts: dict[str, int] = {}
+        category_max: dict[str, float] = {}
         for detection in detections:
-            category = detection["category"]
-            severity = detection["severity"]
-
-            if category not in category_severities:
-                category_severities[category] = []
-            category_severities[category].append(severity)
+            category = detection.category
+            category_counts[category] = category_counts.get(category, 0) + 1
+            if detection.severity > category_max.get(category, -1.0):
+                category_max[category] = detection.severity
 
-        # Take maximum severity per category
-        for _category, severities in category_severities.items():
-            max_severity = max(severities)
-            weight = len(severities)  # More matches = higher weight
-
-            weighted_severity += max_severity * weight
-            total_weight += weight
-
-        # Normalize to 0-1 range
-        if total_weight == 0:
-            return 0.0
-
-        base_score = weighted_severity / total_weight
+        weighted_severity = sum(
+            category_max[category] * count for category, count in category_counts.items()
+        )
+        base_score = weighted_severity / len(detections)
 
         # Apply bonus for multiple categories
-        category_bonus = min(0.3, (len(category_severities) - 1) * 0.1)
+        category_bonus = min(0.3, (len(category_counts) - 1) * 0.1)
 
         return min(1.0, base_score + category_bonus)
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
+from collections import OrderedDict
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
 from typing import Any, Literal
 
 from .context import Context
@@ -27,6 +32,9 @@ class Pipeline:
         *,
         fail_fast: bool = True,
         on_error: Literal["deny", "allow", "transform"] = "deny",
+        max_workers: int | None = None,
+        optimize: bool = False,
+        cache_size: int = 0,
     ) -> None:
         """Initialize the pipeline.
 
@@ -35,15 +43,48 @@ class Pipeline:
             steps: Sequence of guards to execute in order
             fail_fast: Whether to stop on the first failure
             on_error: Default action when a guard raises an exception
+            max_workers: Run consecutive read-only guards concurrently on a thread
+                pool of this size in validate() (None runs every guard in turn).
+                Call close(), or use the pipeline as a context manager, to shut
+                the pool down
+            optimize: Reorder each run of consecutive read-only guards by cost, so
+                cheap checks can deny a request before expensive ones run
+            cache_size: Number of recent (guard, text) decisions of pure guards to
+                reuse for repeated inputs (0 disables caching). Cached decisions
+                share their evidence values with the decision first returned.
         """
         self.name = name
         self.steps = list(steps)
+        self.optimize = optimize
+        self.cache_size = cache_size
+        # Decisions of pure guards by step and input, in least recently used order
+        self._cache: OrderedDict[tuple[int, str], Decision] = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.fail_fast = fail_fast
         self.on_error = on_error
+        self.max_workers = max_workers
 
         if not self.steps:
             raise ValueError("Pipeline must have at least one guard")
 
+        if optimize:
+            # Guards that transform data or keep state must stay where they are,
+            # but read-only neighbours all see the same input in any order
+            self.steps = [
+                guard
+                for group in self._step_groups()
+                for _, guard in sorted(group, key=lambda step: getattr(step[1], "cost", 100))
+            ]
+
+        # The steps are fixed from here on, so validation reuses one grouping
+        self._groups = tuple(tuple(group) for group in self._step_groups())
+
+        self._executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"safellm-{name}")
+            if max_workers and max_workers > 1
+            else None
+        )
+
     def validate(self, data: Any, *, ctx: Context | None = None) -> Decision:
         """Synchronously validate data through the pipeline.
 
@@ -57,120 +98,122 @@ class Pipeline:
         if ctx is None:
             ctx = Context()
 
-        current_data = data
-        all_reasons: list[str] = []
-        all_evidence: dict[str, Any] = {}
-        transformations = 0
-
-        logger.debug(f"Starting pipeline {self.name} validation", extra={"audit_id": ctx.audit_id})
-
-        for i, guard in enumerate(self.steps):
-            try:
-                logger.debug(
-                    f"Running guard {guard.name} (step {i + 1}/{len(self.steps)})",
-                    extra={"audit_id": ctx.audit_id, "guard": guard.name},
-                )
-
-                decision = guard.check(current_data, ctx)
-
-                # Collect reasons and evidence
-                all_reasons.extend(decision.reasons)
-                all_evidence.update(decision.evidence)
+        run = _PipelineRun(self, data, ctx)
+        executor = self._executor
+
+        logger.debug("Starting pipeline %s validation", self.name, extra={"audit_id": run.audit_id})
+
+        for group in self._groups:
+            if executor is None or len(group) == 1:
+                for i, guard in group:
+                    run.log_step(i, guard)
+                    try:
+                        decision = self._check(i, guard, run.current_data, ctx)
+                    except Exception as e:
+                        final = run.fail(guard, e)
+                    else:
+                        final = run.apply(guard, decision)
+                    if final is not None:
+                        return final
+                continue
+
+            # Read-only guards all see the same input, so they can run side by
+            # side; their decisions are still applied in pipeline order
+            futures = []
+            for i, guard in group:
+                run.log_step(i, guard)
+                futures.append(executor.submit(self._check, i, guard, run.current_data, ctx))
+
+            for (_, guard), future in zip(group, futures):
+                try:
+                    decision = future.result()
+                except Exception as e:
+                    final = run.fail(guard, e)
+                else:
+                    final = run.apply(guard, decision)
+                if final is not None:
+                    for pending in futures:
+                        pending.cancel()
+                    return final
+
+        return run.finish()
+
+    def validate_many(
+        self, inputs: Sequence[Any], *, ctxs: Sequence[Context] | None = None
+    ) -> list[Decision]:
+        """Synchronously validate several inputs, running each guard over the batch in turn.
+
+        Every input gets the decision validate() would give it, and each guard
+        still sees the inputs in order. Pure guards receive the inputs still in
+        play in one check_many() call, unless the decision cache is enabled.
 
-                if decision.action == "deny":
-                    logger.info(
-                        f"Guard {guard.name} denied request: {', '.join(decision.reasons)}",
-                        extra={"audit_id": ctx.audit_id, "guard": guard.name},
-                    )
-                    if self.fail_fast:
-                        return Decision.deny(
-                            current_data,
-                            all_reasons,
-                            audit_id=ctx.audit_id,
-                            evidence=all_evidence,
-                        )
-
-                elif decision.action == "transform":
-                    logger.debug(
-                        f"Guard {guard.name} transformed data: {', '.join(decision.reasons)}",
-                        extra={"audit_id": ctx.audit_id, "guard": guard.name},
-                    )
-                    current_data = decision.output
-                    transformations += 1
+        Args:
+            inputs: The data items to validate
+            ctxs: Optional context per input (created if not provided)
 
-                elif decision.action == "retry":
-                    logger.info(
-                        f"Guard {guard.name} requested retry: {', '.join(decision.reasons)}",
-                        extra={"audit_id": ctx.audit_id, "guard": guard.name},
-                    )
-                    if self.fail_fast:
-                        return Decision.retry(
-                            current_data,
-                            all_reasons,
-                            audit_id=ctx.audit_id,
-                            evidence=all_evidence,
-                        )
-
-            except Exception as e:
-                logger.error(
-                    f"Guard {guard.name} raised exception: {e}",
-                    extra={"audit_id": ctx.audit_id, "guard": guard.name},
-                    exc_info=True,
-                )
+        Returns:
+            Final decision for each input, in input order
+        """
+        if ctxs is None:
+            ctxs = [Context() for _ in inputs]
+        elif len(ctxs) != len(inputs):
+            raise ValueError("ctxs must provide one context per input")
 
-                error_reason = f"Guard {guard.name} failed: {str(e)}"
-                all_reasons.append(error_reason)
+        runs = [_PipelineRun(self, data, ctx) for data, ctx in zip(inputs, ctxs)]
+        finals: list[Decision | None] = [None] * len(runs)
+        active = list(range(len(runs)))
 
-                if self.on_error == "deny" or self.fail_fast:
-                    return Decision.deny(
-                        current_data,
-                        all_reasons,
-                        audit_id=ctx.audit_id,
-                        evidence=all_evidence,
+        for i, guard in enumerate(self.steps):
+            if not active:
+                break
+
+            batch: list[Decision] | None = None
+            check_many = getattr(guard, "check_many", None)
+            if not getattr(guard, "pure", False) or self.cache_size > 0:
+                check_many = None
+            if check_many is not None:
+                for j in active:
+                    runs[j].log_step(i, guard)
+                try:
+                    batch = check_many(
+                        [runs[j].current_data for j in active], [runs[j].ctx for j in active]
                     )
-                elif self.on_error == "allow":
-                    # Continue with original data
-                    continue
-                # For "transform", we also continue
-
-        # If we get here, all guards passed or we're not failing fast
-        if all_reasons:
-            # Some guards had issues but we continued
-            if transformations > 0:
-                return Decision.transform(
-                    data,
-                    current_data,
-                    all_reasons,
-                    audit_id=ctx.audit_id,
-                    evidence=all_evidence,
-                )
-            else:
-                # Had issues but no transformations
-                return Decision.allow(
-                    current_data,
-                    audit_id=ctx.audit_id,
-                    evidence=all_evidence,
-                )
-        else:
-            # Clean run
-            if transformations > 0:
-                return Decision.transform(
-                    data,
-                    current_data,
-                    [f"Applied {transformations} transformation(s)"],
-                    audit_id=ctx.audit_id,
-                    evidence=all_evidence,
-                )
-            else:
-                return Decision.allow(
-                    current_data,
-                    audit_id=ctx.audit_id,
-                    evidence=all_evidence,
-                )
+                except Exception:
+                    # A pure guard can safely be rerun input by input to find the failure
+                    batch = None
+                else:
+                    if len(batch) != len(active):
+                        # Decisions can't be matched to inputs, so rerun input by input
+                        batch = None
+
+            still_active = []
+            for k, j in enumerate(active):
+                run = runs[j]
+                if batch is not None:
+                    final = run.apply(guard, batch[k])
+                else:
+                    if check_many is None:
+                        # Steps handed to check_many() were logged before it ran
+                        run.log_step(i, guard)
+                    try:
+                        decision = self._check(i, guard, run.current_data, run.ctx)
+                    except Exception as e:
+                        final = run.fail(guard, e)
+                    else:
+                        final = run.apply(guard, decision)
+                if final is None:
+                    still_active.append(j)
+                else:
+                    finals[j] = final
+            active = still_active
+
+        return [final if final is not None else run.finish() for final, run in zip(finals, runs)]
 
     async def avalidate(self, data: Any, *, ctx: Context | None = None) -> Decision:
         """Asynchronously validate data through the pipeline.
 
+        Consecutive read-only guards are awaited concurrently.
+
         Args:
             data: The data to validate
             ctx: Optional context object (will be created if not provided)
@@ -181,118 +224,308 @@ class Pipeline:
         if ctx is None:
             ctx = Context()
 
-        current_data = data
-        all_reasons: list[str] = []
-        all_evidence: dict[str, Any] = {}
-        transformations = 0
+        run = _PipelineRun(self, data, ctx)
 
         logger.debug(
-            f"Starting async pipeline {self.name} validation", extra={"audit_id": ctx.audit_id}
+            "Starting async pipeline %s validation", self.name, extra={"audit_id": run.audit_id}
+        )
+
+        for group in self._groups:
+            if len(group) == 1:
+                i, guard = group[0]
+                run.log_step(i, guard)
+                try:
+                    decision = await self._acheck(i, guard, run.current_data, ctx)
+                except Exception as e:
+                    final = run.fail(guard, e)
+                else:
+                    final = run.apply(guard, decision)
+                if final is not None:
+                    return final
+                continue
+
+            for i, guard in group:
+                run.log_step(i, guard)
+            results = await asyncio.gather(
+                *(self._acheck(i, guard, run.current_data, ctx) for i, guard in group),
+                return_exceptions=True,
+            )
+
+            for (_, guard), result in zip(group, results):
+                if isinstance(result, Exception):
+                    final = run.fail(guard, result)
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    final = run.apply(guard, result)
+                if final is not None:
+                    return final
+
+        return run.finish()
+
+    def _check(self, i: int, guard: Guard, data: Any, ctx: Context) -> Decision:
+        """Run a guard's check, reusing a cached decision when the guard is pure."""
+        key = self._cache_key(i, guard, data)
+        if key is None:
+            return guard.check(data, ctx)
+        cached = self._cached(key, ctx)
+        if cached is None:
+            cached = guard.check(data, ctx)
+            self._remember(key, cached)
+        return cached
+
+    async def _acheck(self, i: int, guard: Guard, data: Any, ctx: Context) -> Decision:
+        """Await a guard's check, reusing a cached decision when the guard is pure."""
+        key = self._cache_key(i, guard, data)
+        if key is None:
+            return await guard.acheck(data, ctx)
+        cached = self._cached(key, ctx)
+        if cached is None:
+            cached = await guard.acheck(data, ctx)
+            self._remember(key, cached)
+        return cached
+
+    def _cache_key(self, i: int, guard: Guard, data: Any) -> tuple[int, str] | None:
+        """Key a step's decision on its input, or None if it can't be cached."""
+        if self.cache_size <= 0 or not isinstance(data, str):
+            return None
+        if not getattr(guard, "pure", False):
+            return None
+        # Keyed on the text itself, so distinct inputs can never collide
+        return (i, data)
+
+    def _cached(self, key: tuple[int, str], ctx: Context) -> Decision | None:
+        """Look up a cached decision, rebound to the current request."""
+        with self._cache_lock:
+            decision = self._cache.get(key)
+            if decision is None:
+                return None
+            self._cache.move_to_end(key)
+        # Give each request its own reasons and evidence containers and audit ID
+        return decision._replace(
+            reasons=list(decision.reasons),
+            evidence=dict(decision.evidence),
+            audit_id=ctx.audit_id,
         )
 
+    def _remember(self, key: tuple[int, str], decision: Decision) -> None:
+        """Store a decision, evicting the least recently used one when full."""
+        with self._cache_lock:
+            self._cache[key] = decision._replace(
+                reasons=list(decision.reasons), evidence=dict(decision.evidence)
+            )
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _step_groups(self) -> list[list[tuple[int, Guard]]]:
+        """Split the steps into runs of consecutive read-only guards.
+
+        Any other guard forms a group of its own, so it always sees the output
+        of every guard before it.
+        """
+        groups: list[list[tuple[int, Guard]]] = []
+        previous_readonly = False
         for i, guard in enumerate(self.steps):
-            try:
-                logger.debug(
-                    f"Running guard {guard.name} (step {i + 1}/{len(self.steps)})",
-                    extra={"audit_id": ctx.audit_id, "guard": guard.name},
-                )
+            readonly = getattr(guard, "readonly", False)
+            if readonly and previous_readonly:
+                groups[-1].append((i, guard))
+            else:
+                groups.append([(i, guard)])
+            previous_readonly = readonly
+        return groups
 
-                decision = await guard.acheck(current_data, ctx)
+    def close(self) -> None:
+        """Shut down the thread pool that runs read-only guards concurrently.
 
-                # Collect reasons and evidence
-                all_reasons.extend(decision.reasons)
-                all_evidence.update(decision.evidence)
+        The pipeline stays usable afterwards, running every guard in turn.
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
 
-                if decision.action == "deny":
-                    logger.info(
-                        f"Guard {guard.name} denied request: {', '.join(decision.reasons)}",
-                        extra={"audit_id": ctx.audit_id, "guard": guard.name},
-                    )
-                    if self.fail_fast:
-                        return Decision.deny(
-                            current_data,
-                            all_reasons,
-                            audit_id=ctx.audit_id,
-                            evidence=all_evidence,
-                        )
-
-                elif decision.action == "transform":
-                    logger.debug(
-                        f"Guard {guard.name} transformed data: {', '.join(decision.reasons)}",
-                        extra={"audit_id": ctx.audit_id, "guard": guard.name},
-                    )
-                    current_data = decision.output
-                    transformations += 1
+    def __enter__(self) -> Pipeline:
+        return self
 
-                elif decision.action == "retry":
-                    logger.info(
-                        f"Guard {guard.name} requested retry: {', '.join(decision.reasons)}",
-                        extra={"audit_id": ctx.audit_id, "guard": guard.name},
-                    )
-                    if self.fail_fast:
-                        return Decision.retry(
-                            current_data,
-                            all_reasons,
-                            audit_id=ctx.audit_id,
-                            evidence=all_evidence,
-                        )
-
-            except Exception as e:
-                logger.error(
-                    f"Guard {guard.name} raised exception: {e}",
-                    extra={"audit_id": ctx.audit_id, "guard": guard.name},
-                    exc_info=True,
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"Pipeline(name={self.name!r}, steps={len(self.steps)}, fail_fast={self.fail_fast})"
+
+
+class _PipelineRun:
+    """Accumulated state for one pass of data through a pipeline."""
+
+    # One run is built per validation, so skip the per-instance __dict__
+    __slots__ = (
+        "ctx",
+        "data",
+        "current_data",
+        "reasons",
+        "evidence",
+        "transformations",
+        "audit_id",
+        "fail_fast",
+        "on_error",
+        "n_steps",
+        "debug",
+    )
+
+    def __init__(self, pipeline: Pipeline, data: Any, ctx: Context) -> None:
+        self.ctx = ctx
+        self.data = data
+        self.current_data = data
+        self.reasons: list[str] = []
+        self.evidence: dict[str, Any] = {}
+        self.transformations = 0
+
+        # Bound once per run rather than looked up on every step
+        self.audit_id = ctx.audit_id
+        self.fail_fast = pipeline.fail_fast
+        self.on_error = pipeline.on_error
+        self.n_steps = len(pipeline.steps)
+        self.debug = logger.isEnabledFor(logging.DEBUG)
+
+    def log_step(self, i: int, guard: Guard) -> None:
+        """Log that a guard is about to run."""
+        if self.debug:
+            name = guard.name
+            logger.debug(
+                "Running guard %s (step %d/%d)",
+                name,
+                i + 1,
+                self.n_steps,
+                extra={"audit_id": self.audit_id, "guard": name},
+            )
+
+    def apply(self, guard: Guard, decision: Decision) -> Decision | None:
+        """Fold a guard's decision into the run.
+
+        Returns:
+            The pipeline's final decision if the run stops here, otherwise None
+        """
+        action = decision.action
+        reasons = decision.reasons
+        evidence = decision.evidence
+
+        # Collect reasons and evidence; most guards allow with neither, so skip
+        # the merge calls then. A fail-fast denial still needs both merged, as
+        # its decision carries everything gathered by the earlier guards.
+        if reasons:
+            self.reasons.extend(reasons)
+        if evidence:
+            self.evidence.update(evidence)
+
+        if action == "deny":
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Guard %s denied request: %s",
+                    guard.name,
+                    ", ".join(reasons),
+                    extra={"audit_id": self.audit_id, "guard": guard.name},
+                )
+            if self.fail_fast:
+                return Decision.deny(
+                    self.current_data,
+                    self.reasons,
+                    audit_id=self.audit_id,
+                    evidence=self.evidence,
                 )
 
-                error_reason = f"Guard {guard.name} failed: {str(e)}"
-                all_reasons.append(error_reason)
+        elif action == "transform":
+            if self.debug:
+                logger.debug(
+                    "Guard %s transformed data: %s",
+                    guard.name,
+                    ", ".join(reasons),
+                    extra={"audit_id": self.audit_id, "guard": guard.name},
+                )
+            self.current_data = decision.output
+            self.transformations += 1
+
+        elif action == "retry":
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Guard %s requested retry: %s",
+                    guard.name,
+                    ", ".join(reasons),
+                    extra={"audit_id": self.audit_id, "guard": guard.name},
+                )
+            if self.fail_fast:
+                return Decision.retry(
+                    self.current_data,
+                    self.reasons,
+                    audit_id=self.audit_id,
+                    evidence=self.evidence,
+                )
 
-                if self.on_error == "deny" or self.fail_fast:
-                    return Decision.deny(
-                        current_data,
-                        all_reasons,
-                        audit_id=ctx.audit_id,
-                        evidence=all_evidence,
-                    )
-                elif self.on_error == "allow":
-                    # Continue with original data
-                    continue
-                # For "transform", we also continue
+        return None
 
+    def fail(self, guard: Guard, error: Exception) -> Decision | None:
+        """Record a guard that raised an exception.
+
+        Returns:
+            The pipeline's final decision if the run stops here, otherwise None
+        """
+        logger.error(
+            "Guard %s raised exception: %s",
+            guard.name,
+            error,
+            extra={"audit_id": self.audit_id, "guard": guard.name},
+            exc_info=error,
+        )
+
+        error_reason = f"Guard {guard.name} failed: {str(error)}"
+        self.reasons.append(error_reason)
+
+        if self.on_error == "deny" or self.fail_fast:
+            return Decision.deny(
+                self.current_data,
+                self.reasons,
+                audit_id=self.audit_id,
+                evidence=self.evidence,
+            )
+        # For "allow" and "transform", continue with the current data
+        return None
+
+    def finish(self) -> Decision:
+        """Build the final decision once every guard has run."""
         # If we get here, all guards passed or we're not failing fast
-        if all_reasons:
+        if self.reasons:
             # Some guards had issues but we continued
-            if transformations > 0:
+            if self.transformations > 0:
                 return Decision.transform(
-                    data,
-                    current_data,
-                    all_reasons,
-                    audit_id=ctx.audit_id,
-                    evidence=all_evidence,
+                    self.data,
+                    self.current_data,
+                    self.reasons,
+                    audit_id=self.audit_id,
+                    evidence=self.evidence,
                 )
             else:
                 # Had issues but no transformations
                 return Decision.allow(
-                    current_data,
-                    audit_id=ctx.audit_id,
-                    evidence=all_evidence,
+                    self.current_data,
+                    audit_id=self.audit_id,
+                    evidence=self.evidence,
                 )
         else:
             # Clean run
-            if transformations > 0:
+            if self.transformations > 0:
                 return Decision.transform(
-                    data,
-                    current_data,
-                    [f"Applied {transformations} transformation(s)"],
-                    audit_id=ctx.audit_id,
-                    evidence=all_evidence,
+                    self.data,
+                    self.current_data,
+                    [f"Applied {self.transformations} transformation(s)"],
+                    audit_id=self.audit_id,
+                    evidence=self.evidence,
                 )
             else:
                 return Decision.allow(
-                    current_data,
-                    audit_id=ctx.audit_id,
-                    evidence=all_evidence,
+                    self.current_data,
+                    audit_id=self.audit_id,
+                    evidence=self.evidence,
                 )
-
-    def __repr__(self) -> str:
-        return f"Pipeline(name={self.name!r}, steps={len(self.steps)}, fail_fast={self.fail_fast})"
@@ -1,6 +1,7 @@
 """Utility functions for SafeLLM."""
 
 from .patterns import (
+    ALL_PII_PATTERN,
     API_KEY_PATTERNS,
     CREDIT_CARD_PATTERNS,
     EMAIL_PATTERN,
@@ -9,7 +10,12 @@ from .patterns import (
     IPV6_PATTERN,
     JWT_PATTERN,
     PHONE_PATTERNS,
+    PII_PATTERNS,
     SSN_PATTERN,
+    VENDOR_API_KEY_PATTERNS,
+    build_pii_pattern,
+    combine_patterns,
+    compile_pattern,
     contains_profanity,
     luhn_check,
     mask_api_key,
@@ -18,6 +24,8 @@ from .patterns import (
     mask_phone,
     mask_text,
     normalize_leet_speak,
+    re2_compatible,
+    scan_pii,
 )
 
 __all__ = [
@@ -28,6 +36,7 @@ __all__ = [
     "IPV4_PATTERN",
     "IPV6_PATTERN",
     "API_KEY_PATTERNS",
+    "VENDOR_API_KEY_PATTERNS",
     "IBAN_PATTERN",
     "JWT_PATTERN",
     "luhn_check",
@@ -38,4 +47,11 @@ __all__ = [
     "mask_api_key",
     "normalize_leet_speak",
     "contains_profanity",
+    "combine_patterns",
+    "compile_pattern",
+    "re2_compatible",
+    "PII_PATTERNS",
+    "ALL_PII_PATTERN",
+    "build_pii_pattern",
+    "scan_pii",
 ]
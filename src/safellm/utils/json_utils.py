@@ -0,0 +1,57 @@
+"""JSON helpers with an optional orjson fast path."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+    HAS_ORJSON = False
+
+# Characters a JSON document can start with, and the whitespace allowed before it
+_JSON_LEADS = frozenset('{["-0123456789tfnNI')
+_JSON_WHITESPACE = " \t\n\r"
+
+# orjson turns integers outside the 64-bit range into floats, so documents with
+# a run of 19 or more digits go to json.loads, which keeps them exact
+_LONG_DIGITS = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    orjson is stricter than the standard library (for example it rejects NaN),
+    so anything it refuses is re-parsed with :func:`json.loads`. It also reads
+    integers outside the 64-bit range as floats, so documents with 19 or more
+    digits in a row skip it. Valid documents therefore parse exactly as before
+    and invalid ones raise the usual :class:`json.JSONDecodeError`. Text that
+    can't start a document, such as plain prose, fails before either parser runs.
+
+    Args:
+        data: JSON document as text or UTF-8 encoded bytes
+
+    Returns:
+        The decoded Python object
+    """
+    if isinstance(data, str):
+        start = len(data) - len(data.lstrip(_JSON_WHITESPACE))
+        # A leading BOM gets its own error message, so leave it to json.loads
+        if start == len(data) or (data[start] not in _JSON_LEADS and data[start] != "\ufeff"):
+            raise json.JSONDecodeError("Expecting value", data, start)
+        long_digits = _LONG_DIGITS.search(data) is not None
+    else:
+        long_digits = _LONG_DIGITS_BYTES.search(data) is not None
+
+    if orjson is not None and not long_digits:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
@@ -3,9 +3,19 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
+from typing import Any
+
+# RE2 matches in linear time and is much faster than re on most of these patterns
+try:
+    import re2  # type: ignore[import-untyped,import-not-found,unused-ignore]
+except ImportError:  # pragma: no cover - exercised only without google-re2
+    re2 = None
 
 # Email patterns
-EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", re.IGNORECASE)
+EMAIL_PATTERN = re.compile(
+    r"\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,255}\.[A-Z|a-z]{2,}\b", re.IGNORECASE
+)
 
 # Phone number patterns (various formats)
 PHONE_PATTERNS = [
@@ -39,20 +49,22 @@ IPV6_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
-# API key patterns
-API_KEY_PATTERNS = [
-    re.compile(r"\bsk-[a-zA-Z0-9]{48}\b"),  # OpenAI API keys
-    re.compile(r"\bpk-[a-zA-Z0-9]{48}\b"),  # OpenAI publishable keys
-    re.compile(r"\bsk_live_[a-zA-Z0-9]{24,}\b"),  # Stripe live keys
-    re.compile(r"\bsk_test_[a-zA-Z0-9]{24,}\b"),  # Stripe test keys
-    re.compile(r"\bAKIA[0-9A-Z]{16}\b"),  # AWS Access Key ID
-    re.compile(r"\bAIza[0-9A-Za-z\-_]{35}\b"),  # Google API Key
-    re.compile(r"\bghp_[a-zA-Z0-9]{36}\b"),  # GitHub Personal Access Token
-    re.compile(r"\bgho_[a-zA-Z0-9]{36}\b"),  # GitHub OAuth Token
-    re.compile(r"\bxoxb-[0-9]+-[0-9]+-[a-zA-Z0-9]+\b"),  # Slack Bot Token
-    re.compile(r"\bxoxp-[0-9]+-[0-9]+-[0-9]+-[a-zA-Z0-9]+\b"),  # Slack User Token
+# API key patterns, tagged with the vendor that issues them
+VENDOR_API_KEY_PATTERNS = [
+    ("openai", re.compile(r"\bsk-[a-zA-Z0-9]{48}\b")),  # OpenAI API keys
+    ("openai", re.compile(r"\bpk-[a-zA-Z0-9]{48}\b")),  # OpenAI publishable keys
+    ("stripe", re.compile(r"\bsk_live_[a-zA-Z0-9]{24,}\b")),  # Stripe live keys
+    ("stripe", re.compile(r"\bsk_test_[a-zA-Z0-9]{24,}\b")),  # Stripe test keys
+    ("aws", re.compile(r"\bAKIA[0-9A-Z]{16}\b")),  # AWS Access Key ID
+    ("google", re.compile(r"\bAIza[0-9A-Za-z\-_]{35}\b")),  # Google API Key
+    ("github", re.compile(r"\bghp_[a-zA-Z0-9]{36}\b")),  # GitHub Personal Access Token
+    ("github", re.compile(r"\bgho_[a-zA-Z0-9]{36}\b")),  # GitHub OAuth Token
+    ("slack", re.compile(r"\bxoxb-[0-9]+-[0-9]+-[a-zA-Z0-9]+\b")),  # Slack Bot Token
+    ("slack", re.compile(r"\bxoxp-[0-9]+-[0-9]+-[0-9]+-[a-zA-Z0-9]+\b")),  # Slack User Token
 ]
 
+API_KEY_PATTERNS = [pattern for _, pattern in VENDOR_API_KEY_PATTERNS]
+
 # JWT pattern
 JWT_PATTERN = re.compile(r"\beyJ[a-zA-Z0-9_-]+\.eyJ[a-zA-Z0-9_-]+\.[a-zA-Z0-9_-]+\b")
 
@@ -74,27 +86,180 @@ ADDRESS_PATTERNS = [
     re.compile(r"\b\d{5}(?:-\d{4})?\b"),  # US ZIP codes
 ]
 
+# Built-in PII detectors by type, most specific first so they win overlapping spans
+PII_PATTERNS: dict[str, list[re.Pattern[str]]] = {
+    "email": [EMAIL_PATTERN],
+    "jwt": [JWT_PATTERN],
+    "api_key": API_KEY_PATTERNS,
+    "credit_card": CREDIT_CARD_PATTERNS,
+    "ssn": [SSN_PATTERN],
+    "iban": [IBAN_PATTERN],
+    "ip_address": [IPV4_PATTERN, IPV6_PATTERN],
+    "phone": PHONE_PATTERNS,
+}
 
-def luhn_check(card_number: str) -> bool:
-    """Validate credit card number using Luhn algorithm."""
-    # Remove non-digit characters
-    digits = [int(x) for x in card_number if x.isdigit()]
 
-    if len(digits) < 13 or len(digits) > 19:
-        return False
+def build_pii_pattern(types: Iterable[str] | None = None) -> re.Pattern[str]:
+    """Fuse PII detectors into one pattern with a named group per type.
+
+    Args:
+        types: PII types from PII_PATTERNS to include (default: all)
+
+    Returns:
+        Compiled pattern whose ``lastgroup`` names the matching type
+    """
+    selected = set(PII_PATTERNS) if types is None else set(types)
+    groups = []
+    for pii_type, patterns in PII_PATTERNS.items():
+        if pii_type not in selected:
+            continue
+        alternatives = "|".join(
+            f"(?i:{p.pattern})" if p.flags & re.IGNORECASE else f"(?:{p.pattern})" for p in patterns
+        )
+        groups.append(f"(?P<{pii_type}>{alternatives})")
+    return re.compile("|".join(groups))
+
+
+ALL_PII_PATTERN = build_pii_pattern()
+
+
+def scan_pii(text: str) -> list[tuple[str, int, int, str]]:
+    """Find PII in a single pass over the text.
+
+    Matches don't overlap: where detectors compete for the same span, the
+    leftmost match wins, then the type listed first in PII_PATTERNS.
+
+    Returns:
+        (type, start, end, matched text) tuples in order of appearance
+    """
+    scanner = _PII_SCANNER if re2_compatible(text) else ALL_PII_PATTERN
+    return [
+        (match.lastgroup or "", match.start(), match.end(), match.group())
+        for match in scanner.finditer(text)
+    ]
+
+
+def compile_pattern(source: str, flags: int = 0) -> Any:
+    """Compile a pattern for scanning, preferring RE2 when it is installed.
+
+    Falls back to :func:`re.compile` when google-re2 is missing, when flags
+    other than ``re.IGNORECASE`` are requested, or when the pattern uses syntax
+    RE2 doesn't support (backreferences, lookaround). RE2's ``\\b``, ``\\d``
+    and ``\\s`` only match ASCII.
+
+    Args:
+        source: Regular expression source
+        flags: ``re`` flags for the pattern
+
+    Returns:
+        A compiled pattern supporting search, finditer and match
+    """
+    flags &= ~re.UNICODE
+    if re2 is not None and not flags & ~re.IGNORECASE:
+        options = re2.Options()
+        options.case_sensitive = not flags & re.IGNORECASE
+        try:
+            return re2.compile(source, options)
+        except re2.error:
+            pass
+    return re.compile(source, flags)
+
+
+# ASCII characters re's \s matches and RE2's doesn't
+_RE_ONLY_ASCII_SPACE = re.compile("[\x0b\x1c-\x1f]")
+
+
+def re2_compatible(text: str) -> bool:
+    """Check whether patterns from compile_pattern match text exactly as re would.
+
+    RE2's ``\\b``, ``\\d``, ``\\s`` and ``\\w`` only know ASCII characters, and its
+    ``\\s`` also leaves out vertical tab and the \\x1c-\\x1f separators. Callers
+    scanning with RE2 fall back to re for any other text, so that Unicode
+    spaces or digits can't slip past a pattern.
+    """
+    return text.isascii() and _RE_ONLY_ASCII_SPACE.search(text) is None
+
 
-    # Apply Luhn algorithm
-    checksum = 0
-    is_even = False
+# The fused PII pattern on the linear-time engine when it is available
+_PII_SCANNER = compile_pattern(ALL_PII_PATTERN.pattern)
 
-    for digit in reversed(digits):
-        if is_even:
-            digit *= 2
-            if digit > 9:
-                digit -= 9
-        checksum += digit
-        is_even = not is_even
 
+# Leading inline flags such as "(?i)" and constructs that refer to groups by number
+_LEADING_INLINE_FLAGS = re.compile(r"^\(\?[aiLmsux]+\)")
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+def combine_patterns(patterns: Iterable[re.Pattern[str]]) -> re.Pattern[str] | None:
+    """Compile several patterns into a single alternation.
+
+    The combined pattern matches somewhere in a text exactly when at least one
+    of the inputs does, so one ``search`` can stand in for a scan per pattern
+    when most texts match none of them. It does not report overlapping matches
+    of different patterns, so callers still run the individual patterns on a hit.
+
+    Args:
+        patterns: Compiled patterns sharing the same flags, apart from IGNORECASE
+
+    Returns:
+        The combined pattern, or None if the patterns can't be merged safely
+    """
+    patterns = list(patterns)
+    if not patterns:
+        return None
+
+    flags = patterns[0].flags
+    if any(pattern.flags != flags for pattern in patterns):
+        # Case-insensitivity can be scoped to each alternative; other flags can't
+        flags &= ~re.IGNORECASE
+        scoped = True
+    else:
+        scoped = False
+    if flags & re.VERBOSE:
+        return None
+
+    sources = []
+    for pattern in patterns:
+        own_flags = pattern.flags & ~re.IGNORECASE if scoped else pattern.flags
+        if own_flags != flags or _GROUP_REFERENCE.search(pattern.pattern):
+            return None
+        source = _LEADING_INLINE_FLAGS.sub("", pattern.pattern)
+        if scoped and pattern.flags & re.IGNORECASE:
+            sources.append(f"(?i:{source})")
+        else:
+            sources.append(f"(?:{source})")
+
+    try:
+        return re.compile("|".join(sources), flags)
+    except re.error:
+        return None
+
+
+# Luhn "double and subtract 9" step for each digit
+_LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+# Map ASCII digits to their plain and doubled Luhn values, so the bytes can be summed directly
+_LUHN_PLAIN_TABLE = bytes.maketrans(b"0123456789", bytes(range(10)))
+_LUHN_DOUBLED_TABLE = bytes.maketrans(b"0123456789", bytes(_LUHN_DOUBLED))
+_NON_DIGIT_PATTERN = re.compile(r"[^0-9]+")
+
+
+def luhn_check(card_number: str) -> bool:
+    """Validate credit card number using Luhn algorithm."""
+    # bytes.isdigit() only accepts ASCII digits; strip the usual separators
+    # cheaply before falling back to removing everything else
+    digits = card_number.encode()
+    if not digits.isdigit():
+        digits = digits.replace(b" ", b"").replace(b"-", b"")
+        if not digits.isdigit():
+            digits = _NON_DIGIT_PATTERN.sub("", card_number).encode("ascii")
+
+    if not 13 <= len(digits) <= 19:
+        return False
+
+    # Counting from the right, every second digit is doubled
+    checksum = sum(digits[-1::-2].translate(_LUHN_PLAIN_TABLE)) + sum(
+        digits[-2::-2].translate(_LUHN_DOUBLED_TABLE)
+    )
     return checksum % 10 == 0
 
 
@@ -103,7 +268,9 @@ def mask_text(text: str, start: int = 2, end: int = 2, mask_char: str = "*") ->
     if len(text) <= start + end:
         return mask_char * len(text)
 
-    return text[:start] + mask_char * (len(text) - start - end) + text[-end:] if end > 0 else ""
+    # Slice the tail by index: text[-end:] would keep the whole string when end is 0
+    n = len(text)
+    return "".join((text[:start], mask_char * (n - start - end), text[n - end :]))
 
 
 def mask_email(email: str) -> str:
@@ -111,21 +278,19 @@ def mask_email(email: str) -> str:
     if "@" not in email:
         return mask_text(email)
 
-    local, domain = email.split("@", 1)
-    if "." not in domain:
+    local, _, domain = email.partition("@")
+    # Split off the first label only, rather than splitting and rejoining every label
+    domain_name, dot, domain_ext = domain.partition(".")
+    if not dot:
         return f"{mask_text(local, 1, 0)}@{mask_text(domain)}"
 
-    domain_parts = domain.split(".")
-    domain_name = domain_parts[0]
-    domain_ext = ".".join(domain_parts[1:])
-
     return f"{mask_text(local, 1, 0)}@{mask_text(domain_name, 0, 0)}.{domain_ext}"
 
 
 def mask_phone(phone: str) -> str:
     """Mask a phone number."""
     # Extract just digits
-    digits = "".join(c for c in phone if c.isdigit())
+    digits = "".join(filter(str.isdigit, phone))
 
     if len(digits) >= 10:
         # Show country code and last 2-3 digits
@@ -140,7 +305,7 @@ def mask_phone(phone: str) -> str:
 def mask_credit_card(card: str) -> str:
     """Mask a credit card number."""
     # Extract just digits
-    digits = "".join(c for c in card if c.isdigit())
+    digits = "".join(filter(str.isdigit, card))
 
     if len(digits) >= 13:
         return f"**** **** **** {digits[-4:]}"
@@ -177,23 +342,35 @@ LEET_MAPPINGS = {
     "$": "s",
 }
 
+_LEET_TABLE = str.maketrans(LEET_MAPPINGS)
+# Lowercasing folded in, for ASCII text where it is a plain character mapping
+_ASCII_LEET_TABLE = str.maketrans(
+    {**{c: c.lower() for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"}, **LEET_MAPPINGS}
+)
+
 
 def normalize_leet_speak(text: str) -> str:
     """Normalize l33t speak to regular characters."""
-    result = text.lower()
-    for leet, normal in LEET_MAPPINGS.items():
-        result = result.replace(leet, normal)
-    return result
+    if text.isascii():
+        return text.translate(_ASCII_LEET_TABLE)
+    return text.lower().translate(_LEET_TABLE)
+
+
+# Everything str.isalnum() rejects ([\W_] is exactly the non-alphanumeric characters)
+NON_ALNUM_PATTERN = re.compile(r"[\W_]+")
+
+# All profanity words in one alternation, so a single scan checks the whole list
+PROFANITY_PATTERN = re.compile(
+    "|".join(re.escape(word) for word in sorted(BASIC_PROFANITY, key=len, reverse=True))
+)
+# On RE2 the alternation becomes an automaton, so scanning doesn't slow down as the list grows
+_PROFANITY_SCANNER = compile_pattern(PROFANITY_PATTERN.pattern)
 
 
 def contains_profanity(text: str) -> bool:
     """Check if text contains profanity (basic implementation)."""
     normalized = normalize_leet_speak(text)
     # Remove punctuation and spaces for detection
-    cleaned = "".join(c for c in normalized if c.isalnum())
-
-    for word in BASIC_PROFANITY:
-        if word in cleaned:
-            return True
+    cleaned = NON_ALNUM_PATTERN.sub("", normalized)
 
-    return False
+    return _PROFANITY_SCANNER.search(cleaned) is not None
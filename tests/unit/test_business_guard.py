@@ -1,7 +1,7 @@
 """Tests for the BusinessRulesGuard class."""
 
 import unittest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from safellm.context import Context
 from safellm.guards.business import BusinessRulesGuard
@@ -203,6 +203,30 @@ class TestBusinessRulesGuard(unittest.TestCase):
         result = guard.check("Any data", ctx)
         self.assertEqual(result.action, "allow")
 
+    def test_time_window_rule_with_utc_offsets(self):
+        """Test windows given with a UTC designator or offset compare against the current time."""
+        now = datetime.now(timezone.utc)
+        windows = [
+            (
+                (now - timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                (now + timedelta(hours=1)).isoformat(),
+            ),
+            ((now + timedelta(hours=1)).isoformat(), (now + timedelta(hours=2)).isoformat()),
+        ]
+        ctx = Context()
+
+        for (start, end), expected in zip(windows, ["allow", "deny"]):
+            rules = [
+                {
+                    "id": "window",
+                    "type": "time_window",
+                    "config": {"start_time": start, "end_time": end},
+                }
+            ]
+            result = BusinessRulesGuard(rules=rules).check("Any data", ctx)
+            self.assertEqual(result.action, expected)
+            self.assertNotIn("error", result.evidence["rule_results"][0])
+
     def test_value_list_rule_whitelist(self):
         """Test value list rule with whitelist."""
         rules = [
@@ -336,6 +360,12 @@ class TestBusinessRulesGuard(unittest.TestCase):
         with self.assertRaises(ValueError):
             BusinessRulesGuard([{"id": "test"}])  # Missing name and type
 
+        # Test non-numeric bounds
+        with self.assertRaises(ValueError):
+            BusinessRulesGuard([{"id": "test", "type": "range", "config": {"min": "18"}}])
+        with self.assertRaises(ValueError):
+            BusinessRulesGuard([{"id": "test", "type": "length", "config": {"max_length": "10"}}])
+
         # Test invalid rule type
         with self.assertRaises(ValueError):
             BusinessRulesGuard(
@@ -402,6 +432,19 @@ class TestBusinessRulesGuard(unittest.TestCase):
         result = guard.check("a", ctx)  # Length 1 < min_length 2
         self.assertEqual(result.action, "deny")
 
+    def test_length_rule_count_items(self):
+        """Test count_items measures containers by item count instead of their str()."""
+        rules = [{"id": "size", "type": "length", "config": {"min_length": 2, "count_items": True}}]
+        guard = BusinessRulesGuard(rules=rules)
+        ctx = Context()
+
+        self.assertEqual(guard.check([1, 2, 3], ctx).action, "allow")
+        result = guard.check({"a": "b"}, ctx)
+        self.assertEqual(result.action, "deny")
+        self.assertEqual(result.evidence["rule_results"][0]["details"]["actual_length"], 1)
+        self.assertEqual(guard.check("a", ctx).action, "deny")
+        self.assertEqual(guard.check(12345, ctx).action, "allow")
+
     def test_case_sensitivity_in_patterns(self):
         """Test case sensitivity in pattern rules."""
         rules = [
@@ -456,6 +499,97 @@ class TestBusinessRulesGuard(unittest.TestCase):
         if len(rules) > 3:
             self.assertTrue(len(more_message) > 0)
 
+    def test_rule_dispatch(self):
+        """Test every rule type has an evaluator and unknown types fail cleanly."""
+        guard = BusinessRulesGuard([{"id": "size", "type": "length", "config": {"max_length": 3}}])
+        ctx = Context()
+
+        self.assertEqual(
+            set(BusinessRulesGuard._EVALUATORS),
+            {"range", "pattern", "length", "time_window", "value_list", "custom"},
+        )
+        self.assertFalse(guard._evaluate_rule(guard.rules[0], "long", ctx)["passed"])
+        result = guard._evaluate_rule({**guard.rules[0], "type": "bogus"}, "ok", ctx)
+        self.assertEqual(result["message"], "Unknown rule type: bogus")
+
+    def test_fail_fast_stops_once_decided(self):
+        """Test fail_fast skips the rules left after the outcome is known."""
+        rules = [
+            {"id": f"rule_{i}", "type": "length", "config": {"min_length": n}}
+            for i, n in enumerate([1, 100, 1, 100])
+        ]
+        ctx = Context()
+
+        result = BusinessRulesGuard(rules, require_all=True, fail_fast=True).check("short", ctx)
+        self.assertEqual(result.action, "deny")
+        self.assertEqual(result.evidence["rules_evaluated"], 2)
+        self.assertEqual(result.evidence["failed_rule_ids"], ["rule_1"])
+
+        result = BusinessRulesGuard(rules[1:], fail_fast=True).check("short", ctx)
+        self.assertEqual(result.action, "allow")
+        self.assertEqual(result.evidence["rules_evaluated"], 2)
+
+        result = BusinessRulesGuard(rules, require_all=True).check("short", ctx)
+        self.assertEqual(result.evidence["rules_evaluated"], 4)
+        self.assertEqual(result.evidence["failed_rule_ids"], ["rule_1", "rule_3"])
+
+    def test_fail_fast_runs_cheap_rules_first(self):
+        """Test fail_fast evaluates cheaper rule types before patterns and custom rules."""
+        calls = []
+        rules = [
+            {
+                "id": "custom",
+                "type": "custom",
+                "validator": lambda data, ctx, config: calls.append(data) or True,
+            },
+            {"id": "pattern", "type": "pattern", "config": {"pattern": "^x"}},
+            {"id": "length", "type": "length", "config": {"max_length": 3}},
+        ]
+        ctx = Context()
+
+        result = BusinessRulesGuard(rules, require_all=True, fail_fast=True).check("long", ctx)
+        self.assertEqual(result.evidence["failed_rule_ids"], ["length"])
+        self.assertEqual(calls, [])
+
+        result = BusinessRulesGuard(rules, require_all=True).check("long", ctx)
+        self.assertEqual(
+            [r["rule_id"] for r in result.evidence["rule_results"]],
+            ["custom", "pattern", "length"],
+        )
+
+    def test_rule_config_prepared_once(self):
+        """Test patterns, bounds, value lists and time windows are prepared when rules are parsed."""
+        rules = [
+            {
+                "id": "status",
+                "type": "value_list",
+                "config": {"allowed_values": ["Approved", "Pending"], "case_sensitive": False},
+            },
+            {"id": "code", "type": "pattern", "config": {"pattern": r"^[a-z]+$"}},
+            {"id": "size", "type": "length", "config": {"max_length": 8}},
+        ]
+        guard = BusinessRulesGuard(rules=rules, require_all=True)
+        ctx = Context()
+
+        self.assertEqual(guard.rules[0]["allowed_values_lookup"], {"approved", "pending"})
+        self.assertEqual((guard.rules[2]["min_length"], guard.rules[2]["max_length"]), (None, 8))
+        self.assertEqual(rules[0]["config"]["allowed_values"], ["Approved", "Pending"])
+        self.assertEqual(guard.check("pending", ctx).action, "allow")
+        result = guard.check("APPROVED", ctx)
+        self.assertEqual(result.action, "deny")
+        self.assertEqual(result.evidence["failed_rule_ids"], ["code"])
+
+        with self.assertRaises(ValueError):
+            BusinessRulesGuard(
+                [
+                    {
+                        "id": "window",
+                        "type": "time_window",
+                        "config": {"start_time": "not a time", "end_time": "later"},
+                    }
+                ]
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,7 @@
 """Tests for the Context class."""
 
+import uuid
+
 from safellm.context import Context
 
 
@@ -83,3 +85,57 @@ class TestContext:
         assert "model='gpt-4'" in repr_str
         assert "user_role='admin'" in repr_str
         assert "purpose='test'" in repr_str
+
+    def test_memoize_reuses_value_for_same_text(self):
+        """Test memoize computes once per key and text."""
+        ctx = Context()
+        calls = []
+
+        def compute(text):
+            calls.append(text)
+            return text.lower()
+
+        assert ctx.memoize("lower", "Hello", compute) == "hello"
+        assert ctx.memoize("lower", "Hello", compute) == "hello"
+        assert calls == ["Hello"]
+
+    def test_memoize_recomputes_for_new_text(self):
+        """Test memoize does not serve values derived from other text."""
+        ctx = Context()
+
+        assert ctx.memoize("lower", "Hello", str.lower) == "hello"
+        assert ctx.memoize("lower", "WORLD", str.lower) == "world"
+        assert ctx.memoize("upper", "WORLD", str.upper) == "WORLD"
+
+    def test_slots_without_instance_dict(self):
+        """Test contexts keep their fields in slots and reject unknown attributes."""
+        ctx = Context(model="gpt-4")
+
+        assert not hasattr(ctx, "__dict__")
+        ctx.model = "gpt-4o"
+        assert ctx.model == "gpt-4o"
+        try:
+            ctx.unknown = True
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError("unknown attribute was accepted")
+
+    def test_copy_metadata_is_independent(self):
+        """Test a copy's metadata can change without touching the original."""
+        original = Context(metadata={"a": 1})
+        copy = original.copy()
+
+        copy.metadata["b"] = 2
+        assert original.metadata == {"a": 1}
+
+    def test_default_audit_ids_are_uuid4(self):
+        """Test generated audit IDs are distinct, canonical UUID4 strings."""
+        ids = {Context().audit_id for _ in range(100)}
+
+        assert len(ids) == 100
+        for audit_id in ids:
+            parsed = uuid.UUID(audit_id)
+            assert str(parsed) == audit_id
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
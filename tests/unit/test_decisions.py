@@ -1,6 +1,7 @@
 """Tests for decision types and validation errors."""
 
 import unittest
+import uuid
 
 from safellm.decisions import Decision, ValidationError
 
@@ -73,6 +74,16 @@ class TestDecision(unittest.TestCase):
         self.assertEqual(decision.output, data)
         self.assertIsNotNone(decision.audit_id)
 
+    def test_default_audit_ids_are_uuid4(self):
+        """Test decisions without an audit ID get distinct UUID4 strings."""
+        first = Decision.allow("data").audit_id
+        second = Decision.deny("data", ["reason"]).audit_id
+
+        self.assertNotEqual(first, second)
+        for audit_id in (first, second):
+            self.assertEqual(str(uuid.UUID(audit_id)), audit_id)
+            self.assertEqual(uuid.UUID(audit_id).version, 4)
+
 
 class TestValidationError(unittest.TestCase):
     """Test the ValidationError exception."""
@@ -1,5 +1,6 @@
 """Tests for the FormatGuard class."""
 
+import time
 import unittest
 
 from safellm.context import Context
@@ -29,6 +30,25 @@ class TestFormatGuard(unittest.TestCase):
         result = guard.check('{"key": value}', ctx)
         self.assertEqual(result.action, "deny")
 
+    def test_json_format_matches_stdlib(self):
+        """Test JSON validation accepts and reports errors exactly like the json module."""
+        guard = FormatGuard(format_type="json")
+        ctx = Context()
+
+        result = guard.check('{"nan": NaN, "big": 123456789012345678901234567890}', ctx)
+        self.assertEqual(result.action, "allow")
+        self.assertEqual(result.evidence["parsed_type"], "dict")
+
+        result = guard.check('{"key": value}', ctx)
+        self.assertEqual(result.evidence["error"], "Invalid JSON: Expecting value")
+        self.assertEqual((result.evidence["line"], result.evidence["column"]), (1, 9))
+
+        # Rejected without parsing, with the error the parser would have raised
+        result = guard.check("\n  plain prose", ctx)
+        self.assertEqual(result.evidence["error"], "Invalid JSON: Expecting value")
+        self.assertEqual((result.evidence["line"], result.evidence["column"]), (2, 3))
+        self.assertEqual(guard.check("   ", ctx).evidence["position"], 3)
+
     def test_email_format(self):
         """Test email format validation."""
         guard = FormatGuard(format_type="email")
@@ -42,6 +62,30 @@ class TestFormatGuard(unittest.TestCase):
         result = guard.check("invalid-email", ctx)
         self.assertEqual(result.action, "deny")
 
+    def test_email_edge_cases(self):
+        """Test email validation in strict and basic modes."""
+        ctx = Context()
+        strict = FormatGuard(format_type="email")
+        basic = FormatGuard(format_type="email", strict=False)
+
+        cases = [
+            ("first.last+tag@mail.example.org", True, True),
+            ("user@example.c0m", False, True),
+            ("user@.com", False, False),
+            ("user@example.", False, False),
+            ("us er@example.com", False, False),
+            ("a@b@example.com", False, False),
+            ("jos\u00e9@example.com", False, True),
+            ("user@example.com\n", True, True),
+        ]
+        for text, strict_ok, basic_ok in cases:
+            self.assertEqual(strict.check(text, ctx).action == "allow", strict_ok, text)
+            self.assertEqual(basic.check(text, ctx).action == "allow", basic_ok, text)
+
+        result = strict.check("user@example.com", ctx)
+        self.assertEqual(result.evidence["local_part"], "user")
+        self.assertEqual(result.evidence["domain"], "example.com")
+
     def test_url_format(self):
         """Test URL format validation."""
         guard = FormatGuard(format_type="url")
@@ -55,6 +99,17 @@ class TestFormatGuard(unittest.TestCase):
         result = guard.check("not-a-url", ctx)
         self.assertEqual(result.action, "deny")
 
+    def test_url_rejected_in_linear_time(self):
+        """Test long near-miss URLs are rejected without heavy backtracking."""
+        guard = FormatGuard(format_type="url")
+        ctx = Context()
+
+        start = time.perf_counter()
+        result = guard.check("http://" + "1" * 20000 + "!", ctx)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(result.action, "deny")
+        self.assertEqual(guard.check("http://example.com:8080/a/b?q=1#top", ctx).action, "allow")
+
     def test_custom_format(self):
         """Test custom format with regex pattern."""
         guard = FormatGuard(format_type="custom", pattern=r"^\d{3}-\d{3}-\d{4}$")
@@ -68,6 +123,14 @@ class TestFormatGuard(unittest.TestCase):
         result = guard.check("invalid-format", ctx)
         self.assertEqual(result.action, "deny")
 
+    def test_custom_pattern_shared(self):
+        """Test guards with the same custom pattern share one compiled regex."""
+        first = FormatGuard(format_type="custom", pattern=r"^[A-Z]{3}\d{4}$")
+        second = FormatGuard(format_type="custom", pattern=r"^[A-Z]{3}\d{4}$")
+
+        self.assertIs(first._compiled_pattern, second._compiled_pattern)
+        self.assertEqual(second.check("ABC1234", Context()).action, "allow")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -69,6 +69,31 @@ class TestHtmlSanitizerGuard(unittest.TestCase):
         result = guard.check("", ctx)
         self.assertEqual(result.action, "allow")
 
+    def test_cleaner_reused(self):
+        """Test the sanitizer is built once and reused across checks."""
+        guard = HtmlSanitizerGuard()
+        ctx = Context()
+
+        first = guard.check("<p>Hi</p><script>alert(1)</script>", ctx)
+        self.assertEqual(first.action, "transform")
+        self.assertNotIn("<script>", first.output)
+
+        if guard._has_bleach:
+            cleaner = guard._get_cleaner()
+            guard.check("<div>again</div>", ctx)
+            self.assertIs(guard._get_cleaner(), cleaner)
+
+    def test_basic_sanitizer(self):
+        """Test the fallback sanitizer used without bleach."""
+        guard = HtmlSanitizerGuard()
+
+        result, issues = guard._sanitize_basic('<p onclick="x()">Hi</p><!-- note --><div>a</div>')
+        self.assertEqual(result, "<p >Hi</p>a")
+        self.assertEqual(
+            [issue["type"] for issue in issues],
+            ["removed_dangerous_attribute", "removed_comments", "removed_disallowed_tag"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,8 @@
 """Tests for the LanguageGuard class."""
 
+import re
 import unittest
+from unittest import mock
 
 from safellm.context import Context
 from safellm.guards.language import LanguageGuard
@@ -37,6 +39,19 @@ class TestLanguageGuard(unittest.TestCase):
         result = guard.check("El gato está en la mesa", ctx)
         self.assertEqual(result.action, "allow")
 
+    def test_script_detection(self):
+        """Test script-based languages are found in non-ASCII text and skipped for ASCII."""
+        guard = LanguageGuard()
+
+        detected = [d["language"] for d in guard._detect_languages("这是中文文本")]
+        self.assertIn("chinese", detected)
+
+        with mock.patch.dict(
+            LanguageGuard.LANGUAGE_PATTERNS, {"chinese": mock.Mock(wraps=re.compile("x"))}
+        ):
+            guard._detect_languages("plain ascii text")
+            LanguageGuard.LANGUAGE_PATTERNS["chinese"].findall.assert_not_called()
+
     def test_confidence_threshold(self):
         """Test confidence threshold setting."""
         guard = LanguageGuard(allowed_languages=["english"], min_confidence=0.8)
@@ -162,3 +162,17 @@ class TestLengthGuard:
         guard_without_tokens = LengthGuard(max_chars=10)
         decision = guard_without_tokens.check("test text", ctx)
         assert "token_count" not in decision.evidence
+
+    def test_check_many_matches_check(self):
+        """Test batch checks give the same decisions as checking each input."""
+        inputs = ["", "ok", "just right", "much too long for this guard", 12345]
+        for guard in [LengthGuard(min_chars=2, max_chars=10), LengthGuard(max_tokens=2)]:
+            ctxs = [Context() for _ in inputs]
+            batch = guard.check_many(inputs, ctxs)
+            for decision, item, ctx in zip(batch, inputs, ctxs):
+                expected = guard.check(item, ctx)
+                assert decision.action == expected.action
+                assert decision.reasons == expected.reasons
+                assert decision.evidence == expected.evidence
+                assert decision.output == item
+                assert decision.audit_id == ctx.audit_id
@@ -0,0 +1,157 @@
+"""Tests for the pattern utilities."""
+
+import re
+import time
+import unittest
+
+from safellm.utils.patterns import (
+    ALL_PII_PATTERN,
+    EMAIL_PATTERN,
+    combine_patterns,
+    contains_profanity,
+    luhn_check,
+    mask_api_key,
+    mask_credit_card,
+    mask_email,
+    mask_phone,
+    mask_text,
+    normalize_leet_speak,
+    scan_pii,
+)
+
+
+class TestMasking(unittest.TestCase):
+    """Test the masking helpers."""
+
+    def test_mask_text(self):
+        """Test start and end characters stay visible."""
+        self.assertEqual(mask_text("abcdefgh"), "ab****gh")
+        self.assertEqual(mask_text("abc"), "***")
+        self.assertEqual(mask_text("abcdefgh", 1, 3, "#"), "a####fgh")
+
+    def test_mask_text_without_visible_end(self):
+        """Test end=0 masks through the end of the string instead of dropping it."""
+        self.assertEqual(mask_text("abcdefgh", 2, 0), "ab******")
+        self.assertEqual(mask_text("abcdefgh", 0, 0), "********")
+
+    def test_mask_email(self):
+        """Test the local part and domain name are masked, the extension kept."""
+        self.assertEqual(mask_email("john.doe@example.com"), "j*******@*******.com")
+        self.assertEqual(mask_email("root@localhost"), "r***@lo*****st")
+        self.assertEqual(mask_email("ab@mail.example.co.uk"), "a*@****.example.co.uk")
+
+    def test_mask_phone(self):
+        """Test phone numbers keep only their last digits."""
+        self.assertEqual(mask_phone("+1 (555) 123-4567"), "+1***-***67")
+        self.assertEqual(mask_phone("555-123-4567"), "***-***-67")
+
+    def test_mask_credit_card(self):
+        """Test card numbers keep only their last four digits."""
+        self.assertEqual(mask_credit_card("4111-1111-1111-1111"), "**** **** **** 1111")
+
+    def test_mask_api_key(self):
+        """Test API keys keep four characters on each side."""
+        self.assertEqual(mask_api_key("sk_live_abcdef123456"), "sk_l************3456")
+
+
+class TestLuhn(unittest.TestCase):
+    """Test the Luhn checksum."""
+
+    def test_luhn_check(self):
+        """Test valid and invalid card numbers."""
+        self.assertTrue(luhn_check("4111 1111 1111 1111"))
+        self.assertTrue(luhn_check("378282246310005"))
+        self.assertFalse(luhn_check("4111 1111 1111 1112"))
+        self.assertFalse(luhn_check("4111"))
+
+    def test_luhn_check_separators(self):
+        """Test any non-digit separator is ignored and only ASCII digits count."""
+        self.assertTrue(luhn_check("4111-1111-1111-1111"))
+        self.assertTrue(luhn_check("4111.1111/1111.1111"))
+        self.assertFalse(luhn_check("\u0664111 1111 1111 1111"))
+        self.assertFalse(luhn_check(""))
+
+
+class TestTextNormalization(unittest.TestCase):
+    """Test text normalization helpers."""
+
+    def test_normalize_leet_speak(self):
+        """Test leet characters map back to letters in one pass."""
+        self.assertEqual(normalize_leet_speak("B4DW0RD"), "badword")
+        self.assertEqual(normalize_leet_speak("h3ll0 @ll $1t3"), "hello all site")
+        self.assertEqual(normalize_leet_speak("\u00c9T\u00c9 1\u0130"), "\u00e9t\u00e9 ii\u0307")
+
+    def test_contains_profanity(self):
+        """Test profanity is found across leet speak and punctuation."""
+        self.assertTrue(contains_profanity("what a B@D-W0RD"))
+        self.assertTrue(contains_profanity("so inappropriate!"))
+        self.assertFalse(contains_profanity("a perfectly nice sentence"))
+
+
+class TestCombinePatterns(unittest.TestCase):
+    """Test merging patterns into one alternation."""
+
+    def test_mixed_case_sensitivity(self):
+        """Test case-insensitive patterns keep their flag inside the alternation."""
+        combined = combine_patterns([re.compile(r"AKIA\d+"), re.compile(r"secret", re.IGNORECASE)])
+
+        self.assertIsNotNone(combined)
+        self.assertTrue(combined.search("my SECRET"))
+        self.assertTrue(combined.search("AKIA123"))
+        self.assertFalse(combined.search("akia123"))
+
+    def test_unmergeable_patterns(self):
+        """Test patterns with other differing flags or backreferences aren't merged."""
+        self.assertIsNone(combine_patterns([re.compile("a"), re.compile("b", re.MULTILINE)]))
+        self.assertIsNone(combine_patterns([re.compile(r"(a)\1")]))
+        self.assertIsNone(combine_patterns([]))
+
+
+class TestScanPii(unittest.TestCase):
+    """Test the fused PII scan."""
+
+    def test_scan_pii(self):
+        """Test one pass reports each PII type with its span."""
+        text = "mail a@b.com, card 4111 1111 1111 1111, ip 10.0.0.1"
+        found = scan_pii(text)
+
+        self.assertEqual([f[0] for f in found], ["email", "credit_card", "ip_address"])
+        for _, start, end, value in found:
+            self.assertEqual(text[start:end], value)
+        self.assertEqual(scan_pii("no personal data"), [])
+
+    def test_scan_pii_matches_re_engine(self):
+        """Test the scanner engine reports what the fused re pattern finds."""
+        text = (
+            "ssn 123-45-6789, call +1 555 123 4567, key sk-" + "a" * 48 + ", "
+            "iban DE89370400440532013000 and ip 192.168.1.1 or mail me@example.org"
+        )
+        expected = [
+            (m.lastgroup, m.start(), m.end(), m.group()) for m in ALL_PII_PATTERN.finditer(text)
+        ]
+
+        self.assertEqual(scan_pii(text), expected)
+
+    def test_scan_pii_unicode_separators(self):
+        """Test PII split by non-ASCII whitespace is still found."""
+        self.assertEqual(
+            scan_pii("call 555\xa0123\xa04567"), [("phone", 5, 17, "555\xa0123\xa04567")]
+        )
+
+    def test_email_pattern(self):
+        """Test common address shapes still match in full."""
+        text = "mail first.last+tag@sub.example.co.uk or a@b.io"
+        self.assertEqual(
+            EMAIL_PATTERN.findall(text), ["first.last+tag@sub.example.co.uk", "a@b.io"]
+        )
+
+    def test_near_miss_inputs_scan_in_linear_time(self):
+        """Test long runs that almost look like PII don't trigger heavy backtracking."""
+        for text in ["123-" * 20000, "a." * 40000, "1." * 40000, "a:" * 40000, "+1 " * 20000]:
+            start = time.perf_counter()
+            list(ALL_PII_PATTERN.finditer(text))
+            self.assertLess(time.perf_counter() - start, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
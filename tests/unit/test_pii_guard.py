@@ -2,6 +2,7 @@
 
 import re
 import unittest
+from unittest import mock
 
 from safellm.context import Context
 from safellm.guards.pii import PiiRedactionGuard
@@ -84,6 +85,79 @@ class TestPiiRedactionGuard(unittest.TestCase):
         result = guard.check("", ctx)
         self.assertEqual(result.action, "allow")
 
+    def test_prescreen_skips_builtin_passes(self):
+        """Test text without PII skips the per-type passes but not custom patterns."""
+        guard = PiiRedactionGuard(targets=["email", "phone"], custom_patterns=[re.compile("zz")])
+        ctx = Context()
+
+        with mock.patch.object(guard, "_process_emails") as process_emails:
+            result = guard.check("nothing here but zz", ctx)
+        process_emails.assert_not_called()
+        self.assertEqual(result.evidence["pii_types"], ["custom"])
+
+        result = guard.check("mail user@example.com", ctx)
+        self.assertEqual(result.evidence["pii_types"], ["email"])
+
+    def test_prescreen_shared_between_guards(self):
+        """Test guards targeting the same PII types share one compiled prescreen."""
+        first = PiiRedactionGuard(targets=["email", "phone"])
+        second = PiiRedactionGuard(mode="remove", targets=["phone", "email", "address"])
+
+        self.assertIs(first._prescreen, second._prescreen)
+        self.assertIsNot(first._prescreen, PiiRedactionGuard(targets=["email"])._prescreen)
+
+    def test_check_many_matches_check(self):
+        """Test the batch prescreen gives the same decisions as checking one by one."""
+        items = [
+            "nothing to see here",
+            "mail user@example.com or call 555-123-4567",
+            "",
+            4111111111111111,
+            "card 4111\0 1111 1111 1111",
+            "ip 192.168.0.1",
+            "call 555\xa0123\xa04567",
+        ]
+        ctxs = [Context() for _ in items]
+
+        for guard in (
+            PiiRedactionGuard(),
+            PiiRedactionGuard(targets=["email", "address"]),
+            PiiRedactionGuard(custom_patterns=[re.compile("see")]),
+        ):
+            self.assertEqual(
+                guard.check_many(items, ctxs),
+                [guard.check(item, ctx) for item, ctx in zip(items, ctxs)],
+            )
+
+    def test_unicode_separators_redacted(self):
+        """Test PII split by Unicode or control whitespace is still found."""
+        guard = PiiRedactionGuard(mode="remove")
+        ctx = Context()
+
+        for text in ["call 555\xa0123\xa04567", "call 555\u2003123 4567", "ssn 123\x0b45 6789"]:
+            result = guard.check(text, ctx)
+            self.assertEqual(result.action, "transform", repr(text))
+
+    def test_redacts_matched_spans(self):
+        """Test redaction replaces the matched span, not an earlier copy of its text."""
+        guard = PiiRedactionGuard(mode="remove", custom_patterns=[re.compile(r"\bcat\b")])
+        ctx = Context()
+
+        result = guard.check("concatenate the cat, then the cat", ctx)
+        self.assertEqual(
+            result.output, "concatenate the [CUSTOM_REMOVED], then the [CUSTOM_REMOVED]"
+        )
+        self.assertEqual(result.evidence["detection_count"], 2)
+
+    def test_overlapping_matches_redacted_once(self):
+        """Test overlapping matches of one type are all reported but redacted once."""
+        guard = PiiRedactionGuard(mode="remove", targets=["phone"])
+        ctx = Context()
+
+        result = guard.check("call 5551234567 now", ctx)
+        self.assertEqual(result.output, "call [PHONE_REMOVED] now")
+        self.assertEqual(result.evidence["detection_count"], 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,17 @@
 """Tests for the Pipeline class."""
 
+import asyncio
+import logging
+import threading
 import unittest
+from unittest import mock
 
 from safellm.context import Context
 from safellm.decisions import Decision
-from safellm.guard import BaseGuard
+from safellm.guard import AsyncGuard, BaseGuard
 from safellm.guards.length import LengthGuard
-from safellm.pipeline import Pipeline
+from safellm.guards.toxicity import ToxicityGuard
+from safellm.pipeline import Pipeline, _PipelineRun
 
 
 class MockPassGuard(BaseGuard):
@@ -53,12 +58,12 @@ class MockTransformGuard(BaseGuard):
         return self._name
 
     def check(self, data, ctx):
-        transformed = self.transform_func(str(data))
+        text = str(data)
         return Decision.transform(
             original=data,
-            transformed=transformed,
+            transformed=self.transform_func(text),
             reasons=[f"Transformed by {self.name}"],
-            evidence={"guard": self.name, "original": str(data)},
+            evidence={"guard": self.name, "original": text},
         )
 
 
@@ -91,6 +96,42 @@ class MockErrorGuard(BaseGuard):
         raise ValueError("Mock error for testing")
 
 
+class MockHandshakeGuard(AsyncGuard):
+    """Read-only async guard that waits for its peer before deciding."""
+
+    readonly = True
+
+    def __init__(self, name, own_event, peer_event):
+        self._name = name
+        self.own_event = own_event
+        self.peer_event = peer_event
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    async def acheck(self, data, ctx):
+        self.own_event.set()
+        # Only completes if the peer guard is running at the same time
+        await asyncio.wait_for(self.peer_event.wait(), timeout=1)
+        return Decision.allow(output=data, evidence={self.name: True})
+
+
+class MockLoopRecordingGuard(AsyncGuard):
+    """Async guard that records the event loop each check runs on."""
+
+    def __init__(self):
+        self.loops = []
+
+    @property
+    def name(self) -> str:
+        return "loop_recording"
+
+    async def acheck(self, data, ctx):
+        self.loops.append(asyncio.get_running_loop())
+        return Decision.allow(output=data)
+
+
 class TestPipeline(unittest.TestCase):
     """Test the Pipeline class."""
 
@@ -255,9 +296,262 @@ class TestPipeline(unittest.TestCase):
         guards = [MockPassGuard("async_guard1"), MockPassGuard("async_guard2")]
         pipeline = Pipeline("test_pipeline", guards)
 
-        # Just test that the method exists and is callable
-        self.assertTrue(hasattr(pipeline, "avalidate"))
-        self.assertTrue(callable(pipeline.avalidate))
+        result = asyncio.run(self._avalidate(pipeline, "hello"))
+
+        self.assertEqual(result.action, "allow")
+        self.assertEqual(result.output, "hello")
+
+    def test_step_groups_split_on_writers(self):
+        """Test consecutive read-only guards are grouped together."""
+        readonly1 = LengthGuard(max_chars=100)
+        readonly2 = LengthGuard(min_chars=1)
+        writer = MockTransformGuard()
+        pipeline = Pipeline("test_pipeline", [readonly1, readonly2, writer, readonly1])
+
+        groups = [[guard for _, guard in group] for group in pipeline._step_groups()]
+        self.assertEqual(groups, [[readonly1, readonly2], [writer], [readonly1]])
+
+        # Grouped once at construction, not on every validation
+        self.assertEqual([[guard for _, guard in group] for group in pipeline._groups], groups)
+        with mock.patch.object(pipeline, "_step_groups") as step_groups:
+            pipeline.validate("hello")
+        step_groups.assert_not_called()
+
+    def test_optimize_orders_readonly_guards_by_cost(self):
+        """Test optimize moves cheap read-only guards forward without crossing writers."""
+        toxicity = ToxicityGuard()
+        length = LengthGuard(max_chars=5)
+        writer = MockTransformGuard()
+        late_toxicity = ToxicityGuard()
+        late_length = LengthGuard(min_chars=1)
+        steps = [toxicity, length, writer, late_toxicity, late_length]
+
+        self.assertEqual(Pipeline("plain", steps).steps, steps)
+        pipeline = Pipeline("optimized", steps, optimize=True)
+        self.assertEqual(pipeline.steps, [length, toxicity, writer, late_length, late_toxicity])
+
+        with mock.patch.object(toxicity, "check", wraps=toxicity.check) as check:
+            result = pipeline.validate("hello world")
+        self.assertEqual(result.action, "deny")
+        check.assert_not_called()
+
+    def test_validate_many_matches_validate(self):
+        """Test batch validation gives each input the decision validate() gives it."""
+        steps = [LengthGuard(max_chars=8), MockTransformGuard(), MockErrorGuard()]
+        inputs = ["short", "far too long here", "mid", ""]
+        pipeline = Pipeline("test_pipeline", steps, fail_fast=False, on_error="allow")
+
+        batch = pipeline.validate_many(inputs)
+        single = [pipeline.validate(data) for data in inputs]
+
+        for got, expected in zip(batch, single):
+            self.assertEqual(
+                (got.action, got.output, got.reasons, got.evidence),
+                (expected.action, expected.output, expected.reasons, expected.evidence),
+            )
+
+    def test_validate_many_batches_pure_guards(self):
+        """Test pure guards see the inputs still in play in one call, with their contexts."""
+        length = LengthGuard(max_chars=5)
+        pipeline = Pipeline("test_pipeline", [length, LengthGuard(min_chars=3)])
+        ctxs = [Context(), Context(), Context()]
+
+        with mock.patch.object(length, "check_many", wraps=length.check_many) as check_many:
+            results = pipeline.validate_many(["hello", "hello world", "hi"], ctxs=ctxs)
+        check_many.assert_called_once()
+        self.assertEqual([r.action for r in results], ["allow", "deny", "deny"])
+        self.assertEqual([r.audit_id for r in results], [ctx.audit_id for ctx in ctxs])
+
+        with self.assertRaises(ValueError):
+            pipeline.validate_many(["a", "b"], ctxs=ctxs)
+
+    def test_validate_many_falls_back_when_check_many_fails(self):
+        """Test a failing or short check_many() reruns input by input, logging each step once."""
+        inputs = ["hello", "hello world", "hi"]
+        expected = [
+            Pipeline("test_pipeline", [LengthGuard(max_chars=5)]).validate(data).action
+            for data in inputs
+        ]
+
+        for side_effect in (RuntimeError("batch failed"), [[]]):
+            length = LengthGuard(max_chars=5)
+            pipeline = Pipeline("test_pipeline", [length])
+            with mock.patch.object(length, "check_many", side_effect=side_effect):
+                with self.assertLogs("safellm.pipeline", level="DEBUG") as logs:
+                    results = pipeline.validate_many(inputs)
+
+            self.assertEqual([r.action for r in results], expected)
+            steps = [line for line in logs.output if "Running guard" in line]
+            self.assertEqual(len(steps), len(inputs))
+
+    def test_run_state_uses_slots(self):
+        """Test per-validation run state is kept in slots rather than an instance dict."""
+        pipeline = Pipeline("test_pipeline", [MockPassGuard("guard1")])
+        run = _PipelineRun(pipeline, "data", Context())
+
+        self.assertFalse(hasattr(run, "__dict__"))
+        self.assertEqual(run.n_steps, 1)
+
+    def test_cache_reuses_pure_guard_decisions(self):
+        """Test pure guards run once per input while impure guards always run."""
+        pure = LengthGuard(max_chars=5)
+        impure = MockPassGuard()
+        pipeline = Pipeline("cached", [impure, pure], fail_fast=False, cache_size=1)
+
+        with (
+            mock.patch.object(pure, "check", wraps=pure.check) as pure_check,
+            mock.patch.object(impure, "check", wraps=impure.check) as impure_check,
+        ):
+            first = pipeline.validate("too long", ctx=Context(audit_id="first"))
+            second = pipeline.validate("too long", ctx=Context(audit_id="second"))
+            pipeline.validate("short", ctx=Context())
+            pipeline.validate("too long", ctx=Context())
+
+        self.assertEqual(pure_check.call_count, 3)
+        self.assertEqual(impure_check.call_count, 4)
+        self.assertEqual(second.reasons, first.reasons)
+        self.assertEqual(second.audit_id, "second")
+
+        uncached = Pipeline("uncached", [pure])
+        uncached.validate("short")
+        self.assertEqual(len(uncached._cache), 0)
+
+    def test_validate_parallel_matches_sequential(self):
+        """Test running read-only guards on a thread pool gives the same decision."""
+        steps = [
+            LengthGuard(max_chars=100),
+            LengthGuard(min_chars=1),
+            MockTransformGuard(),
+            LengthGuard(max_chars=5),
+        ]
+        sequential = Pipeline("sequential", steps, fail_fast=False)
+        parallel = Pipeline("parallel", steps, fail_fast=False, max_workers=4)
+
+        expected = sequential.validate("hello world")
+        result = parallel.validate("hello world")
+
+        self.assertEqual(result.action, expected.action)
+        self.assertEqual(result.output, expected.output)
+        self.assertEqual(result.reasons, expected.reasons)
+
+    def test_validate_parallel_keeps_step_order(self):
+        """Test the first denying read-only guard decides the result."""
+        steps = [LengthGuard(max_chars=5), LengthGuard(min_chars=50)]
+        pipeline = Pipeline("test_pipeline", steps, max_workers=2)
+
+        result = pipeline.validate("hello world")
+
+        self.assertEqual(result.action, "deny")
+        self.assertEqual(result.reasons, steps[0].check("hello world", Context()).reasons)
+
+    def test_close_shuts_down_executor(self):
+        """Test closing a pipeline stops its thread pool and falls back to running in turn."""
+        steps = [LengthGuard(max_chars=5), LengthGuard(min_chars=50)]
+
+        with Pipeline("test_pipeline", steps, max_workers=2) as pipeline:
+            executor = pipeline._executor
+            self.assertEqual(pipeline.validate("hello world").action, "deny")
+
+        self.assertIsNone(pipeline._executor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(print)
+        self.assertEqual(pipeline.validate("hello world").action, "deny")
+        pipeline.close()
+
+    async def _avalidate(self, pipeline, data):
+        return await pipeline.avalidate(data)
+
+    def test_async_guard_sync_check_reuses_loop(self):
+        """Test sync checks of an async guard share one event loop per thread."""
+        guard = MockLoopRecordingGuard()
+        ctx = Context()
+
+        self.assertEqual(guard.check("one", ctx).action, "allow")
+        self.assertEqual(guard.check("two", ctx).action, "allow")
+        self.assertIs(guard.loops[0], guard.loops[1])
+
+        async def check_inside_loop():
+            with self.assertRaisesRegex(RuntimeError, "Use acheck"):
+                guard.check("three", ctx)
+
+        asyncio.run(check_inside_loop())
+
+    def test_sync_check_loop_closed_with_thread(self):
+        """Test the loop a thread ran sync checks on is closed once the thread exits."""
+        guard = MockLoopRecordingGuard()
+        thread = threading.Thread(target=guard.check, args=("one", Context()))
+        thread.start()
+        thread.join()
+
+        self.assertTrue(guard.loops[0].is_closed())
+
+    def test_avalidate_readonly_group(self):
+        """Test read-only guards awaited together still apply in order."""
+        steps = [LengthGuard(max_chars=100), MockTransformGuard(), LengthGuard(max_chars=100)]
+        pipeline = Pipeline("test_pipeline", steps)
+
+        result = asyncio.run(self._avalidate(pipeline, "hello"))
+
+        self.assertEqual(result.action, "transform")
+        self.assertEqual(result.output, "HELLO")
+
+    def test_avalidate_awaits_readonly_guards_concurrently(self):
+        """Test read-only async guards run at the same time."""
+
+        async def run():
+            first, second = asyncio.Event(), asyncio.Event()
+            steps = [
+                MockHandshakeGuard("first", first, second),
+                MockHandshakeGuard("second", second, first),
+            ]
+            return await Pipeline("test_pipeline", steps).avalidate("hello")
+
+        result = asyncio.run(run())
+
+        self.assertEqual(result.action, "allow")
+        self.assertEqual(result.evidence, {"first": True, "second": True})
+
+    def test_avalidate_readonly_group_exception(self):
+        """Test an exception inside a concurrent group is handled like a sequential one."""
+        guard = MockErrorGuard()
+        guard.readonly = True
+        steps = [LengthGuard(max_chars=100), guard, LengthGuard(max_chars=1)]
+        pipeline = Pipeline("test_pipeline", steps, fail_fast=False)
+
+        result = asyncio.run(self._avalidate(pipeline, "hello"))
+
+        self.assertEqual(result.action, "deny")
+        self.assertEqual(len(result.reasons), 1)
+        self.assertIn("error_guard failed", result.reasons[0])
+
+    def test_validate_debug_logging(self):
+        """Test step logging is formatted only when debug logging is enabled."""
+        pipeline = Pipeline("test_pipeline", [MockPassGuard("guard1"), MockPassGuard("guard2")])
+
+        with self.assertLogs("safellm.pipeline", level="DEBUG") as logs:
+            pipeline.validate("hello")
+
+        self.assertIn("Running guard guard2 (step 2/2)", logs.output[-1])
+
+        pipeline_logger = logging.getLogger("safellm.pipeline")
+        with mock.patch.object(pipeline_logger, "isEnabledFor", return_value=False):
+            with mock.patch.object(pipeline_logger, "debug") as debug:
+                pipeline.validate("hello")
+        self.assertEqual(debug.call_count, 1)  # only the pipeline start message
+
+    def test_validate_decision_logging_disabled(self):
+        """Test deny and retry messages aren't built when INFO logging is off."""
+        pipeline = Pipeline("test_pipeline", [MockFailGuard()], fail_fast=False)
+        pipeline_logger = logging.getLogger("safellm.pipeline")
+
+        with mock.patch.object(pipeline_logger, "isEnabledFor", return_value=False):
+            with mock.patch.object(pipeline_logger, "info") as info:
+                pipeline.validate("hello")
+        info.assert_not_called()
+
+        with self.assertLogs("safellm.pipeline", level="INFO") as logs:
+            pipeline.validate("hello")
+        self.assertIn("Guard fail_guard denied request: fail_guard rejected", logs.output[0])
 
 
 if __name__ == "__main__":
@@ -67,6 +67,25 @@ class TestPrivacyComplianceGuard(unittest.TestCase):
         result = guard.check("This is normal business content", ctx)
         self.assertEqual(result.action, "allow")
 
+    def test_prescreen_matches_per_pattern_scan(self):
+        """Test the combined prescreen finds the same issues as the per-pattern scan."""
+        guard = PrivacyComplianceGuard()
+        unscreened = PrivacyComplianceGuard()
+        unscreened._prescreen = None
+
+        texts = [
+            "This is normal business content",
+            "The patient's medical record lists the diagnosis",
+            "Medical\u00a0record and income\x1cdetails",
+            "medical\x0brecord",
+            "Salary and bank account information",
+            "",
+        ]
+        for text in texts:
+            self.assertEqual(
+                guard._detect_privacy_issues(text), unscreened._detect_privacy_issues(text)
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
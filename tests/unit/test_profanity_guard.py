@@ -1,6 +1,7 @@
 """Tests for the ProfanityGuard class."""
 
 import unittest
+from unittest import mock
 
 from safellm.context import Context
 from safellm.guards.profanity import ProfanityGuard
@@ -80,6 +81,47 @@ class TestProfanityGuard(unittest.TestCase):
             # Guard doesn't support custom_words parameter
             pass
 
+    def test_prescreen_skips_clean_text(self):
+        """Test clean text is cleared without checking word by word."""
+        guard = ProfanityGuard()
+        ctx = Context()
+
+        with mock.patch.object(guard, "_is_profanity") as is_profanity:
+            result = guard.check("A perfectly polite sentence.", ctx)
+        is_profanity.assert_not_called()
+        self.assertEqual(result.evidence["detection_count"], 0)
+
+    def test_custom_words_survive_prescreen(self):
+        """Test custom words are still found once the prescreen lets text through."""
+        guard = ProfanityGuard(action="block", custom_words={"frak"}, allowlist={"badword"})
+        ctx = Context()
+
+        self.assertEqual(guard.check("oh frak!", ctx).action, "deny")
+        self.assertEqual(guard.check("badword", ctx).action, "allow")
+        self.assertEqual(guard.check("fr ak", ctx).action, "allow")
+
+    def test_custom_word_scanner_shared(self):
+        """Test guards with the same custom words share one compiled scanner."""
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        words = {f"zq{a}{b}x" for a in letters for b in letters} | {"gröss"}
+        first = ProfanityGuard(action="block", custom_words=set(words))
+        second = ProfanityGuard(action="block", custom_words=set(words))
+        ctx = Context()
+
+        self.assertIs(first._custom_pattern, second._custom_pattern)
+        self.assertEqual(first.check("well zqmnx then", ctx).action, "deny")
+        self.assertEqual(first.check("so Gröss!", ctx).action, "deny")
+        self.assertEqual(first.check("zqmn", ctx).action, "allow")
+
+    def test_repeated_words_masked_in_place(self):
+        """Test each occurrence of a repeated word is located and masked separately."""
+        guard = ProfanityGuard()
+        ctx = Context()
+
+        result = guard.check("badword, b4dword and badword", ctx)
+        self.assertEqual(result.output, "b******* b****** and b******")
+        self.assertEqual([d["start"] for d in result.evidence["detections"]], [0, 9, 21])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,7 @@
 """Tests for the RateLimitGuard class."""
 
-import time
 import unittest
+from unittest import mock
 
 from safellm.context import Context
 from safellm.guards.rate_limit import RateLimitGuard
@@ -49,16 +49,53 @@ class TestRateLimitGuard(unittest.TestCase):
         guard = RateLimitGuard(max_requests=1, window_seconds=1)
         ctx = Context()
 
-        # First request
-        result = guard.check("request 1", ctx)
-        self.assertEqual(result.action, "allow")
+        with mock.patch("safellm.guards.rate_limit.time") as clock:
+            # First request
+            clock.time.return_value = clock.monotonic.return_value = 100.0
+            result = guard.check("request 1", ctx)
+            self.assertEqual(result.action, "allow")
 
-        # Wait for window to reset
-        time.sleep(1.1)
+            # Move past the window instead of sleeping through it
+            clock.time.return_value = clock.monotonic.return_value = 101.1
 
-        # Should be allowed again
-        result = guard.check("request 2", ctx)
-        self.assertEqual(result.action, "allow")
+            # Should be allowed again
+            result = guard.check("request 2", ctx)
+            self.assertEqual(result.action, "allow")
+
+    def test_window_ignores_wall_clock_jumps(self):
+        """Test setting the system clock forward doesn't reset the request window."""
+        guard = RateLimitGuard(max_requests=1, window_seconds=10, block_duration=0)
+        ctx = Context()
+
+        with mock.patch("safellm.guards.rate_limit.time") as clock:
+            clock.time.return_value = clock.monotonic.return_value = 100.0
+            self.assertEqual(guard.check("request 1", ctx).action, "allow")
+
+            clock.time.return_value = 100000.0
+            clock.monotonic.return_value = 101.0
+            self.assertEqual(guard.check("request 2", ctx).action, "deny")
+
+    def test_block_ignores_wall_clock_jumps(self):
+        """Test setting the system clock forward or back doesn't change how long a block lasts."""
+        for jump in (100000.0, -100000.0):
+            guard = RateLimitGuard(max_requests=1, window_seconds=10, block_duration=60)
+            ctx = Context()
+
+            with mock.patch("safellm.guards.rate_limit.time") as clock:
+                clock.time.return_value = clock.monotonic.return_value = 100.0
+                self.assertEqual(guard.check("request 1", ctx).action, "allow")
+                self.assertEqual(guard.check("request 2", ctx).action, "deny")
+
+                clock.time.return_value = 130.0 + jump
+                clock.monotonic.return_value = 130.0
+                result = guard.check("request 3", ctx)
+                self.assertEqual(result.action, "deny")
+                self.assertEqual(result.evidence["remaining_seconds"], 30)
+                self.assertEqual(result.evidence["blocked_until"], 160.0 + jump)
+
+                clock.time.return_value = 161.0 + jump
+                clock.monotonic.return_value = 161.0
+                self.assertEqual(guard.check("request 4", ctx).action, "allow")
 
     def test_different_keys(self):
         """Test rate limiting with different keys."""
@@ -82,6 +119,92 @@ class TestRateLimitGuard(unittest.TestCase):
         result = guard.check("request", ctx)
         self.assertEqual(result.action, "deny")
 
+    def test_token_bucket(self):
+        """Test the token bucket allows a burst, then refills over time."""
+        guard = RateLimitGuard(
+            max_requests=2, window_seconds=10, block_duration=0, algorithm="token_bucket"
+        )
+        ctx = Context()
+
+        with mock.patch("safellm.guards.rate_limit.time") as clock:
+            clock.time.return_value = clock.monotonic.return_value = 100.0
+            self.assertEqual(guard.check("request 1", ctx).action, "allow")
+            self.assertEqual(guard.check("request 2", ctx).action, "allow")
+            self.assertEqual(guard.check("request 3", ctx).action, "deny")
+
+            # Two requests per ten seconds refill one token every five seconds
+            clock.time.return_value = clock.monotonic.return_value = 105.0
+            result = guard.check("request 4", ctx)
+            self.assertEqual(result.action, "allow")
+            self.assertEqual(result.evidence["requests_remaining"], 0)
+            self.assertEqual(guard.check("request 5", ctx).action, "deny")
+
+    def test_bucketed_window(self):
+        """Test the bucketed window expires requests a tenth of a window at a time."""
+        guard = RateLimitGuard(
+            max_requests=2, window_seconds=10, block_duration=0, algorithm="bucketed_window"
+        )
+        ctx = Context()
+
+        with mock.patch("safellm.guards.rate_limit.time") as clock:
+            clock.time.return_value = clock.monotonic.return_value = 100.0
+            self.assertEqual(guard.check("request 1", ctx).action, "allow")
+            clock.time.return_value = clock.monotonic.return_value = 105.0
+            self.assertEqual(guard.check("request 2", ctx).action, "allow")
+            self.assertEqual(guard.check("request 3", ctx).action, "deny")
+
+            # The first request's interval has left the window, the second's hasn't
+            clock.time.return_value = clock.monotonic.return_value = 110.0
+            result = guard.check("request 4", ctx)
+            self.assertEqual(result.action, "allow")
+            self.assertEqual(result.evidence["requests_in_window"], 2)
+            self.assertEqual(guard.check("request 5", ctx).action, "deny")
+
+            # Long idle periods clear every interval
+            clock.time.return_value = clock.monotonic.return_value = 1000.0
+            self.assertEqual(guard.check("request 6", ctx).evidence["requests_in_window"], 1)
+
+    def test_idle_keys_evicted(self):
+        """Test keys idle for a whole window are dropped once enough keys pile up."""
+        for algorithm in ("sliding_window", "token_bucket", "bucketed_window"):
+            guard = RateLimitGuard(
+                max_requests=5, window_seconds=10, key_extractor="audit_id", algorithm=algorithm
+            )
+            with mock.patch("safellm.guards.rate_limit.time") as clock:
+                clock.time.return_value = clock.monotonic.return_value = 100.0
+                for _ in range(guard._MIN_SWEEP_AT):
+                    guard.check("request", Context())
+
+                clock.time.return_value = clock.monotonic.return_value = 200.0
+                guard.check("request", Context())
+
+            self.assertEqual(guard._tracked_keys(), 1)
+
+    def test_sampling(self):
+        """Test sampled requests count several times and the rest skip accounting."""
+        for algorithm in ("sliding_window", "token_bucket", "bucketed_window"):
+            guard = RateLimitGuard(max_requests=8, sample_rate=4, algorithm=algorithm)
+            ctx = Context()
+
+            with mock.patch("safellm.guards.rate_limit.random.random", return_value=0.5):
+                result = guard.check("request", ctx)
+            self.assertEqual(result.action, "allow")
+            self.assertFalse(result.evidence["sampled"])
+
+            with mock.patch("safellm.guards.rate_limit.random.random", return_value=0.0):
+                self.assertEqual(guard.check("request", ctx).action, "allow")
+                self.assertEqual(guard.check("request", ctx).action, "allow")
+                self.assertEqual(guard.check("request", ctx).action, "deny")
+
+            # Blocked keys are denied even when the request isn't sampled
+            with mock.patch("safellm.guards.rate_limit.random.random", return_value=0.5):
+                self.assertEqual(guard.check("request", ctx).action, "deny")
+
+        with self.assertRaises(ValueError):
+            RateLimitGuard(sample_rate=0)
+        with self.assertRaises(ValueError):
+            RateLimitGuard(max_requests=3, sample_rate=4)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -89,6 +89,92 @@ class TestSchemaGuard(unittest.TestCase):
         result = guard.check('{"anything": "goes"}', ctx)
         self.assertEqual(result.action, "allow")
 
+    def test_json_accepted_by_stdlib_only(self):
+        """Test documents only the stdlib parser accepts are still valid."""
+        guard = SchemaGuard.from_json_schema({"type": "object"})
+        ctx = Context()
+
+        result = guard.check('{"big": 123456789012345678901234567890, "nan": NaN}', ctx)
+        self.assertEqual(result.action, "allow")
+        self.assertEqual(result.output["big"], 123456789012345678901234567890)
+
+    def test_integers_beyond_64_bits_stay_exact(self):
+        """Test integers too big for 64 bits parse as exact ints, not floats."""
+        guard = SchemaGuard.from_json_schema(
+            {"type": "object", "properties": {"n": {"type": "integer"}}}
+        )
+
+        result = guard.check('{"n": 18446744073709551617}', Context())
+        self.assertEqual(result.action, "allow")
+        self.assertEqual(result.output, {"n": 18446744073709551617})
+
+    def test_equal_schemas_share_validator(self):
+        """Test guards built from equal schemas reuse one compiled validator."""
+        first = SchemaGuard.from_json_schema({"type": "object", "required": ["id"]})
+        second = SchemaGuard.from_json_schema({"required": ["id"], "type": "object"})
+        other = SchemaGuard.from_json_schema({"type": "array"})
+
+        self.assertIs(first.validator, second.validator)
+        self.assertIsNot(first.validator, other.validator)
+        self.assertEqual(second.check('{"name": "x"}', Context()).action, "deny")
+
+    def test_simple_schema_fast_check(self):
+        """Test simple schemas skip the validator for valid data and match it otherwise."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "count": {"type": "integer"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["count"],
+            "additionalProperties": False,
+        }
+        guard = SchemaGuard.from_json_schema(schema)
+        ctx = Context()
+
+        self.assertIsNotNone(guard._fast_check)
+        self.assertTrue(guard._fast_check({"count": 1, "tags": ["a"]}))
+        # Integral floats are valid integers; the full validator decides those
+        self.assertFalse(guard._fast_check({"count": 1.0}))
+        self.assertEqual(guard.check('{"count": 1.0}', ctx).action, "allow")
+        self.assertEqual(guard.check('{"count": 1, "tags": [2]}', ctx).action, "deny")
+        self.assertEqual(guard.check('{"count": 1, "extra": 2}', ctx).action, "deny")
+        self.assertEqual(guard.check("[]", ctx).action, "deny")
+
+        # Other keywords get the full validator only
+        self.assertIsNone(SchemaGuard.from_json_schema({"minLength": 2})._fast_check)
+
+    def test_pydantic_model(self):
+        """Test validation against a Pydantic model."""
+        from pydantic import BaseModel
+
+        class User(BaseModel):
+            name: str
+            age: int
+
+        guard = SchemaGuard.from_model(User)
+        ctx = Context()
+
+        result = guard.check('{"name": "John", "age": 30}', ctx)
+        self.assertEqual(result.action, "allow")
+        self.assertEqual(result.output, {"name": "John", "age": 30})
+
+        result = guard.check({"name": "John", "age": "old"}, ctx)
+        self.assertEqual(result.action, "deny")
+        self.assertEqual(result.evidence["model_name"], "User")
+        self.assertEqual(result.evidence["validation_errors"][0]["path"], ["age"])
+
+    def test_pydantic_integers_beyond_64_bits(self):
+        """Test a valid integer too big for 64 bits passes a Pydantic int field."""
+        from pydantic import BaseModel
+
+        class Counter(BaseModel):
+            n: int
+
+        result = SchemaGuard.from_model(Counter).check('{"n": 18446744073709551617}', Context())
+        self.assertEqual(result.action, "allow")
+        self.assertEqual(result.output, {"n": 18446744073709551617})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -77,6 +77,90 @@ class TestSimilarityGuard(unittest.TestCase):
         result = guard_lenient.check("Completely different text", ctx)
         self.assertEqual(result.action, "allow")
 
+    def test_fuzzy_similarity_score(self):
+        """Test the best fuzzy match is reported with its Jaccard score."""
+        guard = SimilarityGuard(similarity_threshold=0.5, action="block")
+        ctx = Context()
+
+        guard.check("red green blue yellow", ctx)
+        guard.check("one two three", ctx)
+
+        result = guard.check("red green blue purple", ctx)
+        self.assertEqual(result.action, "deny")
+        self.assertEqual(result.evidence["duplicate_type"], "fuzzy")
+        self.assertAlmostEqual(result.evidence["similarity_score"], 3 / 5)
+
+    def test_history_evicts_least_recently_used(self):
+        """Test recently matched content survives eviction."""
+        guard = SimilarityGuard(max_history_size=2, use_fuzzy_matching=False, action="block")
+        ctx = Context()
+
+        guard.check("first message", ctx)
+        guard.check("second message", ctx)
+        # Touch the first entry so the second becomes the eviction candidate
+        self.assertEqual(guard.check("first message", ctx).action, "deny")
+        guard.check("third message", ctx)
+
+        self.assertEqual(guard.check("first message", ctx).action, "deny")
+        self.assertEqual(guard.check("second message", ctx).action, "allow")
+        self.assertLessEqual(len(guard.normalized_content), 2)
+
+    def test_token_index_tracks_history(self):
+        """Test only entries sharing a token are candidates and evictions leave the index."""
+        guard = SimilarityGuard(similarity_threshold=0.5, max_history_size=2)
+        ctx = Context()
+
+        first = guard.check("red green blue", ctx)
+        guard.check("one two three", ctx)
+        self.assertEqual(guard._postings["red"], {first.evidence["normalized_hash"]})
+
+        result = guard.check("red green purple", ctx)
+        self.assertEqual(result.evidence["similar_hash"], first.evidence["normalized_hash"])
+        self.assertEqual(result.evidence["similar_audit_id"], ctx.audit_id)
+        self.assertIsNone(guard._find_similar_content("four five six"))
+
+        # The third check evicted "one two three" and its tokens
+        self.assertNotIn("one", guard._postings)
+        self.assertEqual(set(guard._token_sets), set(guard._store_order))
+
+    def test_threshold_prefix_filter(self):
+        """Test the prefix-filtered lookup finds the same match as a full scan."""
+        guard = SimilarityGuard(similarity_threshold=0.6)
+        ctx = Context()
+        for text in ["common red green", "common blue", "common red green blue", "other words"]:
+            guard.check(text, ctx)
+
+        query = "common red green yellow"
+        full = guard._find_similar_content(query)
+        filtered = guard._find_similar_content(query, 0.6)
+        self.assertEqual(filtered["hash"], full["hash"])
+        self.assertEqual(filtered["similarity"], 0.75)
+        self.assertLess(guard._find_similar_content("common", 0.6)["similarity"], 0.6)
+
+    def test_normalized_input_hashed_once(self):
+        """Test already-normalized text reuses its content hash as the normalized hash."""
+        guard = SimilarityGuard()
+        ctx = Context()
+
+        result = guard.check("hello world", ctx)
+        self.assertEqual(result.evidence["content_hash"], result.evidence["normalized_hash"])
+
+        result = guard.check("Hello, World!", ctx)
+        self.assertNotEqual(result.evidence["content_hash"], result.evidence["normalized_hash"])
+        self.assertEqual(result.evidence["duplicate_type"], "fuzzy")
+
+    def test_eviction_keeps_shared_normalized_content(self):
+        """Test evicting one entry keeps normalized text another stored entry still uses."""
+        guard = SimilarityGuard(max_history_size=2)
+        ctx = Context()
+
+        guard.check("Hello world", ctx)
+        guard.check("hello world!", ctx)
+        guard.check("foo bar baz", ctx)
+
+        result = guard.check("HELLO WORLD.", ctx)
+        self.assertEqual(result.evidence.get("duplicate_type"), "fuzzy")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,8 @@
 """Tests for the ToxicityGuard class."""
 
+import re
 import unittest
+from unittest import mock
 
 from safellm.context import Context
 from safellm.guards.toxicity import ToxicityGuard
@@ -91,6 +93,132 @@ class TestToxicityGuard(unittest.TestCase):
             result = guard.check(case, ctx)
             self.assertIn(result.action, ["allow", "deny"])
 
+    def test_overlapping_matches_reported(self):
+        """Test overlapping matches from different patterns are all reported."""
+        guard = ToxicityGuard(categories=["threats"])
+        ctx = Context()
+
+        result = guard.check("I will kill you", ctx)
+        self.assertEqual(result.action, "deny")
+        self.assertEqual(len(result.evidence["detections"]), 2)
+
+    def test_custom_patterns_do_not_leak(self):
+        """Test custom patterns stay local to the guard that defined them."""
+        ctx = Context()
+        ToxicityGuard(custom_patterns={"harassment": [r"\bnincompoop\b"]})
+
+        result = ToxicityGuard().check("what a nincompoop", ctx)
+        self.assertEqual(result.action, "allow")
+        self.assertEqual(result.evidence["detections"], [])
+
+    def test_default_patterns_compiled_once(self):
+        """Test instances share compiled default patterns but not custom ones."""
+        first = ToxicityGuard()
+        second = ToxicityGuard()
+        custom = ToxicityGuard(custom_patterns={"harassment": [r"\bnincompoop\b"]})
+
+        self.assertIs(first.patterns["threats"][0], second.patterns["threats"][0])
+        self.assertIs(first._prescreen, second._prescreen)
+        self.assertIs(custom.patterns["harassment"][0], first.patterns["harassment"][0])
+        self.assertEqual(len(custom.patterns["harassment"]), len(first.patterns["harassment"]) + 1)
+        self.assertEqual(custom.check("what a nincompoop", Context()).action, "deny")
+
+    def test_pattern_engine_fallback(self):
+        """Test detection without RE2 and with patterns RE2 can't compile."""
+        ctx = Context()
+
+        with (
+            mock.patch("safellm.utils.patterns.re2", None),
+            mock.patch.dict(ToxicityGuard._compiled_defaults, clear=True),
+            mock.patch.dict(ToxicityGuard._compiled_prescreens, clear=True),
+        ):
+            guard = ToxicityGuard(categories=["threats"])
+        self.assertIsInstance(guard.patterns["threats"][0], re.Pattern)
+        self.assertEqual(guard.check("I will kill you", ctx).action, "deny")
+
+        guard = ToxicityGuard(
+            categories=["harassment"], custom_patterns={"harassment": [r"\bclown(?=\s+car)"]}
+        )
+        self.assertEqual(guard.check("you clown car driver", ctx).action, "deny")
+
+    def test_early_exit_keeps_outcome(self):
+        """Test early exit reaches the same decision as a full scan."""
+        ctx = Context()
+        full = ToxicityGuard()
+        fast = ToxicityGuard(early_exit=True)
+
+        for text in ["I will kill you, idiot", "you idiot", "what a lovely day"]:
+            self.assertEqual(full.check(text, ctx).action, fast.check(text, ctx).action)
+
+        result = fast.check("I will kill you, idiot", ctx)
+        self.assertTrue(result.evidence["early_exit"])
+        self.assertNotIn("early_exit", full.check("I will kill you, idiot", ctx).evidence)
+
+    def test_detection_cache(self):
+        """Test repeated inputs reuse cached detections."""
+        guard = ToxicityGuard(cache_size=1)
+        ctx = Context()
+
+        first = guard.check("you idiot", ctx)
+        first.evidence["detections"][0]["match"] = "changed"
+        with mock.patch.object(guard, "_detect_toxicity") as detect:
+            second = guard.check("you idiot", ctx)
+        detect.assert_not_called()
+        self.assertEqual(second.evidence["detections"][0]["match"], "idiot")
+
+        guard.check("another text", ctx)
+        self.assertEqual(list(guard._cache), ["another text"])
+
+        uncached = ToxicityGuard(cache_size=0)
+        uncached.check("you idiot", ctx)
+        self.assertEqual(len(uncached._cache), 0)
+
+    def test_prescreen_skips_benign_text(self):
+        """Test benign text is rejected by the prescreen without category scans."""
+        guard = ToxicityGuard(cache_size=0)
+        ctx = Context()
+
+        self.assertIsNotNone(guard._prescreen)
+        with mock.patch.dict(guard._combined, {c: mock.Mock() for c in guard._combined}):
+            result = guard.check("Thanks for the help today!", ctx)
+            for combined in guard._combined.values():
+                combined.search.assert_not_called()
+        self.assertEqual(result.evidence["detections"], [])
+
+    def test_unicode_separators_detected(self):
+        """Test Unicode and control whitespace between words doesn't hide a threat."""
+        guard = ToxicityGuard(cache_size=0)
+        ctx = Context()
+
+        for text in ["kill\u2003you", "kill\xa0you", "kill\x0byou", "I will kill\x1cyou"]:
+            self.assertEqual(guard.check(text, ctx).action, "deny", repr(text))
+
+    def test_large_input_spans(self):
+        """Test matches in large inputs keep exact offsets, even with long gaps inside."""
+        guard = ToxicityGuard(cache_size=0)
+        ctx = Context()
+        filler = "calm words " * 10000
+        text = filler + "kill" + " " * 500 + "you " + filler + "idiot"
+
+        result = guard.check(text, ctx)
+
+        spans = {
+            d["match"].split()[0]: (d["start"], d["end"]) for d in result.evidence["detections"]
+        }
+        self.assertEqual(spans["kill"], (len(filler), len(filler) + 507))
+        self.assertEqual(spans["idiot"], (len(text) - 5, len(text)))
+
+    def test_severity_score(self):
+        """Test severity averages category weights by match count plus a category bonus."""
+        guard = ToxicityGuard(categories=["threats", "harassment"])
+        ctx = Context()
+
+        result = guard.check("I will kill you, you idiot", ctx)
+
+        # Two threat matches at 1.0 and one harassment match at 0.7
+        self.assertAlmostEqual(result.evidence["severity_score"], (2 * 1.0 + 0.7) / 3 + 0.1)
+        self.assertEqual(guard._calculate_severity(()), 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()